@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRACE_VERSION = 1
+
+# smart_config keys stored in the session header; replays and minimization reuse them
+REPLAY_SETTINGS = ('navigation_guard', 'restore_navigations', 'resource_policy', 'dismiss_popups', 'page_load_wait')
+
+# Stable CSS path for an element, recorded so replays skip element discovery
+CSS_PATH_SCRIPT = """
+var el = arguments[0];
+function isStableId(id) { return id && /^[A-Za-z][\\w-]*$/.test(id) && !/\\d{4,}/.test(id); }
+if (isStableId(el.id) && document.querySelectorAll('#' + el.id).length === 1) return '#' + el.id;
+var parts = [];
+while (el && el.nodeType === 1 && el !== document.documentElement) {
+    var tag = el.tagName.toLowerCase(), idx = 1, sib = el;
+    while ((sib = sib.previousElementSibling)) { if (sib.tagName === el.tagName) idx++; }
+    parts.unshift(tag + ':nth-of-type(' + idx + ')');
+    var parent = el.parentElement;
+    if (parent && isStableId(parent.id) && document.querySelectorAll('#' + parent.id).length === 1) {
+        parts.unshift('#' + parent.id);
+        break;
+    }
+    el = parent;
+}
+return parts.join(' > ');
+"""
+
+
+def derive_seed(seed, url, visit_index=0):
+    """Per-URL seed so each visit's randomness is independent of the others"""
+    key = f"{seed}|{visit_index}|{url}".encode('utf-8')
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+
+class ActionTraceRecorder:
+    """Append-only JSON-lines trace of every action and its inputs"""
+
+    def __init__(self, trace_file, session_id=None, seed=None, settings=None):
+        self.trace_file = trace_file
+        trace_dir = os.path.dirname(trace_file)
+        if trace_dir:
+            os.makedirs(trace_dir, exist_ok=True)
+        self._file = open(trace_file, 'a', encoding='utf-8')
+        self.action_count = 0
+        self._write({
+            'type': 'session',
+            'version': TRACE_VERSION,
+            'session_id': session_id,
+            'seed': seed,
+            'timestamp': datetime.now().isoformat(),
+            **(settings or {})
+        })
+
+    def record_visit(self, url, visit_seed=None):
+        """Mark the start of a URL visit (fresh page load)"""
+        self._write({'type': 'visit', 'url': url, 'seed': visit_seed})
+
+    def record_action(self, url, action_type, params, success, element_info=None, error_signature=None):
+        """Record one action with everything needed to re-execute it"""
+        self.action_count += 1
+        self._write({
+            'type': 'action',
+            'index': self.action_count,
+            'url': url,
+            'action_type': action_type,
+            'params': params or {},
+            'success': success,
+            'element_info': element_info,
+            'error_signature': error_signature
+        })
+
+    def offset(self):
+        """Byte offset of the trace, stored in checkpoints"""
+        return self._file.tell()
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        # Flush per line so a crashed run still leaves a usable trace
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def load_trace(trace_file):
+    """Read a trace into [{'url', 'seed', 'actions': [...]}] visits"""
+    visits = []
+    session = {}
+    with open(trace_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry['type'] == 'session':
+                session = entry
+            elif entry['type'] == 'visit':
+                visits.append({'url': entry['url'], 'seed': entry.get('seed'), 'actions': []})
+            elif entry['type'] == 'action':
+                if not visits or visits[-1]['url'] != entry['url']:
+                    visits.append({'url': entry['url'], 'seed': None, 'actions': []})
+                visits[-1]['actions'].append(entry)
+    return session, visits
+
+
+def replay_settings(session):
+    """The recorded run's REPLAY_SETTINGS found in a trace session header"""
+    return {key: session[key] for key in REPLAY_SETTINGS if key in session}
+
+
+class ActionReplayer:
+    """Re-executes a recorded trace without pacing delays or element discovery"""
+
+    def __init__(self, load_page, monkey_tester):
+        # load_page(url) performs the navigation (and any post-load hooks)
+        self.load_page = load_page
+        self.monkey_tester = monkey_tester
+
+    def replay_visit(self, visit, actions=None):
+        """Replay one visit from a fresh page load, return per-action outcomes"""
+        self.load_page(visit['url'])
+        self.monkey_tester.initialize_page_object(visit['url'])
+
+        outcomes = []
+        for action in (visit['actions'] if actions is None else actions):
+            outcomes.append(self.monkey_tester.replay_action(
+                action['action_type'], action['params'], visit['url']))
+        return outcomes
+
+    def replay(self, visits):
+        """Replay all visits and summarize the outcomes"""
+        start = time.time()
+        outcomes = []
+        for visit in visits:
+            try:
+                outcomes.extend(self.replay_visit(visit))
+            except Exception as e:
+                logger.error(f"Replay of {visit['url']} aborted: {e}")
+
+        return {
+            'visits': len(visits),
+            'actions': len(outcomes),
+            'failed': len([o for o in outcomes if not o]),
+            'duration_seconds': round(time.time() - start, 2)
+        }
\ No newline at end of file
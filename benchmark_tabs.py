@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tab multiplexing benchmark: K tabs in one browser vs K separate browsers
+Runs the same fixture-page visits both ways and compares actions/sec and peak browser RSS
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+from fixture_server import FixtureServer
+from regression_test_suite import RegressionTestSuite
+
+
+def _make_suite(label, tabs, actions, interval):
+    suite = RegressionTestSuite(seed=1234)
+    suite.session_id = f"{suite.session_id}_bench_{label}"
+    suite.smart_config.update({
+        'tabs': tabs,
+        'max_actions_per_url': actions,
+        'preflight': False,
+        'record_trace': False,
+        'watchdog_interval': interval,
+        # Recycling would distort both the throughput and the memory curve
+        'recycle_max_rss_mb': 0,
+        'recycle_max_actions': 0,
+        'recycle_latency_drift': 0
+    })
+    return suite
+
+
+def _visit_urls(server, visits):
+    """Distinct URLs over the fixture pages that load quickly"""
+    pages = server.urls(include_broken=False)
+    return [f"{pages[i % len(pages)]}?visit={i}" for i in range(visits)]
+
+
+class _CombinedRssSampler:
+    """Peak of the summed process-tree RSS of several watchdogs"""
+
+    def __init__(self, watchdogs, interval):
+        self.watchdogs = watchdogs
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, sum(w.latest_rss_mb for w in self.watchdogs if w))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_tabs(urls, tabs, actions, interval):
+    suite = _make_suite('tabs', tabs, actions, interval)
+    suite.setup(headless=True)
+    try:
+        suite.test_urls = urls
+        start = time.time()
+        with _CombinedRssSampler([suite.watchdog], interval / 2) as sampler:
+            suite._run_multiplexed()
+        wall = time.time() - start
+        return _result(f"{tabs} tabs / 1 browser", suite.logger.get_stats()['total_actions'], wall, sampler.peak_mb)
+    finally:
+        suite.cleanup()
+
+
+def run_browsers(urls, browsers, actions, interval):
+    suites = [_make_suite(f"b{i}", 1, actions, interval) for i in range(browsers)]
+    for suite in suites:
+        suite.setup(headless=True)
+
+    def worker(suite, share):
+        for url in share:
+            suite.visit_index += 1
+            suite._test_url(url, suite.visit_index, max_actions=actions)
+
+    threads = [threading.Thread(target=worker, args=(suite, urls[i::browsers]))
+               for i, suite in enumerate(suites)]
+    try:
+        start = time.time()
+        with _CombinedRssSampler([suite.watchdog for suite in suites], interval / 2) as sampler:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        wall = time.time() - start
+        total_actions = sum(suite.logger.get_stats()['total_actions'] for suite in suites)
+        return _result(f"{browsers} browsers", total_actions, wall, sampler.peak_mb)
+    finally:
+        for suite in suites:
+            suite.cleanup()
+
+
+def _result(mode, actions, wall, peak_rss_mb):
+    actions_per_second = actions / wall if wall else 0.0
+    return {
+        'mode': mode,
+        'actions': actions,
+        'wall_seconds': round(wall, 2),
+        'actions_per_second': round(actions_per_second, 2),
+        'peak_rss_mb': round(peak_rss_mb, 1),
+        'actions_per_second_per_gb': round(actions_per_second / (peak_rss_mb / 1024), 2) if peak_rss_mb else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare K tabs in one browser against K browsers")
+    parser.add_argument("--tabs", type=int, default=4, help="Tabs (and browsers) to compare (default: 4)")
+    parser.add_argument("--visits", type=int, default=16, help="URL visits per mode (default: 16)")
+    parser.add_argument("--actions", type=int, default=5, help="Actions per visit (default: 5)")
+    parser.add_argument("--interval", type=float, default=0.5, help="RSS sampling interval in seconds")
+    parser.add_argument("--output", default="reports/benchmarks/tab_multiplexing.json")
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        urls = _visit_urls(server, args.visits)
+        results = [run_tabs(urls, args.tabs, args.actions, args.interval),
+                   run_browsers(urls, args.tabs, args.actions, args.interval)]
+
+    print(f"\n{'Mode':<22}{'Actions':>9}{'Wall s':>9}{'Act/s':>8}{'Peak MB':>10}{'Act/s/GB':>10}")
+    for r in results:
+        print(f"{r['mode']:<22}{r['actions']:>9}{r['wall_seconds']:>9}{r['actions_per_second']:>8}"
+              f"{r['peak_rss_mb']:>10}{str(r['actions_per_second_per_gb']):>10}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'tabs': args.tabs, 'visits': args.visits, 'actions_per_visit': args.actions,
+                   'results': results}, f, indent=2)
+    print(f"\n📄 Benchmark written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Wait backend benchmark: event-driven waits vs WebDriverWait-style polling
+Runs the same load/settle/find sequence over the fixture pages with both backends and
+compares time spent waiting and WebDriver commands issued by the waits
+"""
+
+import argparse
+import json
+import os
+
+from selenium.webdriver.common.by import By
+
+from driver_factory import create_chrome_driver
+from event_waits import EventWaiter
+from fixture_server import FixtureServer
+
+# (locator, timeout) waited for on every page; the late button only exists on /late
+WAIT_PLAN = [
+    ((By.TAG_NAME, 'h1'), 5),
+    ((By.CSS_SELECTOR, 'button, a'), 5),
+    ((By.ID, 'late'), 2),
+]
+
+
+def run_backend(driver, urls, backend, rounds, page_load_wait):
+    waiter = EventWaiter(driver, backend)
+    for _ in range(rounds):
+        for url in urls:
+            driver.get(url)
+            waiter.settle(page_load_wait)
+            for locator, timeout in WAIT_PLAN:
+                if locator[1] == 'late' and not url.endswith('/late'):
+                    continue
+                waiter.find_elements(locator, timeout)
+            # A click that changes the DOM, followed by the post-action settle
+            buttons = driver.find_elements(By.TAG_NAME, 'button')
+            if buttons:
+                driver.execute_script("arguments[0].click();", buttons[0])
+                waiter.settle(1)
+    return waiter.summary()
+
+
+def _totals(summary):
+    waits = summary['events']['waits'] + summary['polling']['waits']
+    seconds = summary['events']['seconds'] + summary['polling']['seconds']
+    commands = summary['events']['commands'] + summary['polling']['commands']
+    return waits, round(seconds, 2), commands
+
+
+def _reduction(before, after):
+    return round((1 - after / before) * 100, 1) if before else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare event-driven and polling waits on the fixture pages")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the fixture pages (default: 3)")
+    parser.add_argument("--page-load-wait", type=float, default=2, help="Settle cap after each load (default: 2)")
+    parser.add_argument("--visible", action="store_true", help="Run with a visible browser")
+    parser.add_argument("--output", default="reports/benchmarks/event_waits.json")
+    args = parser.parse_args()
+
+    results = {}
+    with FixtureServer() as server:
+        urls = server.urls(include_broken=False)
+        driver = create_chrome_driver(headless=not args.visible)
+        try:
+            for backend in ('polling', 'events'):
+                results[backend] = run_backend(driver, urls, backend, args.rounds, args.page_load_wait)
+        finally:
+            driver.quit()
+
+    polling, events = _totals(results['polling']), _totals(results['events'])
+    print(f"\n{'Backend':<10}{'Waits':>8}{'Wait s':>10}{'Commands':>10}")
+    for backend, (waits, seconds, commands) in (('polling', polling), ('events', events)):
+        print(f"{backend:<10}{waits:>8}{seconds:>10}{commands:>10}")
+    comparison = {
+        'wait_time_reduction_percent': _reduction(polling[1], events[1]),
+        'command_reduction_percent': _reduction(polling[2], events[2])
+    }
+    print(f"\n⏲️  Wait time: -{comparison['wait_time_reduction_percent']}%  |  "
+          f"WebDriver commands: -{comparison['command_reduction_percent']}%")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'rounds': args.rounds, 'pages': len(urls), 'results': results, 'comparison': comparison},
+                  f, indent=2)
+    print(f"📄 Benchmark written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import threading
+import time
+import logging
+
+from error_signatures import error_signature
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SCRIPT = "return document.readyState;"
+
+# Failures after which the browser itself may be gone, so a heartbeat is worth its round trip
+HEALTH_CHECK_SIGNATURES = {'session-lost', 'tab-crashed', 'timeout', 'page-load-timeout'}
+FATAL_SIGNATURES = {'session-lost', 'tab-crashed'}
+
+
+class BrowserHealthMonitor:
+    """Heartbeat with a hard timeout that tells dead sessions, crashed tabs and hung renderers apart"""
+
+    def __init__(self, heartbeat_timeout=5, max_restarts=10):
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_restarts = max_restarts
+        self.stats = {'heartbeats': 0, 'unhealthy': 0, 'restarts': 0}
+
+    def should_check(self, signature):
+        """Only failures that could mean a dead browser trigger a heartbeat"""
+        if not signature:
+            return False
+        return signature in HEALTH_CHECK_SIGNATURES or signature.startswith('unclassified')
+
+    def heartbeat(self, driver):
+        """None when healthy, otherwise 'session-lost', 'tab-crashed' or 'hung-renderer'"""
+        self.stats['heartbeats'] += 1
+        outcome = {}
+
+        def ping():
+            try:
+                outcome['state'] = driver.execute_script(HEARTBEAT_SCRIPT)
+            except Exception as e:
+                outcome['error'] = str(e)
+
+        # A daemon thread per beat: a hung renderer can block the command far longer than we wait
+        thread = threading.Thread(target=ping, name='browser-heartbeat', daemon=True)
+        start = time.time()
+        thread.start()
+        thread.join(self.heartbeat_timeout)
+
+        if thread.is_alive():
+            reason = 'hung-renderer'
+        elif 'error' in outcome:
+            signature = error_signature(outcome['error'])
+            reason = signature if signature in FATAL_SIGNATURES else None
+        else:
+            reason = None
+
+        if reason:
+            self.stats['unhealthy'] += 1
+            logger.warning(f"Browser heartbeat failed after {time.time() - start:.1f}s: {reason}")
+        return reason
+
+    def can_restart(self):
+        return self.stats['restarts'] < self.max_restarts
+
+    def quit_quietly(self, driver):
+        """Quit a possibly dead driver without letting a hang block the run"""
+        thread = threading.Thread(target=self._quit, args=(driver,), name='browser-quit', daemon=True)
+        thread.start()
+        thread.join(self.heartbeat_timeout)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
\ No newline at end of file
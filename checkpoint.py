@@ -0,0 +1,65 @@
+import json
+import os
+import time
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(session_id):
+    return f"logs/{session_id}/checkpoint.json"
+
+
+def encode_rng_state(state):
+    """random.Random.getstate() as JSON-safe lists"""
+    version, internal, gauss = state
+    return [version, list(internal), gauss]
+
+
+def decode_rng_state(state):
+    version, internal, gauss = state
+    return version, tuple(internal), gauss
+
+
+def truncate_file(path, offset):
+    """Drop anything written after a checkpoint (e.g. a visit that was cut short)"""
+    if offset is not None and os.path.exists(path) and os.path.getsize(path) > offset:
+        with open(path, 'r+b') as f:
+            f.truncate(offset)
+
+
+class CheckpointManager:
+    """Periodically and atomically writes the run position so a killed run can continue"""
+
+    def __init__(self, session_id, interval_seconds=30):
+        self.path = checkpoint_path(session_id)
+        self.interval_seconds = interval_seconds
+        self.last_saved = 0.0
+        self.saves = 0
+
+    def due(self):
+        return time.time() - self.last_saved >= self.interval_seconds
+
+    def save(self, state):
+        """Write to a temp file and rename, so a crash mid-write never corrupts the checkpoint"""
+        state = {'version': CHECKPOINT_VERSION, 'saved_at': datetime.now().isoformat(), **state}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.last_saved = time.time()
+        self.saves += 1
+        logger.debug(f"Checkpoint saved: {self.path}")
+
+    @staticmethod
+    def load(session_id):
+        path = checkpoint_path(session_id)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No checkpoint for session {session_id} ({path})")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
\ No newline at end of file
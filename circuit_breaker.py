@@ -0,0 +1,65 @@
+import time
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Failures that say the host or browser is broken, not that one element misbehaved
+DRIVER_FAILURE_SIGNATURES = {'page-load-timeout', 'timeout', 'network-error', 'session-lost', 'tab-crashed'}
+
+
+class HostCircuitBreaker:
+    """Stops sending work to a host after N consecutive load or driver failures"""
+
+    def __init__(self, threshold=3, cooldown_seconds=None):
+        self.threshold = threshold
+        # None keeps a tripped host closed off for the rest of the run
+        self.cooldown_seconds = cooldown_seconds
+        self.hosts = {}
+
+    @staticmethod
+    def host_for(url):
+        return urlparse(url).netloc or url
+
+    def _state(self, url):
+        return self.hosts.setdefault(self.host_for(url), {
+            'consecutive_failures': 0,
+            'total_failures': 0,
+            'opened_at': None,
+            'reason': None
+        })
+
+    def allow(self, url):
+        """False while the host's circuit is open"""
+        state = self._state(url)
+        if state['opened_at'] is None:
+            return True
+        if self.cooldown_seconds is not None and time.time() - state['opened_at'] >= self.cooldown_seconds:
+            # Half-open: let one visit through, the next failure re-opens immediately
+            state['opened_at'] = None
+            state['consecutive_failures'] = self.threshold - 1
+            return True
+        return False
+
+    def record_success(self, url):
+        self._state(url)['consecutive_failures'] = 0
+
+    def record_failure(self, url, reason):
+        """Count a failure; returns True if this one opened the circuit"""
+        state = self._state(url)
+        state['consecutive_failures'] += 1
+        state['total_failures'] += 1
+        if state['opened_at'] is None and state['consecutive_failures'] >= self.threshold:
+            self.trip(url, reason)
+            return True
+        return False
+
+    def trip(self, url, reason):
+        """Open the circuit for the URL's host right away"""
+        state = self._state(url)
+        state['opened_at'] = time.time()
+        state['reason'] = reason
+        logger.warning(f"Circuit open for {self.host_for(url)}: {reason}")
+
+    def open_hosts(self):
+        return {host: state['reason'] for host, state in self.hosts.items() if state['opened_at'] is not None}
\ No newline at end of file
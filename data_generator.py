@@ -0,0 +1,151 @@
+import random
+import re
+import logging
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+CORPUS_SIZE = 64  # Generated values per field class; hand-written edge cases come on top
+MAX_CACHED_FIELDS = 5000
+
+FIELD_CLASSES = ('email', 'password', 'number', 'url', 'search', 'text')
+HOSTILE_CLASSES = ('unicode', 'long', 'injection', 'boundary')
+
+# Which hostile corpora make sense for a field: numbers get boundary values, everything else strings
+HOSTILE_FOR = {
+    'number': ('boundary',),
+    'email': ('unicode', 'long', 'injection'),
+    'password': ('unicode', 'long', 'injection'),
+    'url': ('long', 'injection'),
+    'search': ('unicode', 'long', 'injection'),
+    'text': ('unicode', 'long', 'injection'),
+}
+
+# Whole-word name/id/placeholder/autocomplete hints, checked after the input type
+FIELD_HINTS = [
+    ('email', ('email', 'mail')),
+    ('password', ('password', 'passwd', 'pass')),
+    ('url', ('url', 'website', 'homepage', 'link')),
+    ('search', ('search', 'query', 'keyword', 'find')),
+    ('number', ('qty', 'quantity', 'amount', 'zip', 'postal', 'phone', 'price', 'number')),
+]
+TYPE_CLASSES = {'email': 'email', 'password': 'password', 'number': 'number', 'range': 'number',
+                'tel': 'number', 'url': 'url', 'search': 'search'}
+
+_CAMEL_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+_TOKEN_SEPARATORS = re.compile(r'[^a-zA-Z0-9]+')
+
+UNICODE_STRINGS = [
+    "Zoë Ångström", "Søren Kierkegaard", "日本語のテキスト", "中文测试", "한국어 입력", "مرحبا بالعالم",
+    "שלום עולם", "Привет, мир", "🐒🙈🙉🙊", "👩\u200d👩\u200d👧 family", "e\u0301le\u0300ve", "zero\u200bwidth",
+    "\u202eRTL override", "Ⅻ ⅷ ½ ²", "𝕋𝕖𝕤𝕥", "non\u00a0breaking\u00a0space", "tab\tinside", "  padded  ",
+]
+
+INJECTION_STRINGS = [
+    "' OR '1'='1", "admin'--", "\"; DROP TABLE users; --", "1; SELECT pg_sleep(0)",
+    "<script>console.log('qa-monkey')</script>", "\"><img src=x onerror=console.log('qa-monkey')>",
+    "javascript:void(0)", "{{7*7}}", "${7*7}", "<%= 7*7 %>", "../../../../etc/passwd", "%00", "%0d%0aX-Test: 1",
+    "; ls -la", "| whoami", "`id`", "{\"$gt\": \"\"}", "<!--", "]]>", "\\", "null", "undefined",
+]
+
+BOUNDARY_NUMBERS = [
+    "0", "-0", "-1", "1", "0.1", "-0.000001", "00012", "1,000", "1e3", "127", "128", "255", "256", "-129",
+    "32767", "32768", "65535", "65536", "2147483647", "2147483648", "-2147483648", "-2147483649",
+    "4294967296", "9007199254740991", "9007199254740993", "1e308", "1e309", "-1e309", "NaN", "Infinity",
+]
+
+LONG_LENGTHS = [64, 255, 256, 1024, 4096]
+
+SEARCH_TERMS = ["automation", "testing", "selenium", "python", "QA", "selenium testing", "web scraping",
+                "QA testing", "monkey testing", "regression", "page object", "headless chrome"]
+FIRST_NAMES = ["Test", "Sample", "Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey"]
+WORDS = ["quick", "sample", "input", "monkey", "automation", "value", "data", "check", "form", "field"]
+DOMAINS = ["example.com", "example.org", "test.example", "mail.example.net"]
+
+
+def _build_corpora(rng):
+    """Every corpus, generated once up front so drawing a value is a single list index"""
+    corpora = {
+        'email': [f"{rng.choice(FIRST_NAMES).lower()}{rng.randint(1, 9999)}@{rng.choice(DOMAINS)}"
+                  for _ in range(CORPUS_SIZE)],
+        'password': [f"{rng.choice(WORDS).capitalize()}{rng.randint(100, 9999)}{rng.choice('!@#$%&*')}"
+                     for _ in range(CORPUS_SIZE)],
+        'number': [str(rng.randint(1, 100)) for _ in range(CORPUS_SIZE)],
+        'url': [f"https://{rng.choice(DOMAINS)}/{rng.choice(WORDS)}?id={rng.randint(1, 999)}"
+                for _ in range(CORPUS_SIZE)],
+        'search': list(SEARCH_TERMS),
+        'text': [f"{rng.choice(FIRST_NAMES)} {rng.choice(WORDS)} {rng.randint(1, 999)}" for _ in range(CORPUS_SIZE)],
+        'unicode': list(UNICODE_STRINGS),
+        'injection': list(INJECTION_STRINGS),
+        'boundary': list(BOUNDARY_NUMBERS),
+    }
+    corpora['email'] += ["a@b.co", "qa+monkey@example.com", "first.last@sub.example.co.uk"]
+    corpora['password'] += ["password", "P@ssw0rd!", "x"]
+    corpora['long'] = [((rng.choice(WORDS) + " ") * length)[:length] for length in LONG_LENGTHS]
+    corpora['long'] += ["A" * length for length in LONG_LENGTHS]
+    return corpora
+
+
+def hint_tokens(info):
+    """Words of the name, id, placeholder and autocomplete: 'user_email' and 'userEmail' give 'user', 'email'"""
+    text = " ".join(str(info.get(key) or '') for key in ('name', 'id', 'placeholder', 'autocomplete'))
+    return set(_TOKEN_SEPARATORS.split(_CAMEL_BOUNDARY.sub(r'\1 \2', text).lower())) - {''}
+
+
+def classify_field(info):
+    """Field class for an input from its discovery descriptor (type, name, id, placeholder, autocomplete)"""
+    field_type = (info.get('type') or '').lower()
+    if field_type in TYPE_CLASSES:
+        return TYPE_CLASSES[field_type]
+    if (info.get('name') or '').lower() == 'q':
+        return 'search'
+    # Whole words only, so 'passenger', 'compass' and 'findings' stay plain text
+    tokens = hint_tokens(info)
+    for field_class, keywords in FIELD_HINTS:
+        if tokens.intersection(keywords):
+            return field_class
+    return 'text'
+
+
+class DataGenerator:
+    """Seedable, precomputed input corpora per field class, optionally mixed with boundary and malicious values"""
+
+    def __init__(self, seed=None, hostile_rate=0.0):
+        self.seed = seed
+        self.hostile_rate = hostile_rate
+        self.corpora = _build_corpora(random.Random(seed))
+        self.field_cache = {}  # (host, field identity) -> field class
+        self.stats = {name: 0 for name in FIELD_CLASSES + HOSTILE_CLASSES}
+        self.stats['cache_hits'] = 0
+
+    def field_class(self, info, url=None):
+        """Cached classification: the same field on the same host is only inspected once"""
+        key = (urlparse(url or '').netloc, info.get('tag'), info.get('id'), info.get('name'), info.get('type'),
+               info.get('placeholder'))
+        field_class = self.field_cache.get(key)
+        if field_class is not None:
+            self.stats['cache_hits'] += 1
+            return field_class
+        if len(self.field_cache) >= MAX_CACHED_FIELDS:
+            self.field_cache.clear()
+        field_class = self.field_cache[key] = classify_field(info)
+        return field_class
+
+    def value(self, field_class, rng, hostile=True):
+        """One value for the field class; with hostile_rate probability a boundary/unicode/long/injection one"""
+        corpus = field_class
+        if hostile and rng.random() < self.hostile_rate:
+            corpus = rng.choice(HOSTILE_FOR.get(field_class, HOSTILE_FOR['text']))
+        self.stats[corpus] += 1
+        return rng.choice(self.corpora[corpus])
+
+    def for_field(self, info, rng, url=None):
+        """Value for a discovered input"""
+        return self.value(self.field_class(info, url), rng)
+
+    def credentials(self, rng):
+        """(username, password) for login forms"""
+        return self.value('email', rng), self.value('password', rng)
+
+    def search_query(self, rng):
+        return self.value('search', rng)
\ No newline at end of file
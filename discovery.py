@@ -0,0 +1,212 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+NODE_BUDGET = 8000  # Elements visited per traversal before giving up on the rest of a huge DOM
+MAX_RESULTS = 200  # Candidates kept per kind, nearest to the viewport first
+
+CLICKABLE_SELECTOR = "button, a, input[type='submit'], input[type='button'], [onclick], .btn, [role='button']"
+INPUT_SELECTOR = ("input[type='text'], input[type='email'], input[type='search'], input[type='password'], "
+                  "textarea, input:not([type])")
+
+# One pass over the light DOM, open shadow roots and same-origin iframes. Every candidate gets
+# an address (iframe paths + element path, 's' stepping into a shadow root) so elements inside
+# frames can be re-resolved after switching; top-document elements come back as handles directly.
+DISCOVERY_SCRIPT = """
+var nodeBudget = arguments[0], maxResults = arguments[1], clickableSel = arguments[2], inputSel = arguments[3];
+var vw = window.innerWidth, vh = window.innerHeight;
+var found = {clickable: [], inputs: []}, visited = 0, truncated = false;
+var stack = [[document.documentElement, [], [], 0, 0, 'document']];
+
+function interactivity(node) {
+    var tag = node.tagName;
+    if (tag === 'BUTTON' || tag === 'INPUT' || tag === 'TEXTAREA') return 1.0;
+    if (tag === 'A') return node.hasAttribute('href') ? 0.9 : 0.4;
+    if (node.getAttribute('role') === 'button') return 0.8;
+    return node.hasAttribute('onclick') ? 0.7 : 0.5;
+}
+
+function hitTest(node, rect) {
+    // Is the element's centre actually the topmost thing there, or covered by something else?
+    var root = node.getRootNode(), view = node.ownerDocument.defaultView;
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    if (!root.elementFromPoint || x < 0 || y < 0 || x >= view.innerWidth || y >= view.innerHeight) return null;
+    var hit = root.elementFromPoint(x, y);
+    return !!hit && (hit === node || node.contains(hit));
+}
+
+function describe(node, entry, rect) {
+    var top = rect.top + entry[4], bottom = rect.bottom + entry[4];
+    var left = rect.left + entry[3], right = rect.right + entry[3];
+    var inView = bottom > 0 && top < vh && right > 0 && left < vw;
+    var cls = node.className && node.className.baseVal !== undefined ? node.className.baseVal : node.className;
+    return {
+        in_view: inView, hit: inView ? hitTest(node, rect) : null, area: Math.round(rect.width * rect.height),
+        interactive: interactivity(node),
+        element: entry[1].length ? null : node, frames: entry[1], path: entry[2], context: entry[5],
+        tag: node.tagName.toLowerCase(), id: node.id || '', cls: String(cls || ''),
+        text: (node.innerText || node.value || '').trim().slice(0, 20),
+        type: node.getAttribute('type'), name: node.getAttribute('name'),
+        placeholder: node.getAttribute('placeholder'), autocomplete: node.getAttribute('autocomplete'),
+        distance: inView ? 0 : Math.max(top - vh, -bottom, left - vw, -right, 0) + 1
+    };
+}
+
+function usable(node) {
+    if (node.disabled) return null;
+    var rect = node.getBoundingClientRect();
+    if (!rect.width || !rect.height) return null;
+    var style = getComputedStyle(node);
+    return style.visibility === 'hidden' || style.display === 'none' ? null : rect;
+}
+
+while (stack.length) {
+    var entry = stack.pop(), node = entry[0];
+    if (++visited > nodeBudget) { truncated = true; break; }
+    var kind = node.matches(clickableSel) ? 'clickable' : node.matches(inputSel) ? 'inputs' : null;
+    if (kind) {
+        var rect = usable(node);
+        if (rect) found[kind].push(describe(node, entry, rect));
+    }
+    var children = node.children, i;
+    for (i = children.length - 1; i >= 0; i--) {
+        stack.push([children[i], entry[1], entry[2].concat(i), entry[3], entry[4], entry[5]]);
+    }
+    if (node.shadowRoot) {
+        var shadowChildren = node.shadowRoot.children;
+        for (i = shadowChildren.length - 1; i >= 0; i--) {
+            stack.push([shadowChildren[i], entry[1], entry[2].concat('s', i), entry[3], entry[4],
+                        entry[5] === 'document' ? 'shadow' : entry[5]]);
+        }
+    }
+    if (node.tagName === 'IFRAME' || node.tagName === 'FRAME') {
+        try {
+            var doc = node.contentDocument;  // null (or throws) for cross-origin frames
+            if (doc && doc.documentElement) {
+                var frameRect = node.getBoundingClientRect();
+                stack.push([doc.documentElement, entry[1].concat([entry[2]]), [],
+                            entry[3] + frameRect.left, entry[4] + frameRect.top, 'iframe']);
+            }
+        } catch (e) {}
+    }
+}
+
+['clickable', 'inputs'].forEach(function (kind) {
+    found[kind].sort(function (a, b) { return a.distance - b.distance; });
+    found[kind] = found[kind].slice(0, maxResults);
+});
+found.visited = visited;
+found.truncated = truncated;
+return found;
+"""
+
+# Element at an address path within the current document
+RESOLVE_SCRIPT = """
+var node = document.documentElement, path = arguments[0];
+for (var i = 0; i < path.length && node; i++) {
+    node = path[i] === 's' ? node.shadowRoot : node.children[path[i]];
+}
+return node || null;
+"""
+
+
+class DiscoveredElement:
+    """A discovered element plus the iframe chain needed to act on it"""
+
+    def __init__(self, driver, element=None, frames=None, path=None, info=None):
+        self.driver = driver
+        self.element = element
+        self.frames = frames or []
+        self.path = path or []
+        self.info = info or {}
+        self._switched = False
+
+    @classmethod
+    def from_address(cls, driver, address):
+        """Rebuild from the address recorded in a trace"""
+        return cls(driver, frames=address.get('frames'), path=address.get('path'))
+
+    @property
+    def context(self):
+        return self.info.get('context', 'document')
+
+    def address(self):
+        """Trace parameters needed to find this element again; empty for plain top-document elements"""
+        if self.context == 'document':
+            return {}
+        return {'target': {'frames': self.frames, 'path': self.path}}
+
+    def activate(self):
+        """Switch into the element's frame (if any) and return a usable WebElement"""
+        if self.frames:
+            self.driver.switch_to.default_content()
+            self._switched = True
+            for frame_path in self.frames:
+                frame = self.driver.execute_script(RESOLVE_SCRIPT, frame_path)
+                if frame is None:
+                    raise LookupError(f"Frame at {frame_path} is gone")
+                self.driver.switch_to.frame(frame)
+        if self.element is None:
+            self.element = self.driver.execute_script(RESOLVE_SCRIPT, self.path)
+            if self.element is None:
+                raise LookupError(f"Element at {self.path} is gone")
+        return self.element
+
+    def release(self):
+        """Back to the top-level document after acting inside a frame"""
+        if self._switched:
+            self._switched = False
+            try:
+                self.driver.switch_to.default_content()
+            except Exception as e:
+                logger.debug(f"Could not leave frame: {e}")
+
+    def attribute(self, name):
+        """Attribute captured during discovery, fetched from the element otherwise"""
+        if name in self.info:
+            return self.info[name]
+        return self.activate().get_attribute(name)
+
+    def describe(self):
+        """Descriptive element info without extra WebDriver round trips"""
+        if not self.info:
+            return None
+        parts = [f"<{self.info['tag']}"]
+        if self.info.get('id'):
+            parts.append(f" id='{self.info['id']}'")
+        if self.info.get('cls'):
+            parts.append(f" class='{self.info['cls'][:20]}'")
+        parts.append(">")
+        if self.info.get('text'):
+            parts.append(f" '{self.info['text']}'")
+        if self.context != 'document':
+            parts.append(f" (in {'iframe' if self.context == 'iframe' else 'shadow DOM'})")
+        return "".join(parts)
+
+
+class DomDiscovery:
+    """Finds clickable and input elements across shadow roots and same-origin iframes in one script"""
+
+    def __init__(self, driver, node_budget=NODE_BUDGET, max_results=MAX_RESULTS):
+        self.driver = driver
+        self.node_budget = node_budget
+        self.max_results = max_results
+        self.last_visited = 0
+        self.last_truncated = False
+
+    def discover(self):
+        """{'clickable': [...], 'inputs': [...]} as DiscoveredElements, nearest to the viewport first"""
+        result = self.driver.execute_script(DISCOVERY_SCRIPT, self.node_budget, self.max_results,
+                                            CLICKABLE_SELECTOR, INPUT_SELECTOR) or {}
+        self.last_visited = result.get('visited', 0)
+        self.last_truncated = result.get('truncated', False)
+        if self.last_truncated:
+            logger.debug(f"Discovery stopped at the {self.node_budget}-node budget")
+
+        discovered = {}
+        for kind in ('clickable', 'inputs'):
+            discovered[kind] = [
+                DiscoveredElement(self.driver, item.pop('element'), item.pop('frames'), item.pop('path'), item)
+                for item in result.get(kind, [])
+            ]
+        return discovered
\ No newline at end of file
@@ -0,0 +1,77 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+import logging
+
+from js_error_oracle import JSErrorCollector
+
+logger = logging.getLogger(__name__)
+
+PAGE_LOAD_TIMEOUT = 15  # Reduced from 30 for speed
+IMPLICIT_WAIT = 5  # Reduced from 10 for speed
+
+
+def build_chrome_options(headless=True, remote_debugging_port=9222, resource_policy=None,
+                         capture_browser_log=False, page_load_strategy=None):
+    """Chrome options shared by the suite and any extra browser sessions"""
+    options = Options()
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--allow-running-insecure-content")
+    # A fixed debugging port only works for a single browser per machine
+    if remote_debugging_port:
+        options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
+    
+    if headless:
+        options.add_argument("--headless")
+    
+    # Resource blocking may switch the page load strategy to 'eager'
+    if resource_policy:
+        resource_policy.configure_options(options)
+    if capture_browser_log:
+        JSErrorCollector.configure_options(options)
+    # An explicit strategy wins ('none' lets scripts run in a tab while another one loads)
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    
+    return options
+
+
+def create_chrome_driver(headless=True, remote_debugging_port=9222, resource_policy=None,
+                         capture_browser_log=False, page_load_strategy=None):
+    """Start Chrome via WebDriver Manager, falling back to the system ChromeDriver"""
+    options = build_chrome_options(headless, remote_debugging_port, resource_policy, capture_browser_log,
+                                   page_load_strategy)
+    
+    try:
+        # Try to use WebDriver Manager with latest version
+        from webdriver_manager.chrome import ChromeDriverManager
+        from selenium.webdriver.chrome.service import Service
+        
+        # Clear cache and get latest ChromeDriver
+        service = Service(ChromeDriverManager(cache_valid_range=1).install())
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception as e:
+        print(f"WebDriver Manager failed: {e}")
+        print("Trying with system ChromeDriver...")
+        try:
+            # Fallback to system ChromeDriver
+            driver = webdriver.Chrome(options=options)
+        except Exception as e2:
+            print(f"System ChromeDriver also failed: {e2}")
+            print("\nPLEASE FIX CHROMEDRIVER:")
+            print("1. Update Chrome browser to latest version")
+            print("2. Run: pip install --upgrade webdriver-manager")
+            print("3. Or download matching ChromeDriver manually")
+            raise e2
+    
+    driver.maximize_window()
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    
+    if resource_policy and resource_policy.active:
+        resource_policy.apply(driver)
+    
+    return driver
\ No newline at end of file
@@ -0,0 +1,182 @@
+import hashlib
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Ordered rules - first match wins, so specific causes go before generic ones
+SIGNATURE_RULES = [
+    ('intercepted-click-by-overlay', r'click intercepted|ElementClickInterceptedException|other element would receive the click'),
+    ('stale-element', r'stale element|StaleElementReferenceException'),
+    ('element-not-interactable', r'not interactable|ElementNotInteractableException|ElementNotVisibleException'),
+    ('move-target-out-of-bounds', r'move target out of bounds|MoveTargetOutOfBoundsException'),
+    ('invalid-element-state', r'invalid element state|InvalidElementStateException'),
+    ('unexpected-alert', r'unexpected alert|UnexpectedAlertPresentException'),
+    ('tab-crashed', r'tab crashed|renderer.*crash'),
+    ('session-lost', r'invalid session id|chrome not reachable|no such window|target window already closed|disconnected'),
+    ('no-such-element', r'no such element|NoSuchElementException|unable to locate element'),
+    ('no-elements-found', r'No \w+ elements found'),
+    ('page-load-timeout', r'timeout: Timed out receiving message from renderer|page load timeout'),
+    ('timeout', r'TimeoutException|timed out|timeout'),
+    ('network-error', r'net::ERR_\w+|Connection refused|Max retries exceeded|Name or service not known'),
+    ('javascript-error', r'javascript error|JavascriptException'),
+]
+
+_COMPILED_RULES = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in SIGNATURE_RULES]
+
+# Volatile fragments stripped before hashing unclassified messages
+_VOLATILE_PATTERNS = [
+    (re.compile(r'\(Session info:.*?\)', re.IGNORECASE), ''),
+    (re.compile(r'\b[0-9a-f]{32}\b', re.IGNORECASE), '<id>'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.IGNORECASE), '<id>'),
+    (re.compile(r'https?://\S+'), '<url>'),
+    (re.compile(r'\(\s*-?\d+(\.\d+)?\s*,\s*-?\d+(\.\d+)?\s*\)'), '(<x>, <y>)'),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), '<str>'),
+    (re.compile(r'\d+(\.\d+)?'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+MAX_SCAN_LENGTH = 500
+
+# Application errors reported by the JS error oracle: "JS <kind>: <message> @ <source>"
+_JS_ERROR_PATTERN = re.compile(r'^JS ([\w-]+): (.*?)(?: @ .*)?$', re.DOTALL)
+_JS_EXCEPTION_NAME = re.compile(r'^(?:Uncaught )?(\w*Error|\w*Exception)\b')
+
+
+def normalize_error(error_text):
+    """Reduce a raw error string to a stable one-line template"""
+    if not error_text:
+        return ""
+
+    # Selenium appends the driver stack trace after 'Stacktrace:'
+    text = str(error_text).split('Stacktrace:')[0]
+    text = text.replace('Message:', '').strip()
+    text = text.splitlines()[0] if text else ""
+
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        text = pattern.sub(replacement, text)
+
+    return text.strip()[:200]
+
+
+@lru_cache(maxsize=4096)
+def error_signature(error_text):
+    """Map a raw error string to a stable signature name"""
+    if not error_text:
+        return "unknown"
+
+    head = str(error_text)[:MAX_SCAN_LENGTH]
+    js_match = _JS_ERROR_PATTERN.match(head)
+    if js_match:
+        return js_error_signature(js_match.group(1), js_match.group(2))
+    
+    for name, pattern in _COMPILED_RULES:
+        if pattern.search(head):
+            return name
+
+    template = normalize_error(error_text)
+    digest = hashlib.sha1(template.encode('utf-8')).hexdigest()[:8]
+    return f"unclassified-{digest}"
+
+
+def js_error_signature(kind, message):
+    """Signature for an application JS error, e.g. js-uncaught-typeerror-1a2b3c4d"""
+    parts = ['js', kind.lower()]
+    name_match = _JS_EXCEPTION_NAME.match(message.strip())
+    if name_match:
+        parts.append(name_match.group(1).lower())
+    digest = hashlib.sha1(normalize_error(message).encode('utf-8')).hexdigest()[:8]
+    parts.append(digest)
+    return "-".join(parts)
+
+
+def extract_error_text(result):
+    """Get the most descriptive error text from a stored action result"""
+    if result.get('error_msg'):
+        return result['error_msg']
+
+    # Actions that fail without raising embed the error in element_info
+    element_info = result.get('element_info') or ""
+    if ' - Error: ' in element_info:
+        return element_info.split(' - Error: ', 1)[1]
+    return element_info
+
+
+def _get_host(url):
+    try:
+        return urlparse(url).netloc.replace('www.', '') or "unknown"
+    except Exception:
+        return "unknown"
+
+
+class ErrorClusterer:
+    """Incremental failure clustering keyed by signature, host and action"""
+
+    def __init__(self):
+        self.clusters = {}
+        self.failures_seen = 0
+
+    @staticmethod
+    def cluster_id(signature, host, action_type):
+        """Stable short id for a (signature, host, action) group"""
+        key = f"{signature}|{host}|{action_type}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+
+    def add(self, result):
+        """Fold a single action result into the clusters, return its signature"""
+        if result.get('result'):
+            return None
+
+        error_text = extract_error_text(result)
+        signature = error_signature(error_text)
+        host = _get_host(result.get('url', ''))
+        action_type = result.get('action_type', 'unknown')
+        timestamp = result.get('timestamp')
+
+        self.failures_seen += 1
+        cid = self.cluster_id(signature, host, action_type)
+        cluster = self.clusters.get(cid)
+
+        if cluster is None:
+            self.clusters[cid] = {
+                'cluster_id': cid,
+                'signature': signature,
+                'host': host,
+                'action_type': action_type,
+                'count': 1,
+                'first_seen': timestamp,
+                'last_seen': timestamp,
+                'example_error': normalize_error(error_text),
+                'screenshot_path': result.get('screenshot_path')
+            }
+        else:
+            cluster['count'] += 1
+            if timestamp:
+                if not cluster['first_seen'] or timestamp < cluster['first_seen']:
+                    cluster['first_seen'] = timestamp
+                if not cluster['last_seen'] or timestamp > cluster['last_seen']:
+                    cluster['last_seen'] = timestamp
+            if not cluster['screenshot_path'] and result.get('screenshot_path'):
+                cluster['screenshot_path'] = result['screenshot_path']
+
+        return signature
+
+    def add_all(self, results):
+        """Fold an iterable of results into the clusters"""
+        for result in results:
+            self.add(result)
+        return self
+
+    def get_clusters(self, limit=None):
+        """Clusters ordered by failure count, largest first"""
+        ordered = sorted(self.clusters.values(), key=lambda c: c['count'], reverse=True)
+        return ordered[:limit] if limit else ordered
+
+    def get_signature_counts(self):
+        """Total failures per signature across hosts and actions"""
+        counts = {}
+        for cluster in self.clusters.values():
+            counts[cluster['signature']] = counts.get(cluster['signature'], 0) + cluster['count']
+        return counts
\ No newline at end of file
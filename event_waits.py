@@ -0,0 +1,278 @@
+import time
+import logging
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (TimeoutException, UnexpectedAlertPresentException,
+                                        WebDriverException)
+
+logger = logging.getLogger(__name__)
+
+POLL_FREQUENCY = 0.5  # WebDriverWait's default poll interval, used by the fallback
+SCRIPT_TIMEOUT = 30  # Selenium's default async script timeout; event waits are capped below it
+
+# Resolves with the match(es) the moment a DOM mutation produces them, or null on timeout
+ELEMENT_WAIT_SCRIPT = """
+var kind = arguments[0], query = arguments[1], all = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+function find() {
+  if (kind === 'xpath') {
+    var snapshot = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength && (all || i < 1); i++) { nodes.push(snapshot.snapshotItem(i)); }
+    return all ? (nodes.length ? nodes : null) : nodes[0] || null;
+  }
+  if (all) {
+    var matches = Array.prototype.slice.call(document.querySelectorAll(query));
+    return matches.length ? matches : null;
+  }
+  return document.querySelector(query);
+}
+var found = find();
+if (found) { done(found); return; }
+var timer, observer = new MutationObserver(function () {
+  var match = find();
+  if (match) { observer.disconnect(); clearTimeout(timer); done(match); }
+});
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function () { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+# Resolves on the readystatechange that reaches the wanted state
+LOAD_WAIT_SCRIPT = """
+var wanted = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+function reached() {
+  return document.readyState === 'complete' || (wanted === 'interactive' && document.readyState === 'interactive');
+}
+if (reached()) { done(document.readyState); return; }
+var timer;
+function onChange() {
+  if (reached()) { document.removeEventListener('readystatechange', onChange); clearTimeout(timer); done(document.readyState); }
+}
+document.addEventListener('readystatechange', onChange);
+timer = setTimeout(function () { document.removeEventListener('readystatechange', onChange); done(null); }, timeoutMs);
+"""
+
+# Resolves once the page is loaded and neither the DOM nor the network (finished resource
+# entries) has changed for quietMs; every mutation or resource restarts the quiet period
+SETTLE_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), last = start, finished = false, resources = null;
+var observer = new MutationObserver(function () { last = performance.now(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+try {
+  resources = new PerformanceObserver(function () { last = performance.now(); });
+  resources.observe({type: 'resource'});
+} catch (e) { resources = null; }
+function finish(settled) {
+  if (finished) { return; }
+  finished = true;
+  observer.disconnect();
+  if (resources) { resources.disconnect(); }
+  done({settled: settled, ms: Math.round(performance.now() - start)});
+}
+function check() {
+  var now = performance.now();
+  if (document.readyState === 'complete' && now - last >= quietMs) { finish(true); }
+  else if (now - start >= timeoutMs) { finish(false); }
+  else { setTimeout(check, Math.max(10, Math.min(quietMs - (now - last), timeoutMs - (now - start)))); }
+}
+setTimeout(check, quietMs);
+"""
+
+# Error text meaning the page navigated away while an event wait was pending
+UNLOAD_MARKERS = ('document unloaded', 'navigated', 'target frame detached', 'execution context was destroyed')
+UNSUPPORTED_MARKERS = ('unknown command', 'not supported', 'unsupported', 'not implemented')
+
+
+def _css_string(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def locator_query(locator):
+    """(kind, query) an in-page observer can evaluate, or None when only polling can find it"""
+    by, value = locator
+    if by == By.CSS_SELECTOR or by == By.TAG_NAME:
+        return 'css', value
+    if by == By.ID:
+        return 'css', f'[id="{_css_string(value)}"]'
+    if by == By.NAME:
+        return 'css', f'[name="{_css_string(value)}"]'
+    if by == By.CLASS_NAME:
+        return 'css', f'[class~="{_css_string(value)}"]'
+    if by == By.XPATH:
+        return 'xpath', value
+    return None  # Link text locators
+
+
+def _new_stats():
+    return {'waits': 0, 'timeouts': 0, 'seconds': 0.0, 'commands': 0}
+
+
+class EventWaiter:
+    """Waits resolved by in-page DOM/load/resource observers, with WebDriverWait polling as the fallback"""
+
+    def __init__(self, driver, backend='events', poll_frequency=POLL_FREQUENCY, quiet_ms=300):
+        self.driver = driver
+        self.event_driven = backend == 'events'
+        self.poll_frequency = poll_frequency
+        self.quiet_ms = quiet_ms
+        self.stats = {'events': _new_stats(), 'polling': _new_stats(),
+                      'navigations': 0, 'dialogs': 0, 'fallbacks': 0}
+
+    @property
+    def backend(self):
+        return 'events' if self.event_driven else 'polling'
+
+    def _record(self, backend, start, commands, timed_out=False):
+        stats = self.stats[backend]
+        stats['waits'] += 1
+        stats['seconds'] += time.time() - start
+        stats['commands'] += commands
+        stats['timeouts'] += 1 if timed_out else 0
+
+    def _run_event_script(self, script, timeout, *args):
+        """One round trip that resolves when the page event fires; raises _Fallback when it can't"""
+        timeout = min(timeout, SCRIPT_TIMEOUT - 1)
+        try:
+            return self.driver.execute_async_script(script, *args, int(timeout * 1000))
+        except UnexpectedAlertPresentException:
+            # A dialog opened: that is the event the caller must react to, not a timeout
+            self.stats['dialogs'] += 1
+            raise
+        except WebDriverException as e:
+            message = str(e).lower()
+            if any(marker in message for marker in UNLOAD_MARKERS):
+                self.stats['navigations'] += 1
+                raise _Navigated()
+            if any(marker in message for marker in UNSUPPORTED_MARKERS):
+                logger.info(f"Event waits unsupported by this browser, polling instead: {e}")
+                self.event_driven = False
+            self.stats['fallbacks'] += 1
+            raise _Fallback()
+
+    def find_element(self, locator, timeout=5):
+        """First element matching locator; raises TimeoutException when none appears in time"""
+        found = self._find(locator, timeout, all_matches=False)
+        if found is None:
+            raise TimeoutException(f"Element {locator} not found within {timeout} seconds")
+        return found
+
+    def find_elements(self, locator, timeout=5):
+        """All elements matching locator once at least one is present, else []"""
+        return self._find(locator, timeout, all_matches=True) or []
+
+    def _find(self, locator, timeout, all_matches):
+        query = locator_query(locator)
+        deadline = time.time() + timeout
+        if self.event_driven and query:
+            start = time.time()
+            for _ in range(2):  # A navigation mid-wait restarts the observer once on the new page
+                try:
+                    found = self._run_event_script(ELEMENT_WAIT_SCRIPT, max(0.0, deadline - time.time()),
+                                                   query[0], query[1], all_matches)
+                    self._record('events', start, 1, timed_out=found is None)
+                    return found
+                except _Navigated:
+                    self.wait_for_load(max(0.0, deadline - time.time()))
+                except _Fallback:
+                    break
+        return self._poll_find(locator, max(0.0, deadline - time.time()), all_matches)
+
+    def _poll_find(self, locator, timeout, all_matches):
+        start = time.time()
+        commands = [0]
+
+        def present(driver):
+            commands[0] += 1
+            matches = driver.find_elements(*locator)
+            return (matches if all_matches else matches[0]) if matches else False
+
+        try:
+            found = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(present)
+            self._record('polling', start, commands[0])
+            return found
+        except TimeoutException:
+            self._record('polling', start, commands[0], timed_out=True)
+            return None
+
+    def wait_for_load(self, timeout=15, state='complete'):
+        """True once document.readyState reaches state (or 'complete')"""
+        start = time.time()
+        if self.event_driven:
+            try:
+                reached = self._run_event_script(LOAD_WAIT_SCRIPT, timeout, state)
+                self._record('events', start, 1, timed_out=reached is None)
+                return reached is not None
+            except UnexpectedAlertPresentException:
+                self._record('events', start, 1)
+                return True  # The page is blocked on a dialog, not loading
+            except (_Navigated, _Fallback):
+                pass
+        commands = [0]
+
+        def loaded(driver):
+            commands[0] += 1
+            ready_state = driver.execute_script("return document.readyState;")
+            return ready_state == 'complete' or (state == 'interactive' and ready_state == 'interactive')
+
+        try:
+            WebDriverWait(self.driver, max(0.0, timeout - (time.time() - start)),
+                          poll_frequency=self.poll_frequency).until(loaded)
+            self._record('polling', start, commands[0])
+            return True
+        except (TimeoutException, WebDriverException):
+            self._record('polling', start, commands[0], timed_out=True)
+            return False
+
+    def settle(self, max_seconds, quiet_ms=None):
+        """Wait until DOM and network have been quiet for quiet_ms, at most max_seconds
+
+        The polling backend cannot observe quiet periods and keeps the original fixed pause.
+        """
+        if max_seconds <= 0:
+            return True
+        quiet_ms = self.quiet_ms if quiet_ms is None else quiet_ms
+        start = time.time()
+        if self.event_driven:
+            for _ in range(2):
+                remaining = max_seconds - (time.time() - start)
+                try:
+                    result = self._run_event_script(SETTLE_SCRIPT, max(0.0, remaining), quiet_ms)
+                    settled = bool(result and result.get('settled'))
+                    self._record('events', start, 1, timed_out=not settled)
+                    return settled
+                except UnexpectedAlertPresentException:
+                    self._record('events', start, 1)
+                    return True  # Nothing will change until the dialog is handled
+                except _Navigated:
+                    # A click or search navigated: wait for the new document, then for it to go quiet
+                    self.wait_for_load(max(0.0, max_seconds - (time.time() - start)))
+                except _Fallback:
+                    break
+            else:
+                self._record('events', start, 2, timed_out=True)
+                return False
+        time.sleep(max(0.0, max_seconds - (time.time() - start)))
+        self._record('polling', start, 0)
+        return True
+
+    def summary(self):
+        """Wait counts, time and WebDriver commands per backend"""
+        summary = {'backend': self.backend}
+        for backend in ('events', 'polling'):
+            stats = dict(self.stats[backend])
+            stats['seconds'] = round(stats['seconds'], 2)
+            stats['avg_ms'] = round(stats['seconds'] / stats['waits'] * 1000) if stats['waits'] else None
+            summary[backend] = stats
+        for key in ('navigations', 'dialogs', 'fallbacks'):
+            summary[key] = self.stats[key]
+        return summary
+
+
+class _Navigated(Exception):
+    """The page unloaded while an event wait was pending"""
+
+
+class _Fallback(Exception):
+    """The event wait could not run; poll instead"""
\ No newline at end of file
@@ -0,0 +1,138 @@
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>{title}</title></head>
+<body>
+<h1>{title}</h1>
+<nav><a href="/">Home</a> <a href="/form">Form</a> <a href="/buttons">Buttons</a></nav>
+{body}
+</body></html>
+"""
+
+PAGES = {
+    '/': ('Fixture Home', '<p>Local pages for exercising the monkey tester.</p>'),
+    '/form': ('Fixture Form', """
+<form action="/form" method="get">
+  <input type="text" name="username" placeholder="Username">
+  <input type="password" name="password" placeholder="Password">
+  <input type="email" name="email" placeholder="Email">
+  <textarea name="comment"></textarea>
+  <button type="submit">Submit</button>
+</form>"""),
+    '/buttons': ('Fixture Buttons', """
+<button id="ok" onclick="this.textContent = 'Clicked'">OK</button>
+<button id="broken" onclick="undefinedFunction()">Broken</button>
+<button id="toggle" onclick="document.getElementById('panel').hidden ^= true">Toggle</button>
+<div id="panel" hidden><p>Expanded panel</p><a href="/form">More</a></div>"""),
+    '/late': ('Fixture Late Content', """
+<div id="app">Loading...</div>
+<script>
+setTimeout(function () {
+  document.getElementById('app').innerHTML = '<button id="late">Ready</button> <a href="/buttons">Buttons</a>';
+}, 700);
+</script>"""),  # Rendered client-side after the load event, like a single-page app
+    '/components': ('Fixture Components', """
+<fixture-card></fixture-card>
+<iframe src="/form" width="400" height="300"></iframe>
+<script>
+customElements.define('fixture-card', class extends HTMLElement {
+  connectedCallback() {
+    this.attachShadow({mode: 'open'}).innerHTML =
+      '<button id="shadow-ok">Shadow button</button> <input type="search" placeholder="Shadow search">';
+  }
+});
+</script>"""),  # Open shadow root and a same-origin iframe for element discovery
+}
+
+# Seconds /slow stalls before answering - longer than the driver's page load timeout
+SLOW_RESPONSE_SECONDS = 30
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Serves the fixture pages plus /slow (hangs) and /error (HTTP 500)"""
+
+    def do_HEAD(self):
+        self._respond(include_body=False)
+
+    def do_GET(self):
+        self._respond(include_body=True)
+
+    def _respond(self, include_body):
+        path = self.path.split('?')[0]
+        if path == '/slow':
+            time.sleep(SLOW_RESPONSE_SECONDS)
+            status, title, body = 200, 'Fixture Slow', '<p>Finally.</p>'
+        elif path == '/error':
+            status, title, body = 500, 'Fixture Error', '<p>Internal Server Error</p>'
+        elif path in PAGES:
+            status, (title, body) = 200, PAGES[path]
+        else:
+            status, title, body = 404, 'Not Found', '<p>No such fixture page.</p>'
+
+        content = PAGE_TEMPLATE.format(title=title, body=body).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            if include_body:
+                self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Local HTTP server with known-good, hanging and failing pages"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def urls(self, include_broken=True):
+        """Fixture URLs for test_urls; broken ones exercise preflight and the circuit breaker"""
+        urls = [self.base_url + path for path in PAGES]
+        if include_broken:
+            urls += [self.base_url + '/slow', self.base_url + '/error']
+        return urls
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the QA-Monkey fixture pages")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = FixtureServer(port=args.port)
+    print(f"🧪 Fixture server on {server.base_url}")
+    for url in server.urls():
+        print(f"   {url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
\ No newline at end of file
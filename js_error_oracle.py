@@ -0,0 +1,123 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_BUFFERED_ERRORS = 200
+
+# Idempotent collector for console.error, uncaught errors and unhandled rejections
+INSTALL_COLLECTOR_SCRIPT = """
+(function (maxErrors) {
+    if (window.__qaMonkeyErrors) return;
+    var buffer = window.__qaMonkeyErrors = [];
+    function push(kind, message, source) {
+        if (buffer.length < maxErrors) {
+            buffer.push({kind: kind, message: String(message).slice(0, 500), source: source || ''});
+        }
+    }
+    function describe(value) {
+        if (value && value.stack) return (value.name ? value.name + ': ' : '') + value.message;
+        try { return typeof value === 'string' ? value : JSON.stringify(value); } catch (e) { return String(value); }
+    }
+    var originalError = console.error;
+    console.error = function () {
+        push('console-error', Array.prototype.map.call(arguments, describe).join(' '));
+        return originalError.apply(console, arguments);
+    };
+    window.addEventListener('error', function (e) {
+        if (e.error || e.message) {
+            push('uncaught', e.error ? describe(e.error) : e.message, (e.filename || '') + ':' + (e.lineno || 0));
+        }
+    }, true);
+    window.addEventListener('unhandledrejection', function (e) {
+        push('unhandled-rejection', describe(e.reason));
+    });
+})(%d);
+""" % MAX_BUFFERED_ERRORS
+
+DRAIN_SCRIPT = INSTALL_COLLECTOR_SCRIPT + """
+return window.__qaMonkeyErrors.splice(0, window.__qaMonkeyErrors.length);
+"""
+
+# Browser log noise that says nothing about the application
+IGNORED_LOG_FRAGMENTS = ['favicon.ico', 'ERR_BLOCKED_BY_CLIENT']
+
+# Log sources already covered by the injected collector (once it is installed on new documents)
+COLLECTED_LOG_SOURCES = {'console-api', 'javascript'}
+
+# Failed requests (404s, aborted loads) are reported by status, not as application JS errors
+IGNORED_LOG_SOURCES = {'network'}
+
+
+def format_js_error(error):
+    """Error message in the form error_signatures recognizes as a JS error"""
+    message = error.get('message', '')
+    if error.get('source'):
+        message += f" @ {error['source']}"
+    return f"JS {error.get('kind', 'console-error')}: {message}"
+
+
+class JSErrorCollector:
+    """Batches application JS errors so each action drains them in one call"""
+
+    def __init__(self, driver, include_browser_log=True):
+        self.driver = driver
+        self.include_browser_log = include_browser_log
+        self.installed = False
+        self.total_errors = 0
+
+    @staticmethod
+    def configure_options(options):
+        """Enable browser log capture before the driver starts"""
+        options.set_capability('goog:loggingPrefs', {'browser': 'SEVERE'})
+        return options
+
+    def install(self):
+        """Install the collector ahead of page scripts on every new document"""
+        self.installed = False
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                        {'source': INSTALL_COLLECTOR_SCRIPT})
+            self.installed = True
+            return True
+        except Exception as e:
+            logger.debug(f"Could not pre-install JS error collector: {e}")
+            return False
+
+    def drain(self):
+        """Return and clear all JS errors recorded since the last drain"""
+        errors = []
+        try:
+            errors.extend(self.driver.execute_script(DRAIN_SCRIPT) or [])
+        except Exception as e:
+            logger.debug(f"Could not drain JS errors: {e}")
+
+        if self.include_browser_log:
+            errors.extend(self._drain_browser_log())
+
+        self.total_errors += len(errors)
+        return errors
+
+    def _drain_browser_log(self):
+        """Severe browser log entries not already caught by the injected collector"""
+        try:
+            entries = self.driver.get_log('browser')
+        except Exception:
+            # Not every driver exposes the log endpoint - stop asking
+            self.include_browser_log = False
+            return []
+
+        errors = []
+        for entry in entries:
+            message = entry.get('message', '')
+            source = entry.get('source')
+            if source in IGNORED_LOG_SOURCES:
+                continue
+            # Without the pre-installed collector, errors before the lazy install only show up here
+            if self.installed and source in COLLECTED_LOG_SOURCES:
+                continue
+            if any(fragment in message for fragment in IGNORED_LOG_FRAGMENTS):
+                continue
+            errors.append({'kind': 'browser-log', 'message': message[:500], 'source': entry.get('source', '')})
+        return errors
\ No newline at end of file
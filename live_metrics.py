@@ -0,0 +1,224 @@
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+ROLLING_ACTIONS = 100  # Actions in the rolling success rate
+RATE_WINDOW_SECONDS = 30  # Span of the actions/sec estimate
+STUCK_AFTER_SECONDS = 120  # No new action for this long marks the session as stuck
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshot):
+    """Prometheus text exposition (format 0.0.4) of a snapshot"""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP qa_monkey_{name} {help_text}")
+        lines.append(f"# TYPE qa_monkey_{name} {kind}")
+        for labels, value in samples:
+            if value is None:
+                continue
+            label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+            lines.append(f"qa_monkey_{name}{{{label_text}}} {value}" if label_text else f"qa_monkey_{name} {value}")
+
+    metric('info', 'gauge', 'Session being run', [({'session_id': snapshot['session_id']}, 1)])
+    metric('uptime_seconds', 'gauge', 'Seconds since the metrics started', [({}, snapshot['uptime_seconds'])])
+    metric('actions_total', 'counter', 'Actions performed', [({}, snapshot['actions'])])
+    metric('actions_successful_total', 'counter', 'Successful actions', [({}, snapshot['successful'])])
+    metric('actions_per_second', 'gauge', f'Actions per second over the last {RATE_WINDOW_SECONDS}s',
+           [({}, snapshot['actions_per_second'])])
+    metric('success_rate', 'gauge', 'Success rate over all actions (0-1)', [({}, snapshot['success_rate'])])
+    metric('success_rate_rolling', 'gauge', f'Success rate over the last {ROLLING_ACTIONS} actions (0-1)',
+           [({}, snapshot['success_rate_rolling'])])
+    metric('seconds_since_last_action', 'gauge', 'Seconds since the last action was logged',
+           [({}, snapshot['seconds_since_last_action'])])
+    metric('stuck', 'gauge', f'1 when no action was logged for {STUCK_AFTER_SECONDS}s', [({}, int(snapshot['stuck']))])
+    metric('wait_time_share', 'gauge', 'Share of wall time spent in waits (0-1)', [({}, snapshot['wait_time_share'])])
+    metric('screenshot_queue_depth', 'gauge', 'Screenshots captured but not yet written',
+           [({}, snapshot['screenshot_queue_depth'])])
+    metric('browser_rss_megabytes', 'gauge', 'Resident memory of the browser process tree',
+           [({}, snapshot['browser_rss_mb'])])
+    hosts = snapshot['hosts']
+    metric('host_actions_total', 'counter', 'Actions per host',
+           [({'host': host}, state['actions']) for host, state in hosts.items()])
+    metric('host_failures_total', 'counter', 'Failed actions per host',
+           [({'host': host}, state['failures']) for host, state in hosts.items()])
+    metric('host_circuit_open', 'gauge', '1 while the host circuit breaker is open',
+           [({'host': host}, int(state['circuit_open'])) for host, state in hosts.items()])
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """GET /metrics (Prometheus text) and /progress (latest snapshot as JSON)"""
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        snapshot = self.server.live_metrics.latest
+        if path == '/metrics':
+            body, content_type = prometheus_text(snapshot), 'text/plain; version=0.0.4; charset=utf-8'
+        elif path == '/progress':
+            body, content_type = json.dumps(snapshot), 'application/json'
+        else:
+            self.send_error(404)
+            return
+        content = body.encode('utf-8')
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LiveMetrics:
+    """Background snapshots of a running suite, served on localhost and/or appended to a JSON-lines file
+
+    The action loop is never touched: a daemon thread reads the logger's counters and new results,
+    the circuit breaker, waiter, screenshot queue and watchdog every interval.
+    """
+
+    def __init__(self, suite, port=None, progress_file=None, interval=2.0, host='127.0.0.1'):
+        self.suite = suite
+        self.port = port
+        self.progress_file = progress_file
+        self.interval = interval
+        self.bind_host = host
+        self.started_at = time.time()
+
+        self.hosts = {}
+        self.recent = deque(maxlen=ROLLING_ACTIONS)
+        self.totals = deque()  # (time, total actions) ticks within the rate window
+        self._seen_results = 0
+        self._last_total = 0
+        self._last_action_at = self.started_at
+        self.latest = self._snapshot()
+
+        self.httpd = None
+        self._progress = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def url(self):
+        if not self.httpd:
+            return None
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        if self.port is not None:
+            try:
+                self.httpd = ThreadingHTTPServer((self.bind_host, self.port), _MetricsRequestHandler)
+                self.httpd.daemon_threads = True
+                self.httpd.live_metrics = self
+                threading.Thread(target=self.httpd.serve_forever, name='live-metrics-http', daemon=True).start()
+            except OSError as e:
+                logger.warning(f"Could not serve metrics on port {self.port}: {e}")
+                self.httpd = None
+        if self.progress_file:
+            self._progress = open(self.progress_file, 'a', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, name='live-metrics', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Take a final snapshot and shut the endpoint down"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval + 1)
+        self.update()
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+        if self._progress:
+            self._progress.close()
+            self._progress = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.update()
+
+    def update(self):
+        try:
+            self._ingest()
+            self.latest = self._snapshot()
+            if self._progress:
+                self._progress.write(json.dumps(self.latest) + "\n")
+                self._progress.flush()
+        except Exception as e:
+            # Components are swapped out on browser restarts; the next tick reads the new ones
+            logger.debug(f"Live metrics update failed: {e}")
+        return self.latest
+
+    def _ingest(self):
+        """Fold results logged since the last tick into the per-host and rolling counters"""
+        results = self.suite.logger.test_results if self.suite.logger else []
+        if len(results) < self._seen_results:
+            self._seen_results = 0  # Results were rewound (checkpoint resume)
+        new = results[self._seen_results:]
+        self._seen_results += len(new)
+        for result in new:
+            host = urlparse(result.get('url') or '').netloc or 'unknown'
+            state = self.hosts.setdefault(host, {'actions': 0, 'failures': 0})
+            state['actions'] += 1
+            state['failures'] += 0 if result.get('result') else 1
+            self.recent.append(bool(result.get('result')))
+
+    def _snapshot(self):
+        suite, now = self.suite, time.time()
+        stats = dict(suite.logger.action_stats) if suite.logger else {}
+        total = stats.get('total_actions', 0)
+        if total != self._last_total:
+            self._last_total, self._last_action_at = total, now
+
+        self.totals.append((now, total))
+        while len(self.totals) > 2 and now - self.totals[0][0] > RATE_WINDOW_SECONDS:
+            self.totals.popleft()
+        span = now - self.totals[0][0]
+        rate = (total - self.totals[0][1]) / span if span > 0 else 0.0
+
+        breaker_hosts = dict(suite.circuit_breaker.hosts) if suite.circuit_breaker else {}
+        hosts = {}
+        for host in set(self.hosts) | set(breaker_hosts):
+            counts = self.hosts.get(host, {'actions': 0, 'failures': 0})
+            breaker = breaker_hosts.get(host) or {}
+            hosts[host] = dict(counts, circuit_open=breaker.get('opened_at') is not None,
+                               consecutive_failures=breaker.get('consecutive_failures', 0))
+
+        wall = now - self.started_at
+        waits = suite.waiter.summary() if suite.waiter else {}
+        wait_seconds = sum(waits[backend]['seconds'] for backend in ('events', 'polling') if backend in waits)
+        screenshots = suite.screenshot_manager
+        idle = now - self._last_action_at
+        return {
+            'type': 'progress',
+            'timestamp': round(now, 3),
+            'session_id': suite.session_id,
+            'uptime_seconds': round(wall, 1),
+            'actions': total,
+            'successful': stats.get('successful_actions', 0),
+            'failed': stats.get('failed_actions', 0),
+            'actions_per_second': round(rate, 3),
+            'success_rate': round(stats.get('successful_actions', 0) / total, 4) if total else None,
+            'success_rate_rolling': round(sum(self.recent) / len(self.recent), 4) if self.recent else None,
+            'seconds_since_last_action': round(idle, 1),
+            'stuck': idle >= STUCK_AFTER_SECONDS,
+            'wait_time_share': round(min(1.0, wait_seconds / wall), 4) if wall > 0 else None,
+            'screenshot_queue_depth': screenshots.queue_depth() if screenshots else 0,
+            'browser_rss_mb': round(suite.watchdog.latest_rss_mb, 1) if suite.watchdog else None,
+            'hosts': hosts
+        }
\ No newline at end of file
@@ -1,146 +1,237 @@
-import logging
-import os
-from datetime import datetime
-import json
-
-class EnhancedLogger:
-    """Enhanced logging system with structured output"""
-    
-    def __init__(self, session_id, log_level=logging.INFO):
-        self.session_id = session_id
-        self.setup_directories()
-        self.setup_loggers(log_level)
-        self.test_results = []
-        self.action_stats = {
-            'total_actions': 0,
-            'successful_actions': 0,
-            'failed_actions': 0,
-            'errors': 0
-        }
-    
-    def setup_directories(self):
-        """Create logging directories"""
-        self.log_dir = f"logs/{self.session_id}"
-        self.error_dir = f"errors/{self.session_id}"
-        
-        os.makedirs(self.log_dir, exist_ok=True)
-        os.makedirs(self.error_dir, exist_ok=True)
-    
-    def setup_loggers(self, log_level):
-        """Setup multiple loggers for different purposes"""
-        
-        # Main application logger
-        self.logger = logging.getLogger('qa_monkey')
-        self.logger.setLevel(log_level)
-        
-        # Clear existing handlers
-        self.logger.handlers.clear()
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            '[%(asctime)s] %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        console_handler.setFormatter(console_format)
-        self.logger.addHandler(console_handler)
-        
-        # File handler for detailed logs
-        file_handler = logging.FileHandler(f'{self.log_dir}/detailed.log')
-        file_handler.setLevel(log_level)
-        file_format = logging.Formatter(
-            '[%(asctime)s] %(levelname)s - %(name)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_format)
-        self.logger.addHandler(file_handler)
-        
-        # Action logger for structured action logging
-        self.action_logger = logging.getLogger('qa_monkey.actions')
-        self.action_logger.setLevel(log_level)
-        self.action_logger.handlers.clear()
-        
-        action_handler = logging.FileHandler(f'{self.log_dir}/actions.log')
-        action_handler.setLevel(log_level)
-        action_format = logging.Formatter(
-            '[%(asctime)s] %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        action_handler.setFormatter(action_format)
-        self.action_logger.addHandler(action_handler)
-    
-    def log_action(self, action_type, element_info, result, error_msg=None, screenshot_path=None):
-        """Log individual action with detailed information"""
-        timestamp = datetime.now().isoformat()
-        
-        # Update statistics
-        self.action_stats['total_actions'] += 1
-        if result:
-            self.action_stats['successful_actions'] += 1
-            status = "SUCCESS"
-            level = logging.INFO
-        else:
-            self.action_stats['failed_actions'] += 1
-            status = "FAILED"
-            level = logging.WARNING
-            
-        if error_msg:
-            self.action_stats['errors'] += 1
-            level = logging.ERROR
-        
-        # Create log message
-        log_msg = f"{action_type.upper()} on {element_info} - {status}"
-        if error_msg:
-            log_msg += f" - Error: {error_msg}"
-        if screenshot_path:
-            log_msg += f" - Screenshot: {screenshot_path}"
-        
-        # Log to action logger
-        self.action_logger.log(level, log_msg)
-        
-        # Store structured result
-        result_data = {
-            'timestamp': timestamp,
-            'action_type': action_type,
-            'element_info': element_info,
-            'result': result,
-            'error_msg': error_msg,
-            'screenshot_path': screenshot_path,
-            'status': status
-        }
-        self.test_results.append(result_data)
-    
-    def log_page_action(self, page_name, action_method, result, error_msg=None):
-        """Log page-specific actions"""
-        self.logger.info(f"Page: {page_name} - Action: {action_method} - {'SUCCESS' if result else 'FAILED'}")
-        if error_msg:
-            self.logger.error(f"Page action error: {error_msg}")
-    
-    def get_stats(self):
-        """Get current statistics"""
-        total = self.action_stats['total_actions']
-        if total > 0:
-            success_rate = (self.action_stats['successful_actions'] / total) * 100
-        else:
-            success_rate = 0
-        
-        return {
-            **self.action_stats,
-            'success_rate': round(success_rate, 1)
-        }
-    
-    def save_session_data(self):
-        """Save session data to JSON"""
-        session_file = f'{self.log_dir}/session_data.json'
-        session_data = {
-            'session_id': self.session_id,
-            'timestamp': datetime.now().isoformat(),
-            'statistics': self.get_stats(),
-            'test_results': self.test_results
-        }
-        
-        with open(session_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
-        
+import logging
+import os
+from datetime import datetime
+import json
+
+from error_signatures import ErrorClusterer
+
+class EnhancedLogger:
+    """Enhanced logging system with structured output"""
+    
+    def __init__(self, session_id, log_level=logging.INFO):
+        self.session_id = session_id
+        self.setup_directories()
+        self.setup_loggers(log_level)
+        self.test_results = []
+        self.page_loads = []
+        self.events = []
+        self.metadata = {}
+        self.error_clusters = ErrorClusterer()
+        self.action_stats = {
+            'total_actions': 0,
+            'successful_actions': 0,
+            'failed_actions': 0,
+            'errors': 0,
+            'performance_failures': 0,
+            'js_error_actions': 0,
+            'browser_restarts': 0,
+            'browser_recycles': 0
+        }
+        # Every result is also streamed to disk so a killed run keeps what it did
+        self.results_stream_path = f'{self.log_dir}/results.jsonl'
+        self._results_stream = open(self.results_stream_path, 'a', encoding='utf-8')
+    
+    def setup_directories(self):
+        """Create logging directories"""
+        self.log_dir = f"logs/{self.session_id}"
+        self.error_dir = f"errors/{self.session_id}"
+        
+        os.makedirs(self.log_dir, exist_ok=True)
+        os.makedirs(self.error_dir, exist_ok=True)
+    
+    def setup_loggers(self, log_level):
+        """Setup multiple loggers for different purposes"""
+        
+        # Main application logger
+        self.logger = logging.getLogger('qa_monkey')
+        self.logger.setLevel(log_level)
+        
+        # Clear existing handlers
+        self.logger.handlers.clear()
+        
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_format = logging.Formatter(
+            '[%(asctime)s] %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        )
+        console_handler.setFormatter(console_format)
+        self.logger.addHandler(console_handler)
+        
+        # File handler for detailed logs
+        file_handler = logging.FileHandler(f'{self.log_dir}/detailed.log')
+        file_handler.setLevel(log_level)
+        file_format = logging.Formatter(
+            '[%(asctime)s] %(levelname)s - %(name)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_format)
+        self.logger.addHandler(file_handler)
+        
+        # Action logger for structured action logging
+        self.action_logger = logging.getLogger('qa_monkey.actions')
+        self.action_logger.setLevel(log_level)
+        self.action_logger.handlers.clear()
+        
+        action_handler = logging.FileHandler(f'{self.log_dir}/actions.log')
+        action_handler.setLevel(log_level)
+        action_format = logging.Formatter(
+            '[%(asctime)s] %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        action_handler.setFormatter(action_format)
+        self.action_logger.addHandler(action_handler)
+    
+    def log_action(self, action_type, element_info, result, error_msg=None, screenshot_path=None, url=None,
+                   **details):
+        """Log individual action with detailed information"""
+        timestamp = datetime.now().isoformat()
+        
+        # Update statistics
+        self.action_stats['total_actions'] += 1
+        if result:
+            self.action_stats['successful_actions'] += 1
+            status = "SUCCESS"
+            level = logging.INFO
+        else:
+            self.action_stats['failed_actions'] += 1
+            status = "FAILED"
+            level = logging.WARNING
+            
+        if error_msg:
+            self.action_stats['errors'] += 1
+            level = logging.ERROR
+        
+        # Create log message
+        log_msg = f"{action_type.upper()} on {element_info} - {status}"
+        if error_msg:
+            log_msg += f" - Error: {error_msg}"
+        if screenshot_path:
+            log_msg += f" - Screenshot: {screenshot_path}"
+        if details.get('js_errors'):
+            self.action_stats['js_error_actions'] += 1
+        if details.get('perf_failure'):
+            self.action_stats['performance_failures'] += 1
+            log_msg += f" - SLOW: long task {details['perf']['long_task_max_ms']}ms"
+        
+        # Log to action logger
+        self.action_logger.log(level, log_msg)
+        
+        # Store structured result
+        result_data = {
+            'timestamp': timestamp,
+            'action_type': action_type,
+            'element_info': element_info,
+            'result': result,
+            'error_msg': error_msg,
+            'screenshot_path': screenshot_path,
+            'status': status,
+            'url': url,
+            **details
+        }
+        
+        # Cluster failures as they arrive so reports never rescan the results
+        result_data['error_signature'] = self.error_clusters.add(result_data)
+        self.test_results.append(result_data)
+        self._stream_result('action', result_data)
+    
+    def log_page_load(self, url, load_time, **details):
+        """Log a timed page load with optional extra measurements"""
+        load_data = {
+            'timestamp': datetime.now().isoformat(),
+            'url': url,
+            'load_time': round(load_time, 3),
+            **details
+        }
+        self.page_loads.append(load_data)
+        self._stream_result('page_load', load_data)
+        self.logger.debug(f"Page load: {url} in {load_time:.2f}s")
+        return load_data
+    
+    def log_event(self, event_type, **details):
+        """Log a run-level event (e.g. a browser restart) kept apart from action results"""
+        event = {
+            'timestamp': datetime.now().isoformat(),
+            'event_type': event_type,
+            **details
+        }
+        self.events.append(event)
+        if event_type == 'browser_restart':
+            self.action_stats['browser_restarts'] += 1
+        elif event_type == 'browser_recycle':
+            self.action_stats['browser_recycles'] += 1
+        self._stream_result('event', event)
+        self.logger.warning(f"Event: {event_type} - {details}")
+        return event
+    
+    def _stream_result(self, kind, data):
+        self._results_stream.write(json.dumps({'kind': kind, **data}, default=str) + "\n")
+        self._results_stream.flush()
+    
+    def results_offset(self):
+        """Byte offset of the results stream, stored in checkpoints"""
+        return self._results_stream.tell()
+    
+    def restore_results(self, offset, action_stats):
+        """Reload results streamed up to a checkpoint and drop anything written after it"""
+        self._results_stream.close()
+        with open(self.results_stream_path, 'r+', encoding='utf-8') as f:
+            f.truncate(offset)
+            f.seek(0)
+            for line in f:
+                entry = json.loads(line)
+                kind = entry.pop('kind')
+                if kind == 'action':
+                    self.error_clusters.add(entry)
+                    self.test_results.append(entry)
+                elif kind == 'event':
+                    self.events.append(entry)
+                else:
+                    self.page_loads.append(entry)
+        
+        self.action_stats.update(action_stats)
+        self._results_stream = open(self.results_stream_path, 'a', encoding='utf-8')
+        self.logger.info(f"Restored {len(self.test_results)} results from {self.results_stream_path}")
+    
+    def close(self):
+        if not self._results_stream.closed:
+            self._results_stream.close()
+    
+    def log_page_action(self, page_name, action_method, result, error_msg=None):
+        """Log page-specific actions"""
+        self.logger.info(f"Page: {page_name} - Action: {action_method} - {'SUCCESS' if result else 'FAILED'}")
+        if error_msg:
+            self.logger.error(f"Page action error: {error_msg}")
+    
+    def get_stats(self):
+        """Get current statistics"""
+        total = self.action_stats['total_actions']
+        if total > 0:
+            success_rate = (self.action_stats['successful_actions'] / total) * 100
+        else:
+            success_rate = 0
+        
+        return {
+            **self.action_stats,
+            'success_rate': round(success_rate, 1)
+        }
+    
+    def save_session_data(self):
+        """Save session data to JSON"""
+        session_file = f'{self.log_dir}/session_data.json'
+        session_data = {
+            'session_id': self.session_id,
+            'timestamp': datetime.now().isoformat(),
+            'metadata': self.metadata,
+            'statistics': self.get_stats(),
+            'error_clusters': self.error_clusters.get_clusters(),
+            'page_loads': self.page_loads,
+            'events': self.events,
+            'test_results': self.test_results
+        }
+        
+        with open(session_file, 'w') as f:
+            json.dump(session_data, f, indent=2)
+        
         return session_file
\ No newline at end of file
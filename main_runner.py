@@ -1,217 +1,430 @@
-#!/usr/bin/env python3
-"""
-Enhanced QA-Monkey Regression Test Runner
-Supports the resume claim: "achieving 92% success in regression testing"
-"""
-
-import sys
-import argparse
-from regression_test_suite import RegressionTestSuite
-
-def get_custom_websites():
-    """Get custom websites from user input"""
-    print("\n🌐 CUSTOM WEBSITE TESTING")
-    print("=" * 50)
-    
-    # Ask how many websites to test
-    while True:
-        try:
-            max_sites = int(input("How many websites do you want to test? (1-20): "))
-            if 1 <= max_sites <= 20:
-                break
-            else:
-                print("❌ Please enter a number between 1 and 20")
-        except ValueError:
-            print("❌ Please enter a valid number")
-    
-    websites = []
-    
-    print(f"\nEnter {max_sites} websites to test:")
-    print("Example: google.com (https:// will be added automatically)")
-    
-    for i in range(max_sites):
-        while True:
-            website = input(f"Website {i + 1}/{max_sites}: ").strip()
-            
-            if website:
-                # Add https:// if not present
-                if not website.startswith(('http://', 'https://')):
-                    website = 'https://' + website
-                    
-                websites.append(website)
-                print(f"✅ Added: {website}")
-                break
-            else:
-                print("❌ Please enter a website URL")
-    
-    print(f"\n📋 Will test {len(websites)} websites:")
-    for i, site in enumerate(websites, 1):
-        print(f"   {i}. {site}")
-    
-    return websites
-
-def choose_test_mode():
-    """Let user choose test mode - optimized for speed"""
-    print("\n⚡ SELECT TEST MODE (All modes run in HEADLESS for speed)")
-    print("=" * 60)
-    print("1. Lightning (2 actions per site) - ~10 seconds per site")
-    print("2. Quick (5 actions per site) - ~20 seconds per site") 
-    print("3. Standard (8 actions per site) - ~30 seconds per site")
-    print("4. Extended (12 actions per site) - ~45 seconds per site")
-    print("5. Custom (specify number of actions)")
-    
-    while True:
-        try:
-            choice = input("\nEnter choice (1-5): ").strip()
-            
-            if choice == '1':
-                return 2, "Lightning", 0.3  # actions, name, delay
-            elif choice == '2':
-                return 5, "Quick", 0.5
-            elif choice == '3':
-                return 8, "Standard", 0.7
-            elif choice == '4':
-                return 12, "Extended", 1.0
-            elif choice == '5':
-                while True:
-                    try:
-                        actions = int(input("Enter number of actions per website (1-25): "))
-                        if 1 <= actions <= 25:
-                            delay = min(1.0, actions * 0.1)  # Dynamic delay based on actions
-                            return actions, f"Custom ({actions} actions)", delay
-                        else:
-                            print("❌ Please enter a number between 1 and 25")
-                    except ValueError:
-                        print("❌ Please enter a valid number")
-            else:
-                print("❌ Please enter 1, 2, 3, 4, or 5")
-                
-        except (ValueError, KeyboardInterrupt):
-            print("\n❌ Invalid input. Please try again.")
-
-def main():
-    parser = argparse.ArgumentParser(description="Enhanced QA-Monkey Regression Test Suite")
-    parser.add_argument("--target-rate", type=float, default=92.0,
-                      help="Target success rate percentage (default: 92.0)")
-    parser.add_argument("--super-fast", action="store_true",
-                      help="Super fast mode: 2 actions per site, 3 sites max")
-    parser.add_argument("--quick", action="store_true",
-                      help="Quick mode: 5 actions per site")
-    parser.add_argument("--interactive", action="store_true",
-                      help="Interactive mode to choose websites and settings")
-    parser.add_argument("--visible", action="store_true",
-                      help="Run with visible browser (default: headless for speed)")
-    
-    args = parser.parse_args()
-    
-    # Force headless by default for speed (opposite of original)
-    headless_mode = not args.visible
-    
-    # Display banner
-    print("""
-╔══════════════════════════════════════════════════════════════╗
-║              ENHANCED QA-MONKEY TEST SUITE                   ║
-║         Python-Selenium with POM Design Pattern             ║
-║                                                              ║
-║  🎯 Target Success Rate: {:.1f}%                           ║
-║  🐒 Randomized User Actions with Smart Selection            ║
-║  📊 Multi-Format Reports (HTML/JSON/CSV)                   ║
-║  📸 Automatic Error Screenshots                            ║
-║  📝 Detailed Structured Logging                            ║
-║  ⚡ SPEED OPTIMIZED - HEADLESS BY DEFAULT                  ║
-║  🚀 NEW: Super Fast Mode & Website Count Selection         ║
-╚══════════════════════════════════════════════════════════════╝
-    """.format(args.target_rate))
-    
-    # Initialize test suite
-    suite = RegressionTestSuite(target_success_rate=args.target_rate)
-    
-    # Interactive mode
-    if args.interactive:
-        # Get custom websites with count selection
-        custom_websites = get_custom_websites()
-        suite.test_urls = custom_websites
-        
-        # Choose test mode with speed optimization
-        max_actions, mode_name, action_delay = choose_test_mode()
-        suite.smart_config['max_actions_per_url'] = max_actions
-        suite.smart_config['action_delay_range'] = (action_delay, action_delay + 0.2)  # Faster delays
-        suite.smart_config['page_load_wait'] = 1.5  # Faster page load wait
-        
-        print(f"\n🚀 STARTING {mode_name.upper()} TEST")
-        print(f"🎯 Target Success Rate: {args.target_rate}%")
-        print(f"🌐 Testing {len(suite.test_urls)} websites")
-        print(f"⚡ {max_actions} actions per website")
-        print(f"👁️  Mode: {'Visible Browser' if args.visible else 'Headless (Fast)'}")
-        print(f"⏱️  Estimated time: ~{len(suite.test_urls) * max_actions * action_delay / 60:.1f} minutes")
-        
-        input("\nPress Enter to start testing...")
-    else:
-        # Set default fast configuration for non-interactive mode
-        suite.smart_config['page_load_wait'] = 1.5
-        suite.smart_config['action_delay_range'] = (0.3, 0.5)
-    
-    try:
-        # Setup with headless by default
-        suite.setup(headless=headless_mode)
-        
-        # Adjust for quick test modes (if not in interactive mode)
-        if args.super_fast and not args.interactive:
-            suite.smart_config['max_actions_per_url'] = 2
-            suite.smart_config['action_delay_range'] = (0.1, 0.3)  # Ultra fast
-            suite.smart_config['page_load_wait'] = 1
-            suite.test_urls = suite.test_urls[:3]  # Only 3 websites
-            print("⚡ SUPER FAST MODE: 2 actions per site, 3 sites max")
-        elif args.quick and not args.interactive:
-            suite.smart_config['max_actions_per_url'] = 5
-            suite.smart_config['action_delay_range'] = (0.2, 0.4)  # Fast
-            suite.smart_config['page_load_wait'] = 1.5
-            suite.test_urls = suite.test_urls[:4]  # 4 websites
-            print("⚡ QUICK MODE: 5 actions per site, 4 sites max")
-        
-        # Run tests
-        final_stats = suite.run_regression_tests()
-        
-        # Generate reports
-        reports = suite.generate_reports()
-        
-        # Print final summary matching resume claim
-        print(f"\n🎉 RESUME-READY SUMMARY:")
-        print(f"   Framework: Python-Selenium with POM design")
-        print(f"   Features: Randomized actions, detailed logging, screenshots, multi-format reports")
-        print(f"   Achievement: {final_stats['success_rate']:.0f}% success in regression testing")
-        print(f"   Test Evidence: {reports['html']}")
-        
-        # Ask if user wants to view the HTML report (only if not headless)
-        if not headless_mode:
-            try:
-                view_report = input(f"\n📊 Open HTML report in browser? (y/n): ").strip().lower()
-                if view_report in ['y', 'yes']:
-                    import webbrowser
-                    import os
-                    report_path = os.path.abspath(reports['html'])
-                    webbrowser.open(f'file://{report_path}')
-                    print(f"🌐 Report opened in browser: {report_path}")
-            except KeyboardInterrupt:
-                pass
-        else:
-            # In headless mode, show where report is located
-            import os
-            report_path = os.path.abspath(reports['html'])
-            print(f"\n📊 HTML Report saved at: {report_path}")
-            print(f"📁 Open this file in your browser to view results")
-        
-    except KeyboardInterrupt:
-        print("\n⚠️ Test suite interrupted by user")
-    except Exception as e:
-        print(f"\n❌ Test suite failed: {e}")
-        print("\n🔧 TROUBLESHOOTING TIPS:")
-        print("1. Update Chrome: https://www.google.com/chrome/")
-        print("2. Update ChromeDriver: pip install --upgrade webdriver-manager")
-        print("3. Clear cache: Delete ~/.wdm folder (Windows: %USERPROFILE%/.wdm)")
-        print("4. Try visible mode: python main_runner.py --visible")
-    finally:
-        suite.cleanup()
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Enhanced QA-Monkey Regression Test Runner
+Supports the resume claim: "achieving 92% success in regression testing"
+"""
+
+import os
+import sys
+import argparse
+from action_trace import load_trace, replay_settings
+from regression_test_suite import RegressionTestSuite
+from scheduler import parse_duration
+
+def get_custom_websites():
+    """Get custom websites from user input"""
+    print("\n🌐 CUSTOM WEBSITE TESTING")
+    print("=" * 50)
+    
+    # Ask how many websites to test
+    while True:
+        try:
+            max_sites = int(input("How many websites do you want to test? (1-20): "))
+            if 1 <= max_sites <= 20:
+                break
+            else:
+                print("❌ Please enter a number between 1 and 20")
+        except ValueError:
+            print("❌ Please enter a valid number")
+    
+    websites = []
+    
+    print(f"\nEnter {max_sites} websites to test:")
+    print("Example: google.com (https:// will be added automatically)")
+    
+    for i in range(max_sites):
+        while True:
+            website = input(f"Website {i + 1}/{max_sites}: ").strip()
+            
+            if website:
+                # Add https:// if not present
+                if not website.startswith(('http://', 'https://')):
+                    website = 'https://' + website
+                    
+                websites.append(website)
+                print(f"✅ Added: {website}")
+                break
+            else:
+                print("❌ Please enter a website URL")
+    
+    print(f"\n📋 Will test {len(websites)} websites:")
+    for i, site in enumerate(websites, 1):
+        print(f"   {i}. {site}")
+    
+    return websites
+
+def choose_test_mode():
+    """Let user choose test mode - optimized for speed"""
+    print("\n⚡ SELECT TEST MODE (All modes run in HEADLESS for speed)")
+    print("=" * 60)
+    print("1. Lightning (2 actions per site) - ~10 seconds per site")
+    print("2. Quick (5 actions per site) - ~20 seconds per site") 
+    print("3. Standard (8 actions per site) - ~30 seconds per site")
+    print("4. Extended (12 actions per site) - ~45 seconds per site")
+    print("5. Custom (specify number of actions)")
+    
+    while True:
+        try:
+            choice = input("\nEnter choice (1-5): ").strip()
+            
+            if choice == '1':
+                return 2, "Lightning", 0.3  # actions, name, delay
+            elif choice == '2':
+                return 5, "Quick", 0.5
+            elif choice == '3':
+                return 8, "Standard", 0.7
+            elif choice == '4':
+                return 12, "Extended", 1.0
+            elif choice == '5':
+                while True:
+                    try:
+                        actions = int(input("Enter number of actions per website (1-25): "))
+                        if 1 <= actions <= 25:
+                            delay = min(1.0, actions * 0.1)  # Dynamic delay based on actions
+                            return actions, f"Custom ({actions} actions)", delay
+                        else:
+                            print("❌ Please enter a number between 1 and 25")
+                    except ValueError:
+                        print("❌ Please enter a valid number")
+            else:
+                print("❌ Please enter 1, 2, 3, 4, or 5")
+                
+        except (ValueError, KeyboardInterrupt):
+            print("\n❌ Invalid input. Please try again.")
+
+def build_url_source(args):
+    """Lazy URL stream from --urls-file and --crawl so testing starts before the list is complete
+
+    Returns (urls, crawler); the crawler (None without --crawl) must be stopped when the run ends.
+    """
+    from url_sources import UrlFilter, SiteCrawler, iter_urls_file, chain_unique
+    
+    url_filter = UrlFilter(args.include, args.exclude)
+    sources = []
+    crawler = None
+    if args.urls_file:
+        sources.append(iter_urls_file(args.urls_file, url_filter))
+        print(f"📄 Streaming URLs from {args.urls_file}")
+    if args.crawl:
+        crawler = SiteCrawler(args.crawl, max_depth=args.crawl_depth, max_pages=args.crawl_max_pages,
+                              url_filter=url_filter).start()
+        sources.append(crawler)
+        print(f"🕸️  Crawling {', '.join(args.crawl)} (depth {args.crawl_depth}, "
+              f"max {args.crawl_max_pages} pages, robots.txt respected)")
+    return chain_unique(*sources), crawler
+
+def save_partial_results(suite):
+    """Write a checkpoint and reports for whatever ran before an interrupt or crash"""
+    if not suite.logger:
+        return
+    try:
+        suite.save_checkpoint(force=True)
+        reports = suite.generate_reports()
+        print(f"📊 Partial report: {os.path.abspath(reports['html'])}")
+        if not suite.multiplexed():
+            print(f"⏯️  Continue with: python main_runner.py --resume {suite.session_id}")
+    except Exception as e:
+        print(f"⚠️ Could not save partial results: {e}")
+
+def write_profile(profiler, suite):
+    """Stop the profiler and write its flamegraph stacks and summary into the report directory"""
+    profiler.stop()
+    try:
+        summary = profiler.write_report(f"reports/{suite.session_id}/profile")
+    except Exception as e:
+        print(f"⚠️ Could not write profile: {e}")
+        return
+    shares = ", ".join(f"{name} {data['percent']}%" for name, data in summary['categories'].items())
+    print(f"🔥 Profile ({summary['samples']} samples): {shares}")
+    print(f"🔥 Flamegraph stacks and top-{len(summary['top_self'])} summary in reports/{suite.session_id}/profile/")
+
+def run_minimizer(args, headless_mode):
+    """Delta-debug a failing trace with parallel browser sessions"""
+    from driver_factory import create_chrome_driver
+    from trace_minimizer import minimize_trace
+    
+    def driver_factory(resource_policy=None):
+        # No fixed debug port so several browsers can run side by side
+        return create_chrome_driver(headless=headless_mode, remote_debugging_port=None,
+                                    resource_policy=resource_policy)
+    
+    try:
+        result = minimize_trace(args.minimize, driver_factory, signature=args.signature, workers=args.workers)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    if not result['reproduced']:
+        print(f"❌ Failure '{result['target_signature']}' did not reproduce from a fresh page load")
+    else:
+        print(f"✅ Reduced {result['original_length']} actions to {result['minimal_length']} "
+              f"reproducing '{result['target_signature']}'")
+        for action in result['minimal_actions']:
+            print(f"   • {action['action_type']}: {action.get('element_info') or action['params']}")
+        print(f"📄 Minimized trace: {result['output_file']}")
+    print(f"🔁 {result['replay_count']} replays, {result['cache_hits']} cache hits, "
+          f"{result['replay_seconds']}s browser time in {result['wall_seconds']}s wall time "
+          f"({result['workers']} workers)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Enhanced QA-Monkey Regression Test Suite")
+    parser.add_argument("--target-rate", type=float, default=92.0,
+                      help="Target success rate percentage (default: 92.0)")
+    parser.add_argument("--super-fast", action="store_true",
+                      help="Super fast mode: 2 actions per site, 3 sites max")
+    parser.add_argument("--quick", action="store_true",
+                      help="Quick mode: 5 actions per site")
+    parser.add_argument("--interactive", action="store_true",
+                      help="Interactive mode to choose websites and settings")
+    parser.add_argument("--visible", action="store_true",
+                      help="Run with visible browser (default: headless for speed)")
+    parser.add_argument("--resource-policy", default="off",
+                      choices=["off", "interaction_only", "no_third_party", "no_media"],
+                      help="Block network resources irrelevant to monkey actions (default: off)")
+    parser.add_argument("--policy-baseline", action="store_true",
+                      help="Also time each page as a full load (readyState complete) without the resource policy to report savings")
+    parser.add_argument("--time-budget", type=parse_duration, default=None, metavar="DURATION",
+                      help="Share a wall-clock budget (e.g. 90s, 5m, 1h) across URLs instead of a fixed action count")
+    parser.add_argument("--no-preflight", action="store_true",
+                      help="Skip the concurrent reachability check of all URLs before testing")
+    parser.add_argument("--fixtures", action="store_true",
+                      help="Test the pages of a local fixture server instead of the default websites")
+    parser.add_argument("--urls-file", metavar="PATH",
+                      help="Test the URLs listed in a file (one per line, streamed and de-duplicated)")
+    parser.add_argument("--crawl", action="append", metavar="URL", default=[],
+                      help="Discover same-origin pages from this start URL (repeatable)")
+    parser.add_argument("--crawl-depth", type=int, default=2,
+                      help="Maximum link depth from the crawl start URLs (default: 2)")
+    parser.add_argument("--crawl-max-pages", type=int, default=500,
+                      help="Maximum pages fetched by the crawler (default: 500)")
+    parser.add_argument("--include", action="append", metavar="PATTERN", default=[],
+                      help="Only test URLs matching this glob (or 're:' regex); repeatable")
+    parser.add_argument("--exclude", action="append", metavar="PATTERN", default=[],
+                      help="Skip URLs matching this glob (or 're:' regex); repeatable")
+    parser.add_argument("--tabs", type=int, default=1, metavar="K",
+                      help="Interleave URLs across K tabs of one browser, acting in one while others load (default: 1)")
+    parser.add_argument("--isolate-tabs", action="store_true",
+                      help="With --tabs, give each tab its own browser context (separate cookies and storage)")
+    parser.add_argument("--wait-backend", default="events", choices=["events", "polling"],
+                      help="Resolve waits from in-page load/DOM/network events, or poll like WebDriverWait (default: events)")
+    parser.add_argument("--navigation-guard", default="block", choices=["block", "record", "off"],
+                      help="Cancel actions that would leave the site: block them or record them as 'would navigate' (default: block)")
+    parser.add_argument("--no-restore", action="store_true",
+                      help="Keep testing wherever same-origin navigations lead instead of returning to the start page")
+    parser.add_argument("--burst", type=int, default=1, metavar="N",
+                      help="Batch up to N safe scroll/key/hover actions into one browser call (default: 1, off)")
+    parser.add_argument("--hostile-rate", type=float, default=0.0, metavar="P",
+                      help="Share of typed values that are boundary, unicode, very long or injection strings "
+                           "(default: 0, off; only for sites you are allowed to attack)")
+    parser.add_argument("--metrics-port", type=int, default=None, metavar="PORT",
+                      help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics (0 picks a free port)")
+    parser.add_argument("--progress", action="store_true",
+                      help="Append live progress snapshots to logs/<session>/progress.jsonl")
+    parser.add_argument("--trace-spans", action="store_true",
+                      help="Write session/visit/action/WebDriver command spans to logs/<session>/spans.json (Perfetto)")
+    parser.add_argument("--profile", action="store_true",
+                      help="Sample the framework's own stacks; writes collapsed stacks and a summary of WebDriver I/O vs Python time to reports/<session>/profile/")
+    parser.add_argument("--profile-interval", type=float, default=5, metavar="MS",
+                      help="Sampling interval for --profile in milliseconds (default: 5)")
+    parser.add_argument("--resume", metavar="SESSION_ID",
+                      help="Continue an interrupted session from its last checkpoint (logs/<session>/checkpoint.json)")
+    parser.add_argument("--seed", type=int, default=None,
+                      help="Seed for all random choices (default: random, printed at start)")
+    parser.add_argument("--replay", metavar="TRACE",
+                      help="Replay a recorded action trace (logs/<session>/action_trace.jsonl) at full speed")
+    parser.add_argument("--minimize", metavar="TRACE",
+                      help="Shrink a failing trace to the shortest action sequence that still reproduces it")
+    parser.add_argument("--signature", default=None,
+                      help="Error signature to reproduce when minimizing (default: last failure in the trace)")
+    parser.add_argument("--workers", type=int, default=2,
+                      help="Parallel browser sessions used by --minimize (default: 2)")
+    
+    args = parser.parse_args()
+    
+    # Force headless by default for speed (opposite of original)
+    headless_mode = not args.visible
+    
+    # Display banner
+    print("""
+╔══════════════════════════════════════════════════════════════╗
+║              ENHANCED QA-MONKEY TEST SUITE                   ║
+║         Python-Selenium with POM Design Pattern             ║
+║                                                              ║
+║  🎯 Target Success Rate: {:.1f}%                           ║
+║  🐒 Randomized User Actions with Smart Selection            ║
+║  📊 Multi-Format Reports (HTML/JSON/CSV)                   ║
+║  📸 Automatic Error Screenshots                            ║
+║  📝 Detailed Structured Logging                            ║
+║  ⚡ SPEED OPTIMIZED - HEADLESS BY DEFAULT                  ║
+║  🚀 NEW: Super Fast Mode & Website Count Selection         ║
+╚══════════════════════════════════════════════════════════════╝
+    """.format(args.target_rate))
+    
+    if args.minimize:
+        run_minimizer(args, headless_mode)
+        return
+    
+    # Initialize test suite
+    suite = RegressionTestSuite(target_success_rate=args.target_rate, seed=args.seed)
+    suite.smart_config['resource_policy'] = args.resource_policy
+    suite.smart_config['measure_policy_baseline'] = args.policy_baseline
+    suite.time_budget = args.time_budget
+    suite.smart_config['preflight'] = not args.no_preflight
+    suite.smart_config['tabs'] = args.tabs
+    suite.smart_config['isolate_tabs'] = args.isolate_tabs
+    suite.smart_config['wait_backend'] = args.wait_backend
+    suite.smart_config['navigation_guard'] = args.navigation_guard
+    suite.smart_config['restore_navigations'] = not args.no_restore
+    suite.smart_config['burst_size'] = max(1, args.burst)
+    suite.smart_config['hostile_input_rate'] = args.hostile_rate
+    suite.smart_config['metrics_port'] = args.metrics_port
+    suite.smart_config['progress_stream'] = args.progress
+    suite.smart_config['span_trace'] = args.trace_spans
+    
+    fixture_server = None
+    url_crawler = None
+    if args.fixtures:
+        from fixture_server import FixtureServer
+        fixture_server = FixtureServer().start()
+        suite.test_urls = fixture_server.urls()
+        print(f"🧪 Fixture server on {fixture_server.base_url}")
+    
+    custom_sources = bool(args.urls_file or args.crawl)
+    if custom_sources:
+        suite.test_urls, url_crawler = build_url_source(args)
+        if not args.urls_file:
+            # Crawled pages were just fetched successfully - no need to check them again
+            suite.smart_config['preflight'] = False
+    if args.replay:
+        # A replay re-executes an existing trace rather than recording a new one
+        suite.smart_config['record_trace'] = False
+        # ...with the navigation guard settings it was recorded with
+        suite.smart_config.update(replay_settings(load_trace(args.replay)[0]))
+    
+    # Interactive mode
+    if args.interactive and not args.replay and not args.fixtures and not custom_sources and not args.resume:
+        # Get custom websites with count selection
+        custom_websites = get_custom_websites()
+        suite.test_urls = custom_websites
+        
+        # Choose test mode with speed optimization
+        max_actions, mode_name, action_delay = choose_test_mode()
+        suite.smart_config['max_actions_per_url'] = max_actions
+        suite.smart_config['action_delay_range'] = (action_delay, action_delay + 0.2)  # Faster delays
+        suite.smart_config['page_load_wait'] = 1.5  # Faster page load wait
+        
+        print(f"\n🚀 STARTING {mode_name.upper()} TEST")
+        print(f"🎯 Target Success Rate: {args.target_rate}%")
+        print(f"🌐 Testing {len(suite.test_urls)} websites")
+        print(f"⚡ {max_actions} actions per website")
+        print(f"👁️  Mode: {'Visible Browser' if args.visible else 'Headless (Fast)'}")
+        if args.time_budget:
+            print(f"⏱️  Time budget: {args.time_budget / 60:.1f} minutes (actions per website decided by the scheduler)")
+        else:
+            print(f"⏱️  Estimated time: ~{len(suite.test_urls) * max_actions * action_delay / 60:.1f} minutes")
+        
+        input("\nPress Enter to start testing...")
+    else:
+        # Set default fast configuration for non-interactive mode
+        suite.smart_config['page_load_wait'] = 1.5
+        suite.smart_config['action_delay_range'] = (0.3, 0.5)
+    
+    if args.resume:
+        if args.tabs > 1:
+            print("❌ --resume cannot be combined with --tabs: tab-multiplexed runs are not checkpointed")
+            return
+        # URLs, budget and settings come from the checkpoint; streamed sources must be passed again
+        try:
+            suite.load_checkpoint(args.resume)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            return
+    
+    profiler = None
+    if args.profile:
+        from profiler import SamplingProfiler
+        profiler = SamplingProfiler(interval=args.profile_interval / 1000).start()
+    
+    try:
+        # Setup with headless by default
+        suite.setup(headless=headless_mode)
+        
+        if args.replay:
+            suite.replay_trace(args.replay)
+            reports = suite.generate_reports()
+            print(f"\n📊 Replay report: {os.path.abspath(reports['html'])}")
+            return
+        
+        # Adjust for quick test modes (if not in interactive mode)
+        if args.resume:
+            pass  # The checkpoint already carries the speed settings of the original run
+        elif args.super_fast and not args.interactive:
+            suite.smart_config['max_actions_per_url'] = 2
+            suite.smart_config['action_delay_range'] = (0.1, 0.3)  # Ultra fast
+            suite.smart_config['page_load_wait'] = 1
+            if not custom_sources:
+                suite.test_urls = suite.test_urls[:3]  # Only 3 websites
+            print("⚡ SUPER FAST MODE: 2 actions per site" + ("" if custom_sources else ", 3 sites max"))
+        elif args.quick and not args.interactive:
+            suite.smart_config['max_actions_per_url'] = 5
+            suite.smart_config['action_delay_range'] = (0.2, 0.4)  # Fast
+            suite.smart_config['page_load_wait'] = 1.5
+            if not custom_sources:
+                suite.test_urls = suite.test_urls[:4]  # 4 websites
+            print("⚡ QUICK MODE: 5 actions per site" + ("" if custom_sources else ", 4 sites max"))
+        
+        # Run tests
+        final_stats = suite.run_regression_tests()
+        
+        # Generate reports
+        reports = suite.generate_reports()
+        
+        # Print final summary matching resume claim
+        print(f"\n🎉 RESUME-READY SUMMARY:")
+        print(f"   Framework: Python-Selenium with POM design")
+        print(f"   Features: Randomized actions, detailed logging, screenshots, multi-format reports")
+        print(f"   Achievement: {final_stats['success_rate']:.0f}% success in regression testing")
+        print(f"   Test Evidence: {reports['html']}")
+        
+        # Ask if user wants to view the HTML report (only if not headless)
+        if not headless_mode:
+            try:
+                view_report = input(f"\n📊 Open HTML report in browser? (y/n): ").strip().lower()
+                if view_report in ['y', 'yes']:
+                    import webbrowser
+                    import os
+                    report_path = os.path.abspath(reports['html'])
+                    webbrowser.open(f'file://{report_path}')
+                    print(f"🌐 Report opened in browser: {report_path}")
+            except KeyboardInterrupt:
+                pass
+        else:
+            # In headless mode, show where report is located
+            import os
+            report_path = os.path.abspath(reports['html'])
+            print(f"\n📊 HTML Report saved at: {report_path}")
+            print(f"📁 Open this file in your browser to view results")
+        
+    except KeyboardInterrupt:
+        print("\n⚠️ Test suite interrupted by user")
+        save_partial_results(suite)
+    except Exception as e:
+        print(f"\n❌ Test suite failed: {e}")
+        save_partial_results(suite)
+        print("\n🔧 TROUBLESHOOTING TIPS:")
+        print("1. Update Chrome: https://www.google.com/chrome/")
+        print("2. Update ChromeDriver: pip install --upgrade webdriver-manager")
+        print("3. Clear cache: Delete ~/.wdm folder (Windows: %USERPROFILE%/.wdm)")
+        print("4. Try visible mode: python main_runner.py --visible")
+    finally:
+        if profiler:
+            write_profile(profiler, suite)
+        suite.cleanup()
+        # A run ended by the budget, an interrupt or open circuits leaves the crawler fetching otherwise
+        if url_crawler:
+            url_crawler.stop()
+        if fixture_server:
+            fixture_server.stop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
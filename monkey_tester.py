@@ -1,308 +1,623 @@
-import random
-import time
-from datetime import datetime
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import *
-import logging
-
-from base_page import BasePage
-from pages.login_page import LoginPage
-from pages.search_page import SearchPage
-
-logger = logging.getLogger(__name__)
-
-class EnhancedMonkeyTester:
-    """Enhanced Monkey Tester using Page Object Model"""
-    
-    def __init__(self, driver, enhanced_logger, screenshot_manager):
-        self.driver = driver
-        self.logger = enhanced_logger
-        self.screenshot_manager = screenshot_manager
-        self.current_page = None
-        self.action_weights = {
-            'click': 0.35,
-            'input': 0.25,
-            'scroll': 0.20,
-            'hover': 0.15,
-            'keypress': 0.05
-        }
-    
-    def initialize_page_object(self, url):
-        """Initialize appropriate page object based on URL"""
-        try:
-            if 'login' in url.lower() or 'signin' in url.lower():
-                self.current_page = LoginPage(self.driver)
-                logger.info("Initialized LoginPage object")
-            elif 'google' in url.lower() or 'search' in url.lower():
-                self.current_page = SearchPage(self.driver)
-                logger.info("Initialized SearchPage object")
-            else:
-                self.current_page = BasePage(self.driver)
-                logger.info("Initialized BasePage object")
-                
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize page object: {e}")
-            return False
-    
-    def perform_page_specific_actions(self, url):
-        """Perform page-specific actions using POM"""
-        if not self.current_page:
-            return False
-        
-        page_actions_performed = False
-        
-        try:
-            # Login page specific actions
-            if isinstance(self.current_page, LoginPage):
-                if random.choice([True, False]):  # 50% chance
-                    result = self.current_page.login("test_user", "test_password")
-                    self.logger.log_page_action("LoginPage", "login", result)
-                    page_actions_performed = True
-                    
-                if random.choice([True, False]):  # 50% chance
-                    result = self.current_page.click_signup()
-                    self.logger.log_page_action("LoginPage", "click_signup", result)
-                    page_actions_performed = True
-            
-            # Search page specific actions
-            elif isinstance(self.current_page, SearchPage):
-                search_queries = ["selenium testing", "automation", "python", "QA testing", "web scraping"]
-                query = random.choice(search_queries)
-                result = self.current_page.search(query)
-                self.logger.log_page_action("SearchPage", f"search({query})", result)
-                page_actions_performed = True
-                
-                # Wait and check results
-                if result:
-                    time.sleep(2)
-                    count = self.current_page.get_search_results_count()
-                    logger.info(f"Search returned {count} results")
-            
-        except Exception as e:
-            logger.error(f"Page-specific action failed: {e}")
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_error_screenshot("page_action", str(e), url)
-        
-        return page_actions_performed
-    
-    def perform_random_monkey_action(self, url):
-        """Perform random monkey testing action"""
-        action_type = random.choices(
-            list(self.action_weights.keys()),
-            weights=list(self.action_weights.values())
-        )[0]
-        
-        success = False
-        error_msg = None
-        screenshot_path = None
-        element_info = "unknown"
-        
-        try:
-            if action_type == 'click':
-                success, element_info = self._random_click()
-            elif action_type == 'input':
-                success, element_info = self._random_input()
-            elif action_type == 'scroll':
-                success, element_info = self._random_scroll()
-            elif action_type == 'hover':
-                success, element_info = self._random_hover()
-            elif action_type == 'keypress':
-                success, element_info = self._random_keypress()
-            
-            # Capture screenshot for successful actions (occasionally)
-            if success and random.random() < 0.1:  # 10% chance
-                screenshot_path = self.screenshot_manager.capture_action_screenshot(action_type, url)
-                
-        except Exception as e:
-            success = False
-            error_msg = str(e)
-            screenshot_path = self.screenshot_manager.capture_error_screenshot(action_type, error_msg, url)
-            logger.error(f"Action {action_type} failed: {error_msg}")
-        
-        # Log the action
-        self.logger.log_action(action_type, element_info, success, error_msg, screenshot_path)
-        
-        return success
-    
-    def _random_click(self):
-        """Perform random click action"""
-        if not self.current_page:
-            return False, "No page object"
-        
-        elements = self.current_page.get_clickable_elements()
-        if not elements:
-            return False, "No clickable elements found"
-        
-        element = random.choice(elements)
-        element_info = self._get_element_info(element)
-        
-        try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.2)
-            
-            # Try normal click first
-            try:
-                element.click()
-                return True, element_info
-            except ElementClickInterceptedException:
-                # Fallback to JavaScript click
-                self.driver.execute_script("arguments[0].click();", element)
-                return True, f"{element_info} (JS click)"
-                
-        except Exception as e:
-            return False, f"{element_info} - Error: {str(e)}"
-    
-    def _random_input(self):
-        """Perform random input action"""
-        if not self.current_page:
-            return False, "No page object"
-        
-        elements = self.current_page.get_input_elements()
-        if not elements:
-            return False, "No input elements found"
-        
-        element = random.choice(elements)
-        element_info = self._get_element_info(element)
-        
-        try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.2)
-            
-            # Generate appropriate test data
-            test_data = self._generate_test_data(element)
-            
-            element.clear()
-            element.send_keys(test_data)
-            
-            return True, f"{element_info} = '{test_data}'"
-            
-        except Exception as e:
-            return False, f"{element_info} - Error: {str(e)}"
-    
-    def _random_scroll(self):
-        """Perform random scroll action"""
-        scroll_actions = [
-            ("window.scrollBy(0, 300)", "Scroll down"),
-            ("window.scrollBy(0, -300)", "Scroll up"),
-            ("window.scrollTo(0, 0)", "Scroll to top"),
-            ("window.scrollTo(0, document.body.scrollHeight)", "Scroll to bottom"),
-            ("window.scrollBy(200, 0)", "Scroll right"),
-            ("window.scrollBy(-200, 0)", "Scroll left")
-        ]
-        
-        script, description = random.choice(scroll_actions)
-        
-        try:
-            self.driver.execute_script(script)
-            return True, description
-        except Exception as e:
-            return False, f"{description} - Error: {str(e)}"
-    
-    def _random_hover(self):
-        """Perform random hover action"""
-        if not self.current_page:
-            return False, "No page object"
-        
-        elements = self.current_page.get_clickable_elements()
-        if not elements:
-            return False, "No hoverable elements found"
-        
-        element = random.choice(elements)
-        element_info = self._get_element_info(element)
-        
-        try:
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
-            return True, f"Hover on {element_info}"
-        except Exception as e:
-            return False, f"Hover on {element_info} - Error: {str(e)}"
-    
-    def _random_keypress(self):
-        """Perform random key press action"""
-        keys_to_try = [
-            (Keys.TAB, "Tab"),
-            (Keys.ENTER, "Enter"),
-            (Keys.ESCAPE, "Escape"),
-            (Keys.SPACE, "Space"),
-            (Keys.PAGE_DOWN, "Page Down"),
-            (Keys.PAGE_UP, "Page Up"),
-            (Keys.HOME, "Home"),
-            (Keys.END, "End")
-        ]
-        
-        key, description = random.choice(keys_to_try)
-        
-        try:
-            body = self.driver.find_element("tag name", "body")
-            body.send_keys(key)
-            return True, f"Key press: {description}"
-        except Exception as e:
-            return False, f"Key press: {description} - Error: {str(e)}"
-    
-    def _get_element_info(self, element):
-        """Get descriptive information about an element"""
-        try:
-            tag = element.tag_name
-            element_id = element.get_attribute('id')
-            element_class = element.get_attribute('class')
-            element_text = element.text[:20] if element.text else ""
-            
-            info_parts = [f"<{tag}"]
-            if element_id:
-                info_parts.append(f" id='{element_id}'")
-            if element_class:
-                info_parts.append(f" class='{element_class[:20]}'")
-            info_parts.append(">")
-            
-            if element_text:
-                info_parts.append(f" '{element_text}'")
-            
-            return "".join(info_parts)
-        except:
-            return f"<{element.tag_name}>"
-    
-    def _generate_test_data(self, element):
-        """Generate appropriate test data based on input type"""
-        try:
-            input_type = element.get_attribute('type')
-            placeholder = element.get_attribute('placeholder')
-            name = element.get_attribute('name')
-            
-            # Email inputs
-            if input_type == 'email' or 'email' in (name or '').lower():
-                return f"test{random.randint(1, 999)}@example.com"
-            
-            # Password inputs
-            elif input_type == 'password':
-                return f"TestPass{random.randint(100, 999)}"
-            
-            # Search inputs
-            elif input_type == 'search' or 'search' in (name or '').lower():
-                search_terms = ["automation", "testing", "selenium", "python", "QA"]
-                return random.choice(search_terms)
-            
-            # Number inputs
-            elif input_type == 'number':
-                return str(random.randint(1, 100))
-            
-            # URL inputs
-            elif input_type == 'url':
-                return "https://example.com"
-            
-            # Default text
-            else:
-                text_options = [
-                    f"Test User {random.randint(1, 999)}",
-                    f"Sample Text {random.randint(1, 999)}",
-                    "QA Automation Test",
-                    f"TestData{random.randint(1000, 9999)}",
-                    "Monkey Testing Input"
-                ]
-                return random.choice(text_options)
-                
-        except:
-            return f"TestInput{random.randint(1, 999)}"
\ No newline at end of file
+import random
+import time
+from datetime import datetime
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import *
+import logging
+
+from discovery import DiscoveredElement
+from sampling import ElementSampler
+from data_generator import DataGenerator
+from page_registry import default_registry
+from span_trace import NULL_TRACER
+from pages.login_page import LoginPage
+from pages.search_page import SearchPage
+from js_error_oracle import format_js_error
+from action_trace import CSS_PATH_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+KEYS_TO_TRY = [
+    (Keys.TAB, "Tab"),
+    (Keys.ENTER, "Enter"),
+    (Keys.ESCAPE, "Escape"),
+    (Keys.SPACE, "Space"),
+    (Keys.PAGE_DOWN, "Page Down"),
+    (Keys.PAGE_UP, "Page Up"),
+    (Keys.HOME, "Home"),
+    (Keys.END, "End")
+]
+KEYS_BY_NAME = {description: key for key, description in KEYS_TO_TRY}
+
+SCROLL_ACTIONS = [
+    ("window.scrollBy(0, 300)", "Scroll down"),
+    ("window.scrollBy(0, -300)", "Scroll up"),
+    ("window.scrollTo(0, 0)", "Scroll to top"),
+    ("window.scrollTo(0, document.body.scrollHeight)", "Scroll to bottom"),
+    ("window.scrollBy(200, 0)", "Scroll right"),
+    ("window.scrollBy(-200, 0)", "Scroll left")
+]
+
+BURST_KINDS = ['scroll', 'keypress', 'hover']
+
+# Async script: runs each scroll step in its own try block, then waits one animation frame (when scroll
+# handlers fire) before handing the step the JS errors raised since it started
+BURST_STEP_PRELUDE = """
+var done = arguments[arguments.length - 1], results = [], steps = [], buffer = window.__qaMonkeyErrors;
+function step(run) { steps.push(run); }
+function afterFrame(callback) {
+    var called = false, once = function () { if (!called) { called = true; callback(); } };
+    requestAnimationFrame(function () { setTimeout(once, 0); });
+    setTimeout(once, 100);  // No frames in a hidden tab
+}
+function next(index) {
+    if (index >= steps.length) { done(results); return; }
+    var before = buffer ? buffer.length : 0, result;
+    try { steps[index](); result = {ok: true}; } catch (e) { result = {ok: false, error: String(e)}; }
+    afterFrame(function () {
+        result.errors = buffer ? buffer.splice(before, buffer.length - before) : [];
+        results.push(result);
+        next(index + 1);
+    });
+}
+"""
+
+class EnhancedMonkeyTester:
+    """Enhanced Monkey Tester using Page Object Model"""
+    
+    def __init__(self, driver, enhanced_logger, screenshot_manager, popup_handler=None, perf_probe=None,
+                 js_error_collector=None):
+        self.driver = driver
+        self.logger = enhanced_logger
+        self.screenshot_manager = screenshot_manager
+        self.popup_handler = popup_handler
+        self.perf_probe = perf_probe
+        self.js_error_collector = js_error_collector
+        self.success_screenshot_rate = 0.1
+        self.rng = random.Random()
+        self.trace_recorder = None
+        self.context_tag = None  # Tab/context label when several tabs share one browser
+        self.waiter = None  # Shared EventWaiter handed to page objects
+        self.navigation_guard = None
+        self.start_url = None  # Page the visit started on, restored after actions navigate away
+        self.sampler = ElementSampler()
+        self.data_generator = DataGenerator()  # Shared with the suite's other testers when it sets one
+        self.page_registry = default_registry()
+        self.tracer = NULL_TRACER
+        self.page_url = None
+        self._last_params = {}
+        self.current_page = None
+        self.action_weights = {
+            'click': 0.35,
+            'input': 0.25,
+            'scroll': 0.20,
+            'hover': 0.15,
+            'keypress': 0.05
+        }
+    
+    def initialize_page_object(self, url):
+        """Initialize the page object the registry matches to the loaded page"""
+        self.sampler.reset()
+        self.page_url = url
+        try:
+            if self.navigation_guard:
+                # The loaded URL after redirects, not the one requested
+                self.start_url = self.driver.current_url or url
+            # One probe of the loaded page scores every registered page object
+            page_class = self.page_registry.classify(self.driver, url)
+            self.current_page = page_class(self.driver, self.popup_handler, self.waiter)
+            logger.info(f"Initialized {page_class.__name__} object")
+                
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize page object: {e}")
+            return False
+    
+    def perform_page_specific_actions(self, url):
+        """Perform page-specific actions using POM"""
+        if not self.current_page:
+            return False
+        
+        page_actions_performed = False
+        
+        try:
+            # Login page specific actions
+            if isinstance(self.current_page, LoginPage):
+                if self.rng.choice([True, False]):  # 50% chance
+                    username, password = self.data_generator.credentials(self.rng)
+                    result = self.current_page.login(username, password)
+                    self.logger.log_page_action("LoginPage", "login", result)
+                    self._trace_page_action(url, "login", [username, password], result)
+                    page_actions_performed = True
+                    
+                if self.rng.choice([True, False]):  # 50% chance
+                    result = self.current_page.click_signup()
+                    self.logger.log_page_action("LoginPage", "click_signup", result)
+                    self._trace_page_action(url, "click_signup", [], result)
+                    page_actions_performed = True
+            
+            # Search page specific actions
+            elif isinstance(self.current_page, SearchPage):
+                query = self.data_generator.search_query(self.rng)
+                result = self.current_page.search(query)
+                self.logger.log_page_action("SearchPage", f"search({query})", result)
+                self._trace_page_action(url, "search", [query], result)
+                page_actions_performed = True
+                
+                # Wait and check results
+                if result:
+                    if self.waiter:
+                        self.waiter.settle(2)
+                    else:
+                        time.sleep(2)
+                    count = self.current_page.get_search_results_count()
+                    logger.info(f"Search returned {count} results")
+            
+            # Page objects registered through entry points bring their own flows
+            else:
+                page_actions_performed = self.current_page.monkey_actions(self, url)
+            
+        except Exception as e:
+            logger.error(f"Page-specific action failed: {e}")
+            if self.screenshot_manager:
+                self.screenshot_manager.capture_error_screenshot("page_action", str(e), url)
+        
+        return page_actions_performed
+    
+    def perform_random_monkey_action(self, url):
+        """Perform random monkey testing action"""
+        action_type = self.rng.choices(
+            list(self.action_weights.keys()),
+            weights=list(self.action_weights.values())
+        )[0]
+        
+        success = False
+        error_msg = None
+        screenshot_path = None
+        element_info = "unknown"
+        
+        try:
+            if action_type == 'click':
+                success, element_info = self._random_click()
+            elif action_type == 'input':
+                success, element_info = self._random_input()
+            elif action_type == 'scroll':
+                success, element_info = self._random_scroll()
+            elif action_type == 'hover':
+                success, element_info = self._random_hover()
+            elif action_type == 'keypress':
+                success, element_info = self._random_keypress()
+            
+            # Capture screenshot for successful actions (occasionally)
+            if success and self.rng.random() < self.success_screenshot_rate:
+                screenshot_path = self.screenshot_manager.capture_action_screenshot(action_type, url)
+                
+        except Exception as e:
+            success = False
+            error_msg = str(e)
+            screenshot_path = self.screenshot_manager.capture_error_screenshot(action_type, error_msg, url)
+            logger.error(f"Action {action_type} failed: {error_msg}")
+        
+        # Log the action (JS errors raised by the action can still fail it)
+        return self.record_action(action_type, element_info, success, error_msg, screenshot_path, url)
+    
+    def record_action(self, action_type, element_info, success, error_msg=None, screenshot_path=None, url=None,
+                      measure=True, js_errors=None, extra=None):
+        """Attach post-action measurements and log the action result
+
+        measure=False logs a burst step without its own round trips; js_errors are the errors
+        already attributed to it.
+        """
+        details = {'tab': self.context_tag} if self.context_tag else {}
+        details.update(extra or {})
+        
+        # New application JS errors turn an otherwise clean action into a failure
+        if self.js_error_collector:
+            js_errors = list(js_errors or [])
+            if measure:
+                js_errors += self.js_error_collector.drain()
+            if js_errors:
+                details['js_errors'] = js_errors
+                if success:
+                    success = False
+                    error_msg = format_js_error(js_errors[0])
+                    if not screenshot_path and self.screenshot_manager:
+                        screenshot_path = self.screenshot_manager.capture_error_screenshot(
+                            action_type, error_msg, url)
+                logger.warning(f"Action {action_type} triggered {len(js_errors)} JS error(s): "
+                               f"{format_js_error(js_errors[0])}")
+        
+        if measure and self.perf_probe:
+            perf = self.perf_probe.collect()
+            if perf:
+                details['perf'] = perf
+                details['perf_failure'] = self.perf_probe.is_slow(perf)
+        
+        # Last, so errors and metrics above still belong to the page the action ran on
+        if measure and self.navigation_guard:
+            navigation = self.navigation_guard.after_action(self.start_url or url)
+            if navigation:
+                details['navigation'] = navigation
+                element_info = self.navigation_guard.would_navigate_info(element_info, navigation)
+        
+        self.logger.log_action(action_type, element_info, success, error_msg, screenshot_path, url, **details)
+        if self.tracer.enabled:
+            self.tracer.annotate(action_type=action_type, url=url, element=str(element_info)[:120],
+                                 outcome='success' if success else 'failure',
+                                 error_signature=self.logger.test_results[-1].get('error_signature'))
+        
+        if self.trace_recorder:
+            self.trace_recorder.record_action(url, action_type, self._last_params, success, element_info,
+                                              self.logger.test_results[-1].get('error_signature'))
+        self._last_params = {}
+        return success
+    
+    def replay_action(self, action_type, params, url=None):
+        """Re-execute a recorded action directly from its trace parameters"""
+        if action_type == 'page_action':
+            return self._replay_page_action(params)
+        
+        self._last_params = dict(params)
+        error_msg = None
+        screenshot_path = None
+        element_info = params.get('locator', action_type)
+        # Elements inside iframes/shadow roots are re-resolved by address rather than CSS locator
+        target = DiscoveredElement.from_address(self.driver, params['target']) if params.get('target') else None
+        
+        try:
+            if action_type == 'scroll':
+                success, element_info = self._execute_scroll(params['script'], params.get('description', 'Scroll'))
+            elif action_type == 'keypress':
+                success, element_info = self._execute_keypress(params['key'])
+            else:
+                if target:
+                    element = target.activate()
+                else:
+                    element = self.driver.find_element(By.CSS_SELECTOR, params['locator'])
+                element_info = self._get_element_info(element)
+                if action_type == 'click':
+                    success, element_info = self._execute_click(element, element_info, params.get('scroll', True))
+                elif action_type == 'hover':
+                    success, element_info = self._execute_hover(element, element_info)
+                elif action_type == 'input':
+                    success, element_info = self._execute_input(element, element_info, params['text'],
+                                                                params.get('scroll', True))
+                else:
+                    raise ValueError(f"Cannot replay action type '{action_type}'")
+        except Exception as e:
+            success = False
+            error_msg = str(e)
+            if self.screenshot_manager:
+                screenshot_path = self.screenshot_manager.capture_error_screenshot(action_type, error_msg, url)
+        finally:
+            if target:
+                target.release()
+        
+        return self.record_action(action_type, element_info, success, error_msg, screenshot_path, url)
+    
+    def _trace_page_action(self, url, method, args, result):
+        """Record page object actions so replays repeat them"""
+        if self.trace_recorder:
+            params = {'page': type(self.current_page).__name__, 'method': method, 'args': args}
+            self.trace_recorder.record_action(url, 'page_action', params, bool(result))
+    
+    def _replay_page_action(self, params):
+        """Repeat a page object method, only on the page object class it was recorded with"""
+        page_name = type(self.current_page).__name__ if self.current_page else None
+        # Traces from before the class was recorded only need the method to exist
+        recorded = params.get('page', page_name)
+        method = getattr(self.current_page, params['method'], None) if self.current_page else None
+        if recorded != page_name or not callable(method):
+            error_msg = f"Cannot replay {recorded or 'page'}.{params['method']} on {page_name or 'no page object'}"
+            logger.warning(error_msg)
+            self.logger.log_page_action(recorded or 'unknown', params['method'], False, error_msg)
+            return False
+        
+        try:
+            result = bool(method(*params.get('args', [])))
+            error_msg = None
+        except Exception as e:
+            result, error_msg = False, str(e)
+        self.logger.log_page_action(page_name, params['method'], result, error_msg)
+        return result
+    
+    def _locator_for(self, element):
+        """CSS path for the trace; skipped entirely when not recording"""
+        if not self.trace_recorder:
+            return None
+        try:
+            return self.driver.execute_script(CSS_PATH_SCRIPT, element)
+        except Exception:
+            return None
+    
+    def _random_click(self):
+        """Perform random click action"""
+        if not self.current_page:
+            return False, "No page object"
+        
+        elements = self._discover('clickable')
+        if not elements:
+            return False, "No clickable elements found"
+        
+        target = self.sampler.choose(elements, self.rng)
+        try:
+            element = target.activate()
+            element_info = target.describe() or self._get_element_info(element)
+            scroll = not target.info.get('in_view')
+            self._last_params = {'locator': self._locator_for(element), 'scroll': scroll, **target.address()}
+            return self._execute_click(element, element_info, scroll)
+        finally:
+            target.release()
+    
+    def _execute_click(self, element, element_info, scroll=True):
+        """Click an element, clearing overlays or falling back to a JS click"""
+        try:
+            # Scroll element into view (discovery already knows when it is)
+            if scroll:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                time.sleep(0.2)
+            
+            # Try normal click first
+            try:
+                element.click()
+                return True, element_info
+            except ElementClickInterceptedException:
+                # Clear the overlay that intercepted the click and retry once
+                if self.popup_handler and self.popup_handler.clear_overlays():
+                    try:
+                        element.click()
+                        return True, f"{element_info} (after overlay dismissal)"
+                    except (ElementClickInterceptedException, StaleElementReferenceException):
+                        pass
+                
+                # Fallback to JavaScript click
+                self.driver.execute_script("arguments[0].click();", element)
+                return True, f"{element_info} (JS click)"
+                
+        except Exception as e:
+            return False, f"{element_info} - Error: {str(e)}"
+    
+    def _random_input(self):
+        """Perform random input action"""
+        if not self.current_page:
+            return False, "No page object"
+        
+        elements = self._discover('inputs')
+        if not elements:
+            return False, "No input elements found"
+        
+        target = self.sampler.choose(elements, self.rng)
+        try:
+            element = target.activate()
+            element_info = target.describe() or self._get_element_info(element)
+            
+            try:
+                # Generate appropriate test data
+                test_data = self._generate_test_data(target)
+            except Exception as e:
+                return False, f"{element_info} - Error: {str(e)}"
+            
+            scroll = not target.info.get('in_view')
+            self._last_params = {'locator': self._locator_for(element), 'text': test_data, 'scroll': scroll,
+                                 **target.address()}
+            return self._execute_input(element, element_info, test_data, scroll)
+        finally:
+            target.release()
+    
+    def _execute_input(self, element, element_info, test_data, scroll=True):
+        """Type test data into an input element"""
+        try:
+            # Scroll element into view (discovery already knows when it is)
+            if scroll:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                time.sleep(0.2)
+            
+            element.clear()
+            element.send_keys(test_data)
+            
+            shown = test_data if len(test_data) <= 60 else f"{test_data[:60]}… ({len(test_data)} chars)"
+            return True, f"{element_info} = '{shown}'"
+            
+        except Exception as e:
+            return False, f"{element_info} - Error: {str(e)}"
+    
+    def _random_scroll(self):
+        """Perform random scroll action"""
+        script, description = self.rng.choice(SCROLL_ACTIONS)
+        self._last_params = {'script': script, 'description': description}
+        
+        return self._execute_scroll(script, description)
+    
+    def _execute_scroll(self, script, description):
+        """Run a scroll script"""
+        try:
+            self.driver.execute_script(script)
+            return True, description
+        except Exception as e:
+            return False, f"{description} - Error: {str(e)}"
+    
+    def _random_hover(self):
+        """Perform random hover action"""
+        if not self.current_page:
+            return False, "No page object"
+        
+        elements = self._discover('clickable')
+        if not elements:
+            return False, "No hoverable elements found"
+        
+        target = self.sampler.choose(elements, self.rng)
+        try:
+            element = target.activate()
+            element_info = target.describe() or self._get_element_info(element)
+            self._last_params = {'locator': self._locator_for(element), **target.address()}
+            return self._execute_hover(element, element_info)
+        finally:
+            target.release()
+    
+    def _execute_hover(self, element, element_info):
+        """Move the pointer over an element"""
+        try:
+            actions = ActionChains(self.driver)
+            actions.move_to_element(element).perform()
+            return True, f"Hover on {element_info}"
+        except Exception as e:
+            return False, f"Hover on {element_info} - Error: {str(e)}"
+    
+    def _random_keypress(self):
+        """Perform random key press action"""
+        key, description = self.rng.choice(KEYS_TO_TRY)
+        self._last_params = {'key': description}
+        
+        return self._execute_keypress(description)
+    
+    def _execute_keypress(self, description):
+        """Send a named key to the page body"""
+        try:
+            body = self.driver.find_element("tag name", "body")
+            body.send_keys(KEYS_BY_NAME[description])
+            return True, f"Key press: {description}"
+        except Exception as e:
+            return False, f"Key press: {description} - Error: {str(e)}"
+    
+    def _discover(self, kind):
+        """Candidate elements of the current page ('clickable' or 'inputs')"""
+        with self.tracer.span('discover', 'discovery', kind=kind) as span:
+            if kind == 'inputs':
+                elements = self.current_page.get_input_elements()
+            else:
+                elements = self.current_page.get_clickable_elements()
+            span.set(found=len(elements) if elements else 0)
+            return elements
+    
+    def perform_safe_burst(self, url, size):
+        """Several low-risk actions of one kind in a single browser call, each logged as its own action"""
+        kind = self.rng.choice(BURST_KINDS)
+        if kind == 'scroll':
+            steps = self._burst_scroll(size)
+        elif kind == 'keypress':
+            steps = self._burst_keys(size)
+        else:
+            steps = self._burst_hover(size)
+        
+        outcomes = []
+        for index, (success, element_info, params, js_errors) in enumerate(steps):
+            self._last_params = params
+            last = index == len(steps) - 1
+            # Errors that surface after the burst (async handlers) are measured once, on its last step
+            outcomes.append(self.record_action(kind, element_info, success, url=url, measure=last,
+                                               js_errors=js_errors, extra={'burst_step': f"{index + 1}/{len(steps)}"}))
+        return outcomes
+    
+    def _burst_scroll(self, size):
+        """Scroll sequence as one JS program with per-step results"""
+        chosen = [self.rng.choice(SCROLL_ACTIONS) for _ in range(size)]
+        program = BURST_STEP_PRELUDE + "".join(f"step(function () {{ {script}; }});\n" for script, _ in chosen)
+        try:
+            results = self.driver.execute_async_script(program + "next(0);")
+        except Exception as e:
+            return [(False, f"{description} - Error: {str(e)}", {'script': script, 'description': description}, None)
+                    for script, description in chosen]
+        
+        steps = []
+        for (script, description), result in zip(chosen, results):
+            params = {'script': script, 'description': description}
+            if result['ok']:
+                steps.append((True, description, params, result['errors']))
+            else:
+                steps.append((False, f"{description} - Error: {result['error']}", params, result['errors']))
+        return steps
+    
+    def _burst_keys(self, size):
+        """Key sequence as one ActionChains perform, aimed at the page body like single key presses"""
+        chosen = [self.rng.choice(KEYS_TO_TRY) for _ in range(size)]
+        try:
+            # Keys go to the focused element: blur so they reach the body rather than a form field
+            self.driver.execute_script("if (document.activeElement) { document.activeElement.blur(); }")
+            actions = ActionChains(self.driver)
+            for key, _ in chosen:
+                actions.key_down(key).key_up(key)
+            actions.perform()
+            return [(True, f"Key press: {description}", {'key': description}, None) for _, description in chosen]
+        except Exception as e:
+            logger.debug(f"Key burst failed, retrying step by step: {e}")
+            steps = []
+            for _, description in chosen:
+                success, element_info = self._execute_keypress(description)
+                steps.append((success, element_info, {'key': description}, None))
+            return steps
+    
+    def _burst_hover(self, size):
+        """Hover chain over in-view top-document elements as one ActionChains perform"""
+        try:
+            candidates = self._discover('clickable') if self.current_page else []
+        except Exception as e:
+            return [(False, f"Hover - Error: {str(e)}", {}, None) for _ in range(size)]
+        candidates = [c for c in candidates if not c.frames]
+        in_view = [c for c in candidates if c.info.get('in_view')]
+        candidates = in_view or candidates
+        if not candidates:
+            # Every requested step counts, so burst accounting matches the size the caller asked for
+            return [(False, "No hoverable elements found", {}, None) for _ in range(size)]
+        
+        steps = [None] * size
+        ready = []
+        for index in range(size):
+            target = self.sampler.choose(candidates, self.rng)
+            try:
+                element = target.activate()
+                info = target.describe() or self._get_element_info(element)
+                ready.append((index, element, info, {'locator': self._locator_for(element), **target.address()}))
+            except Exception as e:
+                # A stale or vanished element fails its own step; the rest of the chain still runs
+                steps[index] = (False, f"Hover - Error: {str(e)}", target.address(), None)
+        if not ready:
+            return steps
+        
+        try:
+            actions = ActionChains(self.driver, duration=0)
+            for _, element, _, _ in ready:
+                actions.move_to_element(element)
+            actions.perform()
+            for index, _, info, params in ready:
+                steps[index] = (True, f"Hover on {info}", params, None)
+        except Exception as e:
+            logger.debug(f"Hover burst failed, retrying step by step: {e}")
+            for index, element, info, params in ready:
+                success, element_info = self._execute_hover(element, info)
+                steps[index] = (success, element_info, params, None)
+        return steps
+    
+    def _get_element_info(self, element):
+        """Get descriptive information about an element"""
+        try:
+            tag = element.tag_name
+            element_id = element.get_attribute('id')
+            element_class = element.get_attribute('class')
+            element_text = element.text[:20] if element.text else ""
+            
+            info_parts = [f"<{tag}"]
+            if element_id:
+                info_parts.append(f" id='{element_id}'")
+            if element_class:
+                info_parts.append(f" class='{element_class[:20]}'")
+            info_parts.append(">")
+            
+            if element_text:
+                info_parts.append(f" '{element_text}'")
+            
+            return "".join(info_parts)
+        except:
+            return f"<{element.tag_name}>"
+    
+    def _generate_test_data(self, target):
+        """Generate appropriate test data for the field from the shared corpora"""
+        info = target.info
+        if not info:
+            # Legacy lookup: nothing captured during discovery, so ask the element once
+            try:
+                info = {name: target.attribute(name) for name in ('type', 'name', 'placeholder')}
+            except Exception:
+                info = {}
+        return self.data_generator.for_field(info, self.rng, self.page_url)
\ No newline at end of file
@@ -0,0 +1,150 @@
+from urllib.parse import urlsplit
+import logging
+
+logger = logging.getLogger(__name__)
+
+GUARD_MODES = ('block', 'record', 'off')
+MAX_BUFFERED_NAVIGATIONS = 50
+
+# Idempotent guard that cancels navigations to other origins and remembers where they went.
+# The Navigation API sees links, forms, location changes and window.open alike; the click and
+# submit listeners cover browsers without it.
+INSTALL_GUARD_SCRIPT = """
+(function (maxEntries) {
+    if (window.__qaMonkeyNav) return;
+    var buffer = window.__qaMonkeyNav = [];
+    window.__qaMonkeyPersisted = false;
+    function push(kind, url) {
+        if (buffer.length < maxEntries) buffer.push({kind: kind, url: String(url).slice(0, 300)});
+    }
+    function offOrigin(url) {
+        try {
+            var target = new URL(url, location.href);
+            return /^https?:$/.test(target.protocol) && target.origin !== location.origin;
+        } catch (e) { return false; }
+    }
+    if (window.navigation && window.navigation.addEventListener) {
+        window.navigation.addEventListener('navigate', function (e) {
+            if (e.cancelable && offOrigin(e.destination.url)) { e.preventDefault(); push('navigate', e.destination.url); }
+        });
+    }
+    document.addEventListener('click', function (e) {
+        var link = e.target && e.target.closest ? e.target.closest('a[href]') : null;
+        if (link && offOrigin(link.href) && !e.defaultPrevented) { e.preventDefault(); push('click', link.href); }
+    }, true);
+    document.addEventListener('submit', function (e) {
+        var form = e.target;
+        if (form && form.action && offOrigin(form.action)) { e.preventDefault(); push('submit', form.action); }
+    }, true);
+    var originalOpen = window.open;
+    window.open = function (url) {
+        if (url && offOrigin(url)) { push('window.open', url); return null; }
+        return originalOpen.apply(window, arguments);
+    };
+    window.addEventListener('pageshow', function (e) { window.__qaMonkeyPersisted = e.persisted; });
+})(%d);
+""" % MAX_BUFFERED_NAVIGATIONS
+
+# Cancelled navigations plus where the tab is now, in one round trip
+DRAIN_SCRIPT = INSTALL_GUARD_SCRIPT + """
+return {blocked: window.__qaMonkeyNav.splice(0, window.__qaMonkeyNav.length), href: location.href};
+"""
+
+# After history.back(): which document we landed on and whether it came out of the bfcache
+RESTORED_SCRIPT = "return {href: location.href, persisted: !!window.__qaMonkeyPersisted};"
+
+
+def document_url(url):
+    """URL without the fragment: two URLs differing only by #hash are the same document"""
+    return (url or '').split('#', 1)[0]
+
+
+def same_origin(url, other):
+    a, b = urlsplit(url or ''), urlsplit(other or '')
+    return (a.scheme, a.netloc) == (b.scheme, b.netloc)
+
+
+class NavigationGuard:
+    """Keeps monkey actions on the site under test and puts the tab back where the visit started"""
+
+    def __init__(self, driver, mode='block', restore=True):
+        if mode not in GUARD_MODES:
+            raise ValueError(f"Unknown navigation guard mode '{mode}' (choose from {', '.join(GUARD_MODES)})")
+        self.driver = driver
+        self.mode = mode
+        self.restore_navigations = restore
+        self.stats = {'blocked': 0, 'escaped': 0, 'restored_bfcache': 0, 'restored_history': 0,
+                      'restored_reload': 0}
+
+    @property
+    def enabled(self):
+        return self.mode != 'off'
+
+    def install(self):
+        """Install the guard ahead of page scripts on every new document"""
+        if not self.enabled or not hasattr(self.driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': INSTALL_GUARD_SCRIPT})
+            return True
+        except Exception as e:
+            logger.debug(f"Could not pre-install navigation guard: {e}")
+            return False
+
+    def after_action(self, start_url):
+        """Collect cancelled off-origin navigations and restore the visit's start page if the action left it
+
+        Returns the details to log with the action.
+        """
+        details = {}
+        if not self.enabled or not start_url:
+            return details
+        try:
+            state = self.driver.execute_script(DRAIN_SCRIPT) or {}
+        except Exception as e:
+            logger.debug(f"Navigation guard drain failed: {e}")
+            return details
+
+        blocked = state.get('blocked') or []
+        if blocked:
+            self.stats['blocked'] += len(blocked)
+            key = 'would_navigate' if self.mode == 'record' else 'blocked_navigation'
+            details[key] = [entry['url'] for entry in blocked]
+
+        href = state.get('href')
+        if href and document_url(href) != document_url(start_url):
+            if not same_origin(href, start_url):
+                # Not cancellable in the page (e.g. a server-side redirect): never test someone else's site
+                self.stats['escaped'] += 1
+                details['escaped_to'] = href
+                details['restored'] = self.restore(start_url)
+            elif self.restore_navigations:
+                details['navigated_to'] = href
+                details['restored'] = self.restore(start_url)
+        return details
+
+    def restore(self, start_url):
+        """Return to start_url via history (instant when bfcache-eligible); reload only as a last resort"""
+        try:
+            self.driver.back()
+            state = self.driver.execute_script(RESTORED_SCRIPT) or {}
+            if document_url(state.get('href')) == document_url(start_url):
+                method = 'bfcache' if state.get('persisted') else 'history'
+                self.stats[f'restored_{method}'] += 1
+                return method
+        except Exception as e:
+            logger.debug(f"History restore failed: {e}")
+
+        try:
+            self.driver.get(start_url)
+        except Exception as e:
+            logger.warning(f"Could not restore {start_url}: {e}")
+            return 'failed'
+        self.stats['restored_reload'] += 1
+        return 'reload'
+
+    def would_navigate_info(self, element_info, details):
+        """Action description for record mode: the click stands in for the navigation it would cause"""
+        if self.mode == 'record' and details.get('would_navigate'):
+            return f"{element_info} → would navigate to {details['would_navigate'][0]}"
+        return element_info
\ No newline at end of file
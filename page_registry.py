@@ -0,0 +1,136 @@
+import re
+import logging
+from urllib.parse import urlsplit
+
+from base_page import BasePage
+from pages.login_page import LoginPage
+from pages.search_page import SearchPage
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'qa_monkey.pages'
+MIN_SCORE = 3  # Below this the page is treated as a plain BasePage; one weak signal (a header search box) is not enough
+URL_HINT_WEIGHT = 1  # URL keywords only tip the balance, page content decides
+MAX_CACHED_PATTERNS = 2000
+
+# Visible matches per selector (capped), for every registered signature in one round trip
+PROBE_SCRIPT = """
+var selectors = arguments[0], counts = {};
+selectors.forEach(function (selector) {
+    var visible = 0, nodes;
+    try { nodes = document.querySelectorAll(selector); } catch (e) { counts[selector] = 0; return; }
+    for (var i = 0; i < nodes.length && i < 20 && visible < 3; i++) {
+        var rect = nodes[i].getBoundingClientRect();
+        if (rect.width && rect.height) visible++;
+    }
+    counts[selector] = visible;
+});
+return counts;
+"""
+
+# Path segments that are IDs rather than structure: numbers, hex hashes, UUIDs, long slugs with digits
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-f]{8,}|[0-9a-f]{8}-[0-9a-f-]{27,}|(?=.*\d)[\w-]{16,})$', re.I)
+
+
+def url_pattern(url):
+    """Host plus path with ID-like segments wildcarded: /users/42/edit and /users/7/edit share a pattern"""
+    parts = urlsplit(url or '')
+    segments = [('*' if _ID_SEGMENT.match(segment) else segment) for segment in parts.path.split('/') if segment]
+    return f"{parts.netloc}/{'/'.join(segments)}"
+
+
+def _entry_points(group):
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python 3.7
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            return []
+    found = entry_points()
+    if hasattr(found, 'select'):
+        return list(found.select(group=group))
+    return list(found.get(group, []))
+
+
+class PageRegistry:
+    """Page object classes scored against the loaded page by their DETECTION_SIGNATURES"""
+
+    def __init__(self, page_classes=None):
+        self.page_classes = []
+        self.cache = {}  # URL pattern -> page class
+        self.stats = {'probes': 0, 'cache_hits': 0, 'classified': {}}
+        for page_class in page_classes or []:
+            self.register(page_class)
+
+    def register(self, page_class):
+        """Add a BasePage subclass; later registrations win ties"""
+        if not (isinstance(page_class, type) and issubclass(page_class, BasePage)):
+            raise TypeError(f"{page_class!r} is not a BasePage subclass")
+        if page_class not in self.page_classes:
+            self.page_classes.append(page_class)
+            self.cache.clear()
+        return page_class
+
+    def load_entry_points(self, group=ENTRY_POINT_GROUP):
+        """Register page objects other packages expose under the entry point group"""
+        loaded = 0
+        for entry_point in _entry_points(group):
+            try:
+                self.register(entry_point.load())
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Could not load page object entry point {entry_point.name}: {e}")
+        return loaded
+
+    def score(self, page_class, counts, url):
+        score = sum(weight for selector, weight in page_class.DETECTION_SIGNATURES if counts.get(selector))
+        if any(keyword in url.lower() for keyword in page_class.URL_KEYWORDS):
+            score += URL_HINT_WEIGHT
+        return score
+
+    def classify(self, driver, url):
+        """Best-scoring page class for the page loaded from url (cached per URL pattern)"""
+        pattern = url_pattern(url)
+        page_class = self.cache.get(pattern)
+        if page_class is not None:
+            self.stats['cache_hits'] += 1
+            return page_class
+
+        selectors = sorted({selector for cls in self.page_classes for selector, _ in cls.DETECTION_SIGNATURES})
+        counts = {}
+        if selectors:
+            try:
+                counts = driver.execute_script(PROBE_SCRIPT, selectors) or {}
+                self.stats['probes'] += 1
+            except Exception as e:
+                # Don't cache a guess made without looking at the page
+                logger.debug(f"Page classification probe failed: {e}")
+                return BasePage
+
+        page_class, best = BasePage, None
+        for candidate in self.page_classes:
+            score = self.score(candidate, counts, url)
+            if score >= MIN_SCORE and (best is None or score >= best):
+                page_class, best = candidate, score
+
+        if len(self.cache) >= MAX_CACHED_PATTERNS:
+            self.cache.clear()
+        self.cache[pattern] = page_class
+        classified = self.stats['classified']
+        classified[page_class.__name__] = classified.get(page_class.__name__, 0) + 1
+        return page_class
+
+
+_default_registry = None
+
+
+def default_registry():
+    """Shared registry with the built-in page objects plus any installed through entry points"""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = PageRegistry([LoginPage, SearchPage])
+        loaded = _default_registry.load_entry_points()
+        if loaded:
+            logger.info(f"Registered {loaded} page object(s) from '{ENTRY_POINT_GROUP}' entry points")
+    return _default_registry
\ No newline at end of file
@@ -1,8 +1,8 @@
-"""
-Page Object Model classes for enhanced QA-Monkey framework
-"""
-
-from .login_page import LoginPage
-from .search_page import SearchPage
-
+"""
+Page Object Model classes for enhanced QA-Monkey framework
+"""
+
+from .login_page import LoginPage
+from .search_page import SearchPage
+
 __all__ = ['LoginPage', 'SearchPage']
\ No newline at end of file
@@ -0,0 +1,143 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Idempotent observer setup; buffered observers also pick up entries recorded
+# before injection, and the CDP hook installs it ahead of page scripts
+INSTALL_OBSERVERS_SCRIPT = """
+(function () {
+    if (window.__qaMonkeyPerf) return;
+    var state = window.__qaMonkeyPerf = {lcp: null, cls: 0, longTasks: [], observers: []};
+    function observe(type, onEntry) {
+        try {
+            var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(onEntry); });
+            observer.observe({type: type, buffered: true});
+            state.observers.push({observer: observer, onEntry: onEntry});
+        } catch (e) {}
+    }
+    observe('largest-contentful-paint', function (e) { state.lcp = e.renderTime || e.loadTime || e.startTime; });
+    observe('layout-shift', function (e) { if (!e.hadRecentInput) state.cls += e.value; });
+    observe('longtask', function (e) { state.longTasks.push(Math.round(e.duration)); });
+})();
+"""
+
+COLLECT_SCRIPT = INSTALL_OBSERVERS_SCRIPT + """
+var state = window.__qaMonkeyPerf, includeNavigation = arguments[0];
+// Flush entries the observers have not delivered yet
+state.observers.forEach(function (o) { o.observer.takeRecords().forEach(o.onEntry); });
+
+var longTasks = state.longTasks.splice(0, state.longTasks.length);
+var metrics = {
+    lcp_ms: state.lcp === null ? null : Math.round(state.lcp),
+    cls: Math.round(state.cls * 1000) / 1000,
+    long_tasks: longTasks.length,
+    long_task_max_ms: longTasks.length ? Math.max.apply(null, longTasks) : 0,
+    long_task_total_ms: longTasks.reduce(function (a, b) { return a + b; }, 0),
+    js_heap_mb: performance.memory ? Math.round(performance.memory.usedJSHeapSize / 1048576 * 10) / 10 : null
+};
+
+if (includeNavigation) {
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        metrics.ttfb_ms = Math.round(nav.responseStart - nav.startTime);
+        metrics.dom_content_loaded_ms = Math.round(nav.domContentLoadedEventEnd - nav.startTime);
+        metrics.load_event_ms = nav.loadEventEnd ? Math.round(nav.loadEventEnd - nav.startTime) : null;
+        metrics.transfer_kb = Math.round((nav.transferSize || 0) / 1024);
+    }
+}
+return metrics;
+"""
+
+# Metrics summarized per URL in reports
+PAGE_METRICS = ['ttfb_ms', 'dom_content_loaded_ms', 'load_event_ms', 'lcp_ms', 'cls',
+                'long_task_total_ms', 'js_heap_mb']
+ACTION_METRICS = ['long_task_max_ms', 'long_task_total_ms', 'js_heap_mb']
+
+
+class PerformanceProbe:
+    """Collects Web Vitals style metrics after page loads and actions"""
+
+    def __init__(self, driver, long_task_threshold_ms=200):
+        self.driver = driver
+        self.long_task_threshold_ms = long_task_threshold_ms
+        self.installed_on_new_document = False
+
+    def install(self):
+        """Register the observers for every new document via CDP (Chromium only)"""
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                        {'source': INSTALL_OBSERVERS_SCRIPT})
+            self.installed_on_new_document = True
+            return True
+        except Exception as e:
+            logger.debug(f"Could not pre-install performance observers: {e}")
+            return False
+
+    def collect(self, include_navigation=False):
+        """Drain metrics in one browser call; long tasks are reported once"""
+        try:
+            return self.driver.execute_script(COLLECT_SCRIPT, include_navigation)
+        except Exception as e:
+            logger.debug(f"Performance metrics unavailable: {e}")
+            return None
+
+    def is_slow(self, metrics):
+        """True when an interaction produced a long task over the threshold"""
+        return bool(metrics) and (metrics.get('long_task_max_ms') or 0) >= self.long_task_threshold_ms
+
+
+def summarize_distribution(values):
+    """count/min/p50/p95/max of a list of numbers, ignoring None"""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+
+    def percentile(p):
+        return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+    return {
+        'count': len(values),
+        'min': values[0],
+        'p50': percentile(50),
+        'p95': percentile(95),
+        'max': values[-1]
+    }
+
+
+def summarize_by_url(page_loads, test_results):
+    """Per-URL metric distributions from page loads and action results"""
+    samples = {}
+
+    for load in page_loads:
+        perf = load.get('perf')
+        if not perf:
+            continue
+        url_samples = samples.setdefault(load['url'], {})
+        for key in PAGE_METRICS:
+            url_samples.setdefault(f"page.{key}", []).append(perf.get(key))
+
+    perf_failures = {}
+    for result in test_results:
+        perf = result.get('perf')
+        if not perf or not result.get('url'):
+            continue
+        url_samples = samples.setdefault(result['url'], {})
+        for key in ACTION_METRICS:
+            url_samples.setdefault(f"action.{key}", []).append(perf.get(key))
+        if result.get('perf_failure'):
+            perf_failures[result['url']] = perf_failures.get(result['url'], 0) + 1
+
+    summary = {}
+    for url, metrics in samples.items():
+        distributions = {}
+        for name, values in metrics.items():
+            distribution = summarize_distribution(values)
+            if distribution:
+                distributions[name] = distribution
+        summary[url] = {
+            'metrics': distributions,
+            'performance_failures': perf_failures.get(url, 0)
+        }
+    return summary
\ No newline at end of file
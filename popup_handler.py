@@ -0,0 +1,280 @@
+import json
+import os
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Containers injected by common consent management platforms. Generic [role='dialog'] and
+# [aria-modal='true'] are left out: they match the application's own dialogs, which are under test.
+CONSENT_SELECTORS = [
+    "#onetrust-banner-sdk",
+    "#onetrust-consent-sdk",
+    "#CybotCookiebotDialog",
+    "#usercentrics-root",
+    "#didomi-host",
+    "#qc-cmp2-container",
+    ".fc-consent-root",
+    "#truste-consent-track",
+    "#cookie-law-info-bar",
+    ".cc-window",
+    "#cmpbox",
+    ".osano-cm-window",
+    "[id*='cookie-banner']",
+    "[class*='cookie-banner']",
+    "[id*='cookie-consent']",
+    "[class*='cookie-consent']",
+    ".modal.show",
+    ".modal.in"
+]
+
+# Known dismiss/accept buttons, tried before falling back to button text
+DISMISS_SELECTORS = [
+    "#onetrust-accept-btn-handler",
+    "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+    "#CybotCookiebotDialogBodyButtonAccept",
+    "#didomi-notice-agree-button",
+    ".fc-cta-consent",
+    ".qc-cmp2-summary-buttons button[mode='primary']",
+    ".cc-btn.cc-dismiss",
+    ".cc-btn.cc-allow",
+    "#truste-consent-button",
+    "[data-testid='uc-accept-all-button']",
+    "button[data-dismiss='modal']",
+    "button[data-bs-dismiss='modal']",
+    "[aria-label='Close']",
+    "[aria-label='close']",
+    "[aria-label='Dismiss']",
+    ".modal .close",
+    ".close-button",
+    ".btn-close"
+]
+
+DISMISS_TEXTS = [
+    "accept all", "accept", "allow all", "agree", "i agree", "got it",
+    "ok", "okay", "continue", "close", "dismiss", "no thanks", "not now"
+]
+
+# Single pass: replay cached steps whose targets still look like overlays, then detect/dismiss anything
+# still blocking. Returns {applied, steps, overlays} where steps form a reusable host recipe.
+CLEAR_OVERLAYS_SCRIPT = """
+var recipe = arguments[0], cfg = arguments[1];
+var vw = window.innerWidth, vh = window.innerHeight;
+var result = {applied: 0, steps: [], overlays: 0};
+
+function cssPath(el) {
+    if (el.id && /^[A-Za-z][\\w-]*$/.test(el.id) && !/\\d{3,}/.test(el.id)) {
+        return '#' + el.id;
+    }
+    // Child combinators anchored at body or an id, so a path never matches at some other depth
+    var parts = [];
+    while (el && el.nodeType === 1 && el !== document.body && el !== document.documentElement) {
+        var tag = el.tagName.toLowerCase(), idx = 1, sib = el;
+        while ((sib = sib.previousElementSibling)) { if (sib.tagName === el.tagName) idx++; }
+        parts.unshift(tag + ':nth-of-type(' + idx + ')');
+        if (el.parentElement && el.parentElement.id && /^[A-Za-z][\\w-]*$/.test(el.parentElement.id)) {
+            parts.unshift('#' + el.parentElement.id);
+            break;
+        }
+        el = el.parentElement;
+        if (el === document.body) parts.unshift('body');
+    }
+    return parts.join(' > ');
+}
+
+function visible(el) {
+    var r = el.getBoundingClientRect();
+    if (r.width < 2 || r.height < 2) return false;
+    var s = getComputedStyle(el);
+    return s.display !== 'none' && s.visibility !== 'hidden' && parseFloat(s.opacity || '1') > 0.05;
+}
+
+function unlockScroll() {
+    [document.documentElement, document.body].forEach(function (n) {
+        if (n && getComputedStyle(n).overflow === 'hidden') n.style.setProperty('overflow', 'auto', 'important');
+    });
+}
+
+function isConsent(el) {
+    return cfg.consent_selectors.some(function (sel) {
+        try { return el.matches(sel); } catch (e) { return false; }
+    });
+}
+
+function isBlocking(el) {
+    if (!el.isConnected || !visible(el)) return false;
+    if (isConsent(el)) return true;
+    var s = getComputedStyle(el), r = el.getBoundingClientRect();
+    // Sticky headers/navbars are wide but short - leave them alone
+    if (r.height < vh * 0.15 && r.top <= 0) return false;
+    var z = parseInt(s.zIndex, 10) || 0;
+    var w = Math.max(0, Math.min(r.right, vw) - Math.max(r.left, 0));
+    var h = Math.max(0, Math.min(r.bottom, vh) - Math.max(r.top, 0));
+    var positioned = s.position === 'fixed' || s.position === 'sticky';
+    return positioned && z >= cfg.min_z_index && (w * h) / (vw * vh) >= cfg.min_coverage;
+}
+
+function insideOverlay(el) {
+    for (var node = el.parentElement; node && node !== document.body; node = node.parentElement) {
+        if (isBlocking(node)) return true;
+    }
+    return false;
+}
+
+// Cached selectors may hit ordinary content on another page of the host: re-check before acting
+function applyStep(step) {
+    var el = document.querySelector(step.selector);
+    if (!el) return false;
+    if (step.action === 'click') {
+        if (!visible(el) || !insideOverlay(el)) return false;
+        el.click();
+    } else {
+        if (!isBlocking(el)) return false;
+        el.remove();
+    }
+    return true;
+}
+
+recipe.forEach(function (step) {
+    try { if (applyStep(step)) result.applied++; } catch (e) {}
+});
+if (result.applied) unlockScroll();
+
+// Candidate overlays: consent containers plus whatever sits on top of the viewport
+var candidates = [];
+cfg.consent_selectors.forEach(function (sel) {
+    try { document.querySelectorAll(sel).forEach(function (el) { candidates.push(el); }); } catch (e) {}
+});
+[[0.5, 0.5], [0.5, 0.9], [0.5, 0.1], [0.2, 0.5], [0.8, 0.5], [0.5, 0.97]].forEach(function (pt) {
+    var el = document.elementFromPoint(vw * pt[0], vh * pt[1]);
+    while (el && el !== document.body && el !== document.documentElement) {
+        var s = getComputedStyle(el);
+        if (s.position === 'fixed' || s.position === 'sticky') { candidates.push(el); break; }
+        el = el.parentElement;
+    }
+});
+
+var seen = [];
+candidates.forEach(function (el) {
+    if (seen.indexOf(el) !== -1) return;
+    seen.push(el);
+    if (!isBlocking(el)) return;
+    result.overlays++;
+
+    var button = null;
+    for (var i = 0; i < cfg.dismiss_selectors.length && !button; i++) {
+        try {
+            var b = el.querySelector(cfg.dismiss_selectors[i]);
+            if (b && visible(b)) button = b;
+        } catch (e) {}
+    }
+    if (!button) {
+        var clickables = el.querySelectorAll('button, a, [role="button"], input[type="button"], input[type="submit"]');
+        for (var j = 0; j < clickables.length && !button; j++) {
+            var text = (clickables[j].innerText || clickables[j].value || clickables[j].getAttribute('aria-label') || '')
+                .trim().toLowerCase();
+            if (cfg.dismiss_texts.indexOf(text) !== -1 && visible(clickables[j])) button = clickables[j];
+        }
+    }
+
+    var step = button ? {action: 'click', selector: cssPath(button)} : {action: 'remove', selector: cssPath(el)};
+    try {
+        if (button) { button.click(); } else { el.remove(); }
+        result.steps.push(step);
+    } catch (e) {}
+});
+if (result.steps.length) unlockScroll();
+return result;
+"""
+
+
+class PopupHandler:
+    """Detects and clears blocking overlays with per-host cached recipes"""
+
+    def __init__(self, driver, cache_file=None, min_z_index=10, min_coverage=0.25):
+        self.driver = driver
+        self.cache_file = cache_file
+        self.config = {
+            'consent_selectors': CONSENT_SELECTORS,
+            'dismiss_selectors': DISMISS_SELECTORS,
+            'dismiss_texts': DISMISS_TEXTS,
+            'min_z_index': min_z_index,
+            'min_coverage': min_coverage
+        }
+        self.recipes = {}
+        self.stats = {
+            'calls': 0,
+            'recipe_hits': 0,
+            'overlays_detected': 0,
+            'overlays_cleared': 0
+        }
+        self.load_recipes()
+
+    def clear_overlays(self, url=None):
+        """Dismiss or remove blocking overlays in a single browser call"""
+        host = self._get_host(url)
+        recipe = self.recipes.get(host, [])
+        self.stats['calls'] += 1
+
+        try:
+            result = self.driver.execute_script(CLEAR_OVERLAYS_SCRIPT, recipe, self.config) or {}
+        except Exception as e:
+            logger.warning(f"Overlay check failed on {host}: {e}")
+            return 0
+
+        applied = result.get('applied', 0)
+        steps = result.get('steps', [])
+
+        if applied:
+            self.stats['recipe_hits'] += 1
+        self.stats['overlays_detected'] += result.get('overlays', 0)
+        self.stats['overlays_cleared'] += applied + len(steps)
+
+        if steps:
+            # Remember new dismissal steps so later visits replay them directly
+            known = {(s['action'], s['selector']) for s in recipe}
+            new_steps = [s for s in steps if (s['action'], s['selector']) not in known]
+            if new_steps:
+                self.recipes[host] = recipe + new_steps
+                self.save_recipes()
+            logger.info(f"Cleared {len(steps)} overlay(s) on {host}: {steps}")
+
+        return applied + len(steps)
+
+    def forget(self, url=None):
+        """Drop the cached recipe for a host (e.g. after a site redesign)"""
+        self.recipes.pop(self._get_host(url), None)
+        self.save_recipes()
+
+    def load_recipes(self):
+        """Load cached per-host recipes from disk"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.recipes = json.load(f)
+            logger.debug(f"Loaded popup recipes for {len(self.recipes)} hosts")
+        except Exception as e:
+            logger.warning(f"Could not load popup recipes: {e}")
+
+    def save_recipes(self):
+        """Persist per-host recipes to disk"""
+        if not self.cache_file:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.recipes, f, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not save popup recipes: {e}")
+
+    def _get_host(self, url):
+        """Host key used for the recipe cache"""
+        try:
+            if not url:
+                url = self.driver.current_url
+            return urlparse(url).netloc.replace('www.', '') or "unknown"
+        except Exception:
+            return "unknown"
\ No newline at end of file
@@ -0,0 +1,143 @@
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'qa-monkey-preflight/1.0'
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """A redirect answer already proves the host is up - don't follow it"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class DnsCache:
+    """Resolves each host once; every check of a URL on that host connects to the cached addresses"""
+
+    def __init__(self):
+        self._addresses = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host):
+        with self._lock:
+            host_lock = self._locks.setdefault(host, threading.Lock())
+        # Per-host lock: concurrent checks of one host wait for a single lookup, other hosts resolve in parallel
+        with host_lock:
+            if host not in self._addresses:
+                try:
+                    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+                    self._addresses[host] = list(dict.fromkeys(info[4][0] for info in infos))
+                except socket.gaierror as e:
+                    # A dead name stays dead for the rest of the preflight
+                    self._addresses[host] = e
+        addresses = self._addresses[host]
+        if isinstance(addresses, socket.gaierror):
+            raise socket.gaierror(*addresses.args)
+        return addresses
+
+    def create_connection(self, address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None):
+        """socket.create_connection that dials the cached addresses instead of looking the host up again"""
+        host, port = address
+        error = None
+        for ip in self.resolve(host):
+            try:
+                return socket.create_connection((ip, port), timeout, source_address)
+            except OSError as e:
+                error = e
+        raise error
+
+
+class _CachedDnsHandler:
+    """Handler mixin: connections keep their hostname (Host header, SNI) but dial through the DNS cache"""
+
+    dns_cache = None
+
+    def do_open(self, http_class, req, **http_conn_args):
+        def connection(host, **kwargs):
+            conn = http_class(host, **kwargs)
+            conn._create_connection = self.dns_cache.create_connection
+            return conn
+        return super().do_open(connection, req, **http_conn_args)
+
+
+class _CachedHTTPHandler(_CachedDnsHandler, urllib.request.HTTPHandler):
+    pass
+
+
+class _CachedHTTPSHandler(_CachedDnsHandler, urllib.request.HTTPSHandler):
+    pass
+
+
+class PreflightChecker:
+    """Concurrent reachability check of all test URLs before a browser touches them"""
+
+    def __init__(self, timeout=3.0, max_workers=16):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.dns_cache = DnsCache()
+        handlers = [_CachedHTTPHandler(), _CachedHTTPSHandler()]
+        for handler in handlers:
+            handler.dns_cache = self.dns_cache
+        self._opener = urllib.request.build_opener(_NoRedirect, *handlers)
+
+    def check_url(self, url):
+        """HEAD the URL (GET when HEAD is refused); any HTTP answer counts as reachable"""
+        host = urlparse(url).hostname or ''
+        start = time.time()
+        result = {'url': url, 'host': host, 'reachable': False, 'status': None, 'elapsed': 0.0, 'error': None}
+
+        for method in ('HEAD', 'GET'):
+            request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+            try:
+                with self._opener.open(request, timeout=self.timeout) as response:
+                    result['status'] = response.status
+            except urllib.error.HTTPError as e:
+                result['status'] = e.code
+                if method == 'HEAD' and e.code in (405, 501):
+                    continue
+            except Exception as e:
+                reason = getattr(e, 'reason', e)
+                result['error'] = f"DNS lookup failed: {reason}" if isinstance(reason, socket.gaierror) else str(reason)
+            break
+
+        result['reachable'] = result['status'] is not None
+        result['elapsed'] = round(time.time() - start, 3)
+        return result
+
+    def check_all(self, urls):
+        """Check every URL concurrently, results in input order"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.check_url, urls))
+
+        for result in results:
+            if not result['reachable']:
+                logger.warning(f"Preflight: {result['url']} unreachable - {result['error']}")
+        return results
+
+    def check_stream(self, urls, batch_size=50, results=None):
+        """Yield reachable URLs from a (possibly endless) stream, checking them a batch at a time"""
+        batch = []
+        for url in urls:
+            batch.append(url)
+            if len(batch) >= batch_size:
+                yield from self._reachable(self.check_all(batch), results)
+                batch = []
+        if batch:
+            yield from self._reachable(self.check_all(batch), results)
+
+    @staticmethod
+    def _reachable(batch_results, results):
+        if results is not None:
+            results.extend(batch_results)
+        for result in batch_results:
+            if result['reachable']:
+                yield result['url']
\ No newline at end of file
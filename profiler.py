@@ -0,0 +1,161 @@
+import json
+import linecache
+import os
+import sys
+import threading
+import time
+from collections import Counter
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_DEPTH = 128
+TOP_N = 25
+
+# Any of these in the stack means the main thread is blocked on the WebDriver HTTP round trip
+IO_FILES = ('selenium/webdriver/remote/', 'urllib3/', 'http/client.py', 'socket.py', 'ssl.py')
+
+# Python time in our code, by the innermost frame that matches: (category, file suffixes, function names)
+CATEGORY_RULES = [
+    ('element_info', (), ('_get_element_info', 'describe')),
+    ('logging', ('logger.py', 'logging/__init__.py'), ()),
+    ('reporting', ('reporting.py', 'jinja2/'), ()),
+    ('stats', ('perf_metrics.py',), ('get_stats', 'summary', 'get_screenshot_stats')),
+    ('selection', ('sampling.py', 'random.py'), ('_should_perform_safe_action',)),
+    ('data_generation', ('data_generator.py',), ()),
+    ('tracing', ('span_trace.py', 'action_trace.py'), ()),
+]
+
+
+def _normalized(path):
+    return path.replace('\\', '/')
+
+
+def classify_stack(codes, leaf_line):
+    """Category for one sampled stack (codes ordered root to leaf)"""
+    if any(any(part in _normalized(code.co_filename) for part in IO_FILES) for code in codes):
+        return 'webdriver_io'
+    if 'sleep(' in leaf_line or '.wait(' in leaf_line:
+        return 'sleep'
+    for code in reversed(codes):
+        filename = _normalized(code.co_filename)
+        for category, suffixes, functions in CATEGORY_RULES:
+            if code.co_name in functions or any(filename.endswith(suffix) for suffix in suffixes):
+                return category
+    return 'other_python'
+
+
+def _frame_label(code):
+    filename = _normalized(code.co_filename)
+    # Package __init__ files only mean something with their package name
+    short = "/".join(filename.split('/')[-2:]) if filename.endswith('/__init__.py') else os.path.basename(filename)
+    return f"{code.co_name} ({short}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler for one thread (the main thread by default)
+
+    Sampling from a side thread catches the main thread both while it runs Python and while it
+    waits on a WebDriver socket, so I/O time and framework CPU time can be told apart.
+    """
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stacks = Counter()  # (codes root->leaf, leaf line number) -> samples
+        self.samples = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+
+    def start(self):
+        self._started = (time.time(), time.process_time())
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if not self._thread:
+            return self
+        self._stop.set()
+        self._thread.join(1)
+        self._thread = None
+        self.wall_seconds = time.time() - self._started[0]
+        self.cpu_seconds = time.process_time() - self._started[1]
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            leaf_line = frame.f_lineno
+            codes = []
+            while frame is not None and len(codes) < MAX_DEPTH:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            self.stacks[(tuple(codes), leaf_line)] += 1
+            self.samples += 1
+
+    def summary(self, top_n=TOP_N):
+        """Time per category plus the top functions by self and inclusive samples"""
+        categories, self_samples, inclusive = Counter(), Counter(), Counter()
+        for (codes, leaf_line), count in self.stacks.items():
+            leaf = codes[-1] if codes else None
+            line = linecache.getline(leaf.co_filename, leaf_line) if leaf else ''
+            categories[classify_stack(codes, line)] += count
+            if leaf:
+                self_samples[_frame_label(leaf)] += count
+            for label in {_frame_label(code) for code in codes}:
+                inclusive[label] += count
+
+        total = self.samples or 1
+
+        def seconds(count):
+            return round(count / total * self.wall_seconds, 3)
+
+        return {
+            'wall_seconds': round(self.wall_seconds, 3),
+            'process_cpu_seconds': round(self.cpu_seconds, 3),
+            'samples': self.samples,
+            'interval_ms': self.interval * 1000,
+            'categories': {name: {'samples': count, 'seconds': seconds(count),
+                                  'percent': round(count / total * 100, 1)}
+                           for name, count in categories.most_common()},
+            'top_self': [{'function': label, 'samples': count, 'seconds': seconds(count)}
+                         for label, count in self_samples.most_common(top_n)],
+            'top_inclusive': [{'function': label, 'samples': count, 'seconds': seconds(count)}
+                              for label, count in inclusive.most_common(top_n)],
+        }
+
+    def write_collapsed(self, path):
+        """Brendan Gregg collapsed stacks (flamegraph.pl, speedscope, inferno)"""
+        collapsed = Counter()
+        for (codes, _), count in self.stacks.items():
+            collapsed[";".join(_frame_label(code) for code in codes)] += count
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in collapsed.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def write_report(self, directory, top_n=TOP_N):
+        """stacks.collapsed, profile_summary.json and profile_summary.txt under directory"""
+        os.makedirs(directory, exist_ok=True)
+        summary = self.summary(top_n)
+        self.write_collapsed(os.path.join(directory, 'stacks.collapsed'))
+        with open(os.path.join(directory, 'profile_summary.json'), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+        lines = [f"Wall {summary['wall_seconds']}s, process CPU {summary['process_cpu_seconds']}s, "
+                 f"{summary['samples']} samples every {summary['interval_ms']:.0f}ms", "", "Time by category:"]
+        for name, data in summary['categories'].items():
+            lines.append(f"  {name:<16}{data['seconds']:>10.3f}s {data['percent']:>6.1f}%")
+        for title, key in (("Top functions (self)", 'top_self'), ("Top functions (inclusive)", 'top_inclusive')):
+            lines += ["", f"{title}:"]
+            lines += [f"  {entry['seconds']:>10.3f}s  {entry['function']}" for entry in summary[key]]
+        with open(os.path.join(directory, 'profile_summary.txt'), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return summary
\ No newline at end of file
@@ -0,0 +1,250 @@
+import json
+import os
+import random
+import re
+from datetime import datetime
+import logging
+
+import pytest
+
+from error_signatures import ErrorClusterer
+from url_sources import iter_urls_file, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Interaction flakiness every monkey run produces; only other signatures fail an item unless baselined
+TOLERATED_SIGNATURES = {
+    'intercepted-click-by-overlay', 'stale-element', 'element-not-interactable', 'move-target-out-of-bounds',
+    'invalid-element-state', 'no-such-element', 'no-elements-found',
+}
+
+# Summed per item and across items; success_rate is recomputed from the merged counts
+_MERGED_STAT_KEYS = ('total_actions', 'successful_actions', 'failed_actions', 'performance_failures',
+                     'browser_restarts', 'browser_recycles')
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('qa-monkey', 'QA monkey sessions')
+    group.addoption('--monkey-urls', default=None, help='Comma-separated URLs, one test item each')
+    group.addoption('--monkey-urls-file', default=None, help='File with one URL per line (# comments allowed)')
+    group.addoption('--monkey-fixtures', action='store_true', help='Serve and test the local fixture pages')
+    group.addoption('--monkey-shards', type=int, default=0,
+                    help='Split the URLs round-robin into N items instead of one item per URL')
+    group.addoption('--monkey-actions', type=int, default=8, help='Random actions per URL visit')
+    group.addoption('--monkey-seed', type=int, default=None, help='Session seed shared by every worker')
+    group.addoption('--monkey-visible', action='store_true', help='Run the browsers with a window')
+    group.addoption('--monkey-baseline', default=None,
+                    help='JSON list of known error signatures; only signatures outside it fail an item')
+    group.addoption('--monkey-update-baseline', action='store_true',
+                    help='Add every signature seen in this run to the baseline file')
+
+
+def _worker_id():
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+def _is_worker(config):
+    return hasattr(config, 'workerinput')
+
+
+def _sanitize(text):
+    return re.sub(r'[^\w.-]+', '_', text).strip('_')[:120]
+
+
+def load_baseline(path):
+    """Known signatures from a baseline file (a list, or {"signatures": [...]})"""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return set(data.get('signatures', []) if isinstance(data, dict) else data)
+
+
+def pytest_configure(config):
+    """Controller-side run id, seed and fixture server; xdist workers receive them via workerinput"""
+    if _is_worker(config):
+        shared = config.workerinput
+        config._qa_monkey = {key: shared[key] for key in ('run_id', 'seed', 'fixture_base')}
+        return
+
+    seed = config.getoption('monkey_seed')
+    config._qa_monkey = {
+        'run_id': datetime.now().strftime("%Y%m%d_%H%M%S"),
+        'seed': seed if seed is not None else random.SystemRandom().randrange(2 ** 32),
+        'fixture_base': None,
+    }
+    config._qa_monkey_fixture_server = None
+    if config.getoption('monkey_fixtures'):
+        from fixture_server import FixtureServer
+        config._qa_monkey_fixture_server = FixtureServer().start()
+        config._qa_monkey['fixture_base'] = config._qa_monkey_fixture_server.base_url
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist: share the controller's run settings so every worker collects the same items"""
+    node.workerinput.update(node.config._qa_monkey)
+
+
+def monkey_urls(config):
+    """Target URLs from the command line, identical on the controller and every worker"""
+    urls = []
+    if config.getoption('monkey_urls'):
+        urls += [url.strip() for url in config.getoption('monkey_urls').split(',') if url.strip()]
+    if config.getoption('monkey_urls_file'):
+        urls += list(iter_urls_file(config.getoption('monkey_urls_file')))
+    base = config._qa_monkey['fixture_base']
+    if base:
+        from fixture_server import PAGES
+        urls += [base + path for path in PAGES]
+
+    unique = []
+    for url in map(normalize_url, urls):
+        if url and url not in unique:
+            unique.append(url)
+    return unique
+
+
+def pytest_generate_tests(metafunc):
+    """One monkey_target per URL, or per shard with --monkey-shards; each is a list of (visit_index, url)"""
+    if 'monkey_target' not in metafunc.fixturenames:
+        return
+    config = metafunc.config
+    # Visit indexes follow the URL order, so per-visit seeds don't depend on which worker runs the item
+    indexed = list(enumerate(monkey_urls(config), start=1))
+    shards = config.getoption('monkey_shards')
+    if shards > 0:
+        targets = [indexed[shard::shards] for shard in range(min(shards, len(indexed)))]
+        ids = [f"shard{shard + 1}" for shard in range(len(targets))]
+    else:
+        targets = [[entry] for entry in indexed]
+        base = config._qa_monkey['fixture_base']
+        ids = [url.replace(base, 'fixture') if base else url for _, url in indexed]
+    metafunc.parametrize('monkey_target', targets, ids=ids)
+
+
+@pytest.fixture(scope='session')
+def monkey_suite(request):
+    """The worker's RegressionTestSuite: one browser per xdist worker, reused by all its items"""
+    from regression_test_suite import RegressionTestSuite
+
+    config = request.config
+    run = config._qa_monkey
+    suite = RegressionTestSuite(seed=run['seed'])
+    suite.session_id = f"pytest_{run['run_id']}_{_worker_id()}"
+    suite.smart_config['max_actions_per_url'] = config.getoption('monkey_actions')
+    suite.setup(headless=not config.getoption('monkey_visible'))
+    yield suite
+    try:
+        suite.logger.save_session_data()
+    except Exception as e:
+        logger.warning(f"Could not save worker session data: {e}")
+    suite.cleanup()
+
+
+@pytest.fixture(scope='session')
+def monkey_browser(monkey_suite):
+    """The worker's pooled WebDriver (rebound by the suite after browser restarts)"""
+    return monkey_suite.driver
+
+
+@pytest.fixture
+def monkey_runner(request, monkey_suite):
+    """Run visits on the worker's browser and write this item's results for the merged report"""
+    config = request.config
+    run_dir = f"reports/pytest_{config._qa_monkey['run_id']}/items"
+    known = TOLERATED_SIGNATURES | load_baseline(config.getoption('monkey_baseline'))
+    max_actions = config.getoption('monkey_actions')
+
+    def run(target):
+        log = monkey_suite.logger
+        offsets = (len(log.test_results), len(log.page_loads), len(log.events))
+        stats_before = dict(log.action_stats)
+        visits = []
+        for visit_index, url in target:
+            print(f"\n🌐 [{_worker_id()}] Testing URL {visit_index}: {url}")
+            visit = monkey_suite._test_url(url, visit_index, max_actions=max_actions)
+            visits.append(dict(visit, url=url, visit_index=visit_index))
+
+        results = log.test_results[offsets[0]:]
+        signatures = sorted({r['error_signature'] for r in results if r.get('error_signature')})
+        outcome = {
+            'nodeid': request.node.nodeid,
+            'worker': _worker_id(),
+            'visits': visits,
+            'stats': {key: log.action_stats.get(key, 0) - stats_before.get(key, 0) for key in _MERGED_STAT_KEYS},
+            'signatures': signatures,
+            'new_signatures': [signature for signature in signatures if signature not in known],
+            'test_results': results,
+            'page_loads': log.page_loads[offsets[1]:],
+            'events': log.events[offsets[2]:],
+        }
+        os.makedirs(run_dir, exist_ok=True)
+        with open(f"{run_dir}/{_sanitize(request.node.nodeid)}.json", 'w', encoding='utf-8') as f:
+            json.dump(outcome, f, indent=2, default=str)
+        return outcome
+
+    return run
+
+
+def merge_item_results(items_dir):
+    """Combined results, stats, page loads, events and signatures of every item file in items_dir"""
+    merged = {'test_results': [], 'page_loads': [], 'events': [], 'signatures': set(), 'new_signatures': set(),
+              'stats': {key: 0 for key in _MERGED_STAT_KEYS}, 'items': 0}
+    for name in sorted(os.listdir(items_dir)):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(items_dir, name), encoding='utf-8') as f:
+                item = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable item result {name}: {e}")
+            continue
+        merged['items'] += 1
+        for key in ('test_results', 'page_loads', 'events'):
+            merged[key] += item.get(key, [])
+        merged['signatures'].update(item.get('signatures', []))
+        merged['new_signatures'].update(item.get('new_signatures', []))
+        for key in _MERGED_STAT_KEYS:
+            merged['stats'][key] += item['stats'].get(key, 0)
+
+    for key in ('test_results', 'page_loads', 'events'):
+        merged[key].sort(key=lambda entry: entry.get('timestamp') or '')
+    total = merged['stats']['total_actions']
+    merged['stats']['success_rate'] = round(merged['stats']['successful_actions'] / total * 100, 1) if total else 0
+    return merged
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Controller only: merge the per-item JSON files of all workers into one EnhancedReporting output"""
+    config = session.config
+    if _is_worker(config) or not hasattr(config, '_qa_monkey'):
+        return
+    if config._qa_monkey_fixture_server:
+        config._qa_monkey_fixture_server.stop()
+
+    session_id = f"pytest_{config._qa_monkey['run_id']}"
+    items_dir = f"reports/{session_id}/items"
+    if not os.path.isdir(items_dir):
+        return
+
+    merged = merge_item_results(items_dir)
+    from reporting import EnhancedReporting
+    reporting = EnhancedReporting(
+        session_id,
+        merged['test_results'],
+        merged['stats'],
+        error_clusters=ErrorClusterer().add_all(merged['test_results']),
+        page_loads=merged['page_loads'],
+        events=merged['events']
+    )
+    reporting.generate_all_reports()
+    print(f"\n📋 Merged {merged['items']} monkey item(s), {merged['stats']['total_actions']} actions, "
+          f"{merged['stats']['success_rate']}% success: {reporting.report_dir}")
+
+    baseline = config.getoption('monkey_baseline')
+    if baseline and config.getoption('monkey_update_baseline'):
+        signatures = sorted(load_baseline(baseline) | merged['signatures'])
+        with open(baseline, 'w', encoding='utf-8') as f:
+            json.dump({'signatures': signatures}, f, indent=2)
+        print(f"📌 Baseline updated: {baseline} ({len(signatures)} signatures)")
\ No newline at end of file
@@ -1,260 +1,897 @@
-import random
-import time
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from logger import EnhancedLogger
-from screenshot_manager import EnhancedScreenshotManager
-from monkey_tester import EnhancedMonkeyTester
-from reporting import EnhancedReporting
-import logging
-
-class RegressionTestSuite:
-    """Regression test suite runner to achieve target success rates"""
-    
-    def __init__(self, target_success_rate=92.0):
-        self.target_success_rate = target_success_rate
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.driver = None
-        self.logger = None
-        self.screenshot_manager = None
-        self.monkey_tester = None
-        
-        # Test configuration
-        self.test_urls = [
-            "https://example.com",
-            "https://httpbin.org/forms/post",
-            "https://the-internet.herokuapp.com/login",
-            "https://demoqa.com/elements",
-            "https://www.google.com",
-            "https://github.com",
-        ]
-        
-        # Smart action configuration optimized for speed and success rate
-        self.smart_config = {
-            'safe_actions_weight': 0.7,
-            'aggressive_actions_weight': 0.3,
-            'page_load_wait': 2,  # Reduced from 3
-            'action_delay_range': (0.3, 0.6),  # Reduced from (0.5, 1.5)
-            'max_actions_per_url': 8  # Reduced from 15 for speed
-        }
-    
-    def setup(self, headless=True):
-        """Setup test environment"""
-        print(f"🔧 Setting up regression test suite...")
-        print(f"🎯 Target Success Rate: {self.target_success_rate}%")
-        print(f"📋 Session ID: {self.session_id}")
-        
-        # Setup Chrome driver with WebDriver Manager - force latest version
-        options = Options()
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--disable-web-security")
-        options.add_argument("--allow-running-insecure-content")
-        options.add_argument("--remote-debugging-port=9222")  # Add debugging port
-        
-        if headless:
-            options.add_argument("--headless")
-        
-        try:
-            # Try to use WebDriver Manager with latest version
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.chrome.service import Service
-            
-            # Clear cache and get latest ChromeDriver
-            service = Service(ChromeDriverManager(cache_valid_range=1).install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-        except Exception as e:
-            print(f"WebDriver Manager failed: {e}")
-            print("Trying with system ChromeDriver...")
-            try:
-                # Fallback to system ChromeDriver
-                self.driver = webdriver.Chrome(options=options)
-            except Exception as e2:
-                print(f"System ChromeDriver also failed: {e2}")
-                print("\nPLEASE FIX CHROMEDRIVER:")
-                print("1. Update Chrome browser to latest version")
-                print("2. Run: pip install --upgrade webdriver-manager")
-                print("3. Or download matching ChromeDriver manually")
-                raise e2
-        self.driver.maximize_window()
-        self.driver.implicitly_wait(5)  # Reduced from 10 for speed
-        self.driver.set_page_load_timeout(15)  # Reduced from 30 for speed
-        
-        # Setup logging and screenshot management
-        self.logger = EnhancedLogger(self.session_id, logging.INFO)
-        self.screenshot_manager = EnhancedScreenshotManager(self.driver, self.session_id)
-        
-        # Setup monkey tester with optimized weights for success
-        self.monkey_tester = EnhancedMonkeyTester(self.driver, self.logger, self.screenshot_manager)
-        
-        # Adjust action weights for higher success rate
-        self.monkey_tester.action_weights = {
-            'scroll': 0.35,     # Scrolling rarely fails
-            'hover': 0.25,      # Hovering is generally safe
-            'keypress': 0.20,   # Key presses are reliable
-            'click': 0.15,      # Clicks can fail due to popups/interception
-            'input': 0.05       # Input can fail if no suitable fields
-        }
-        
-        print("✅ Setup completed successfully")
-        return True
-    
-    def run_regression_tests(self):
-        """Run comprehensive regression test suite"""
-        print(f"\n🚀 Starting Regression Test Suite")
-        print(f"📊 Testing {len(self.test_urls)} URLs with smart action selection")
-        
-        start_time = datetime.now()
-        total_tests_planned = len(self.test_urls) * self.smart_config['max_actions_per_url']
-        
-        print(f"📈 Planned Tests: {total_tests_planned}")
-        print(f"🎯 Target Success Rate: {self.target_success_rate}%")
-        print("="*60)
-        
-        for i, url in enumerate(self.test_urls, 1):
-            print(f"\n🌐 Testing URL {i}/{len(self.test_urls)}: {url}")
-            
-            try:
-                # Load page
-                self.driver.get(url)
-                time.sleep(self.smart_config['page_load_wait'])
-                
-                # Initialize page object
-                if self.monkey_tester.initialize_page_object(url):
-                    # Perform page-specific actions first (these have higher success rates)
-                    page_actions_done = self.monkey_tester.perform_page_specific_actions(url)
-                    
-                    if page_actions_done:
-                        time.sleep(1)  # Brief pause after page actions
-                
-                # Perform controlled random actions
-                actions_for_this_url = self.smart_config['max_actions_per_url']
-                successful_actions = 0
-                
-                for action_num in range(actions_for_this_url):
-                    print(f"   Action {action_num + 1}/{actions_for_this_url}", end=" ")
-                    
-                    # Perform smart action with bias toward success
-                    if self._should_perform_safe_action():
-                        # Perform safer actions more frequently
-                        success = self._perform_safe_action(url)
-                    else:
-                        # Perform regular monkey action
-                        success = self.monkey_tester.perform_random_monkey_action(url)
-                    
-                    if success:
-                        successful_actions += 1
-                        print("✅")
-                    else:
-                        print("❌")
-                    
-                    # Dynamic delay
-                    delay = random.uniform(*self.smart_config['action_delay_range'])
-                    time.sleep(delay)
-                    
-                    # Check if we're meeting target and adjust if needed
-                    current_stats = self.logger.get_stats()
-                    if current_stats['total_actions'] > 10:  # After some actions
-                        current_rate = current_stats['success_rate']
-                        if current_rate < self.target_success_rate - 5:
-                            # If falling behind, increase safe action probability
-                            self.smart_config['safe_actions_weight'] = min(0.9, self.smart_config['safe_actions_weight'] + 0.1)
-                
-                url_success_rate = (successful_actions / actions_for_this_url) * 100
-                print(f"   📊 URL Success Rate: {url_success_rate:.1f}% ({successful_actions}/{actions_for_this_url})")
-                
-            except Exception as e:
-                print(f"   ❌ Error testing {url}: {str(e)}")
-                self.logger.logger.error(f"URL test failed: {url} - {str(e)}")
-                if self.screenshot_manager:
-                    self.screenshot_manager.capture_error_screenshot("url_load", str(e), url)
-        
-        # Generate final results
-        end_time = datetime.now()
-        duration = end_time - start_time
-        
-        final_stats = self.logger.get_stats()
-        
-        print(f"\n{'='*60}")
-        print(f"🏁 REGRESSION TEST SUITE COMPLETED")
-        print(f"{'='*60}")
-        print(f"⏱️  Duration: {str(duration).split('.')[0]}")
-        print(f"📊 Total Tests: {final_stats['total_actions']}")
-        print(f"✅ Passed: {final_stats['successful_actions']}")
-        print(f"❌ Failed: {final_stats['failed_actions']}")
-        print(f"🎯 Success Rate: {final_stats['success_rate']}%")
-        
-        if final_stats['success_rate'] >= self.target_success_rate:
-            print(f"🎉 SUCCESS: Achieved target success rate of {self.target_success_rate}%!")
-        else:
-            print(f"⚠️  Target not met. Achieved {final_stats['success_rate']}% vs target {self.target_success_rate}%")
-        
-        print(f"📸 Screenshots captured: {self.screenshot_manager.get_screenshot_stats()['total_screenshots']}")
-        
-        return final_stats
-    
-    def _should_perform_safe_action(self):
-        """Determine if should perform a safe action based on current success rate"""
-        current_stats = self.logger.get_stats()
-        
-        if current_stats['total_actions'] == 0:
-            return random.random() < self.smart_config['safe_actions_weight']
-        
-        current_rate = current_stats['success_rate']
-        
-        # If below target, increase safe action probability
-        if current_rate < self.target_success_rate:
-            return random.random() < 0.8
-        else:
-            return random.random() < self.smart_config['safe_actions_weight']
-    
-    def _perform_safe_action(self, url):
-        """Perform a statistically safer action"""
-        # Safe actions are scrolling and hovering - they rarely fail
-        safe_actions = ['scroll', 'hover', 'keypress']
-        action_type = random.choice(safe_actions)
-        
-        try:
-            if action_type == 'scroll':
-                success, element_info = self.monkey_tester._random_scroll()
-            elif action_type == 'hover':
-                success, element_info = self.monkey_tester._random_hover()
-            else:  # keypress
-                success, element_info = self.monkey_tester._random_keypress()
-            
-            # Log the action
-            self.logger.log_action(action_type, element_info, success)
-            return success
-            
-        except Exception as e:
-            self.logger.log_action(action_type, "unknown", False, str(e))
-            return False
-    
-    def generate_reports(self):
-        """Generate comprehensive reports"""
-        print(f"\n📋 Generating comprehensive reports...")
-        
-        # Save session data
-        session_file = self.logger.save_session_data()
-        print(f"💾 Session data saved: {session_file}")
-        
-        # Generate all report formats
-        reporting = EnhancedReporting(
-            self.session_id,
-            self.logger.test_results,
-            self.logger.get_stats(),
-            self.screenshot_manager
-        )
-        
-        reports = reporting.generate_all_reports()
-        
-        return reports
-    
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
+import json
+import random
+import time
+from datetime import datetime
+from driver_factory import PAGE_LOAD_TIMEOUT, create_chrome_driver
+from logger import EnhancedLogger
+from screenshot_manager import EnhancedScreenshotManager
+from popup_handler import PopupHandler
+from resource_policy import ResourcePolicy
+from perf_metrics import PerformanceProbe
+from js_error_oracle import JSErrorCollector
+from action_trace import ActionTraceRecorder, ActionReplayer, REPLAY_SETTINGS, derive_seed, load_trace
+from monkey_tester import EnhancedMonkeyTester
+from reporting import EnhancedReporting
+from scheduler import TimeBudgetScheduler, STATE_KEY_SCRIPT
+from error_signatures import error_signature
+from preflight import PreflightChecker
+from circuit_breaker import HostCircuitBreaker, DRIVER_FAILURE_SIGNATURES
+from browser_health import BrowserHealthMonitor
+from resource_watchdog import ResourceWatchdog, driver_process_pid
+from checkpoint import CheckpointManager, encode_rng_state, decode_rng_state, truncate_file
+from tab_multiplexer import TabMultiplexer
+from event_waits import EventWaiter
+from navigation_guard import NavigationGuard
+from data_generator import DataGenerator, HOSTILE_CLASSES
+from live_metrics import LiveMetrics
+from span_trace import SpanTracer, NULL_TRACER
+import logging
+
+class RegressionTestSuite:
+    """Regression test suite runner to achieve target success rates"""
+    
+    def __init__(self, target_success_rate=92.0, seed=None):
+        self.target_success_rate = target_success_rate
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Always run seeded so any session can be reproduced with --seed
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.trace_recorder = None
+        self.driver = None
+        self.headless = True
+        self.logger = None
+        self.screenshot_manager = None
+        self.popup_handler = None
+        self.resource_policy = None
+        self.perf_probe = None
+        self.js_error_collector = None
+        self.waiter = None
+        self.navigation_guard = None
+        self.monkey_tester = None
+        self.time_budget = None  # Seconds; replaces max_actions_per_url when set
+        self.budget_report = None
+        self.seen_states = set()
+        self.circuit_breaker = None
+        self.scheduler = None
+        self.checkpoint_manager = None
+        self.health_monitor = None
+        self.watchdog = None
+        self.live_metrics = None
+        self.tracer = NULL_TRACER  # Span tracing is free when off
+        self._session_span = None
+        self.visit_index = 0
+        self.completed_urls = set()  # Fixed-mode URLs fully tested (skipped on resume)
+        self._boundary_state = None  # Snapshot at the last visit boundary
+        self._resume_state = None
+        self._pending_page_load = None  # Logged once settle and overlay errors are known
+        
+        # Test configuration
+        self.test_urls = [
+            "https://example.com",
+            "https://httpbin.org/forms/post",
+            "https://the-internet.herokuapp.com/login",
+            "https://demoqa.com/elements",
+            "https://www.google.com",
+            "https://github.com",
+        ]
+        
+        # Smart action configuration optimized for speed and success rate
+        self.smart_config = {
+            'safe_actions_weight': 0.7,
+            'aggressive_actions_weight': 0.3,
+            'page_load_wait': 2,  # Reduced from 3
+            'action_delay_range': (0.3, 0.6),  # Reduced from (0.5, 1.5)
+            'max_actions_per_url': 8,  # Reduced from 15 for speed
+            'dismiss_popups': True,
+            'popup_recipe_cache': 'logs/popup_recipes.json',
+            'resource_policy': 'off',  # off | interaction_only | no_third_party | no_media
+            'measure_policy_baseline': False,  # Also time each URL without the policy
+            'collect_perf_metrics': True,
+            'long_task_threshold_ms': 200,  # Interactions causing longer tasks are flagged slow
+            'js_error_oracle': True,  # Fail actions that raise new application JS errors
+            'success_screenshot_rate': 0.1,  # Share of successful actions that also get a screenshot
+            'record_trace': True,  # Write logs/<session>/action_trace.jsonl for replay
+            'preflight': True,  # Concurrent HEAD/GET of all URLs before the browser visits them
+            'preflight_timeout': 3,
+            'circuit_breaker_threshold': 3,  # Consecutive load/driver failures before a host is skipped
+            'checkpoint_interval': 30,  # Seconds between checkpoints (written at visit boundaries)
+            'browser_heartbeat_timeout': 5,  # Seconds before an unanswered heartbeat means a hung renderer
+            'max_browser_restarts': 10,
+            'resource_watchdog': True,  # Sample chromedriver/Chrome RSS and CPU from /proc
+            'watchdog_interval': 2.0,
+            'recycle_max_rss_mb': 2048,  # Recycle the browser above this process-tree RSS...
+            'recycle_max_actions': 400,  # ...after this many actions on one browser...
+            'recycle_latency_drift': 2.5,  # ...or when p95 action latency grows this much over its baseline
+            'tabs': 1,  # >1 interleaves URLs across tabs of one browser, acting while others load
+            'isolate_tabs': False,  # Give each tab its own browser context (cookies, storage, cache)
+            'wait_backend': 'events',  # events (in-page observers, polling fallback) | polling
+            'settle_quiet_ms': 300,  # DOM/network quiet period that ends the post-load and post-action settle
+            'navigation_guard': 'block',  # block | record (log as "would navigate") | off - for other origins
+            'restore_navigations': True,  # Return to the visit's start page after same-origin navigations
+            'burst_size': 1,  # >1 batches that many safe scroll/key/hover actions into one browser call
+            'hostile_input_rate': 0.0,  # Opt-in share of typed values from boundary/unicode/long/injection corpora
+            'metrics_port': None,  # Serve Prometheus /metrics on localhost (0 picks a free port)
+            'progress_stream': False,  # Append a progress snapshot to logs/<session>/progress.jsonl
+            'metrics_interval': 2.0,
+            'span_trace': False  # Write session/visit/action/WebDriver spans to logs/<session>/spans.json
+        }
+    
+    def setup(self, headless=True):
+        """Setup test environment"""
+        print(f"🔧 Setting up regression test suite...")
+        print(f"🎯 Target Success Rate: {self.target_success_rate}%")
+        print(f"📋 Session ID: {self.session_id}")
+        print(f"🎲 Seed: {self.seed}")
+        
+        # Setup Chrome driver (resource blocking may switch the page load strategy to 'eager')
+        self.resource_policy = ResourcePolicy.from_preset(self.smart_config['resource_policy'])
+        self.driver = create_chrome_driver(
+            headless=headless,
+            resource_policy=self.resource_policy,
+            capture_browser_log=self.smart_config['js_error_oracle'],
+            page_load_strategy=self._page_load_strategy()
+        )
+        self.headless = headless
+        
+        if self.resource_policy.applied:
+            print(f"🚫 Resource policy: {self.resource_policy.name}")
+        
+        # Setup logging and screenshot management
+        self.logger = EnhancedLogger(self.session_id, logging.INFO)
+        self.screenshot_manager = EnhancedScreenshotManager(self.driver, self.session_id)
+        if self._resume_state:
+            self.logger.restore_results(self._resume_state['results_offset'], self._resume_state['stats'])
+            self.logger.metadata.update(self._resume_state['metadata'])
+            self.screenshot_manager.screenshot_count = self._resume_state['screenshot_count']
+        
+        # Nested spans down to single WebDriver commands, viewable in Perfetto / chrome://tracing
+        if self.smart_config['span_trace']:
+            self.tracer = SpanTracer(f"{self.logger.log_dir}/spans.json", f"qa-monkey {self.session_id}")
+            self.tracer.instrument(self.driver)
+            self._session_span = self.tracer.span('session', 'session', session_id=self.session_id,
+                                                  seed=self.seed).begin()
+            self.screenshot_manager.tracer = self.tracer
+            self.logger.metadata['span_trace'] = self.tracer.path
+        
+        # Overlay/consent banner handling with per-host recipes cached across runs
+        if self.smart_config['dismiss_popups']:
+            self.popup_handler = PopupHandler(self.driver, self.smart_config['popup_recipe_cache'])
+        
+        # Navigation timing, LCP, CLS, long tasks and heap after loads and actions
+        if self.smart_config['collect_perf_metrics']:
+            self.perf_probe = PerformanceProbe(self.driver, self.smart_config['long_task_threshold_ms'])
+            self.perf_probe.install()
+        
+        # console.error / uncaught error / unhandled rejection oracle
+        if self.smart_config['js_error_oracle']:
+            self.js_error_collector = JSErrorCollector(self.driver)
+            self.js_error_collector.install()
+        
+        # Keep random clicks on the site under test
+        self.navigation_guard = NavigationGuard(self.driver, self.smart_config['navigation_guard'],
+                                                self.smart_config['restore_navigations'])
+        self.navigation_guard.install()
+        
+        # Waits resolved by load/DOM/network events instead of fixed sleeps and 500ms polls
+        self.waiter = EventWaiter(self.driver, self.smart_config['wait_backend'],
+                                  quiet_ms=self.smart_config['settle_quiet_ms'])
+        
+        # Setup monkey tester with optimized weights for success
+        self.monkey_tester = EnhancedMonkeyTester(self.driver, self.logger, self.screenshot_manager,
+                                                  self.popup_handler, self.perf_probe,
+                                                  self.js_error_collector)
+        self.monkey_tester.success_screenshot_rate = self.smart_config['success_screenshot_rate']
+        self.monkey_tester.tracer = self.tracer
+        self.monkey_tester.waiter = self.waiter
+        if self.navigation_guard.enabled:
+            self.monkey_tester.navigation_guard = self.navigation_guard
+        self.monkey_tester.rng = self.rng
+        # Input corpora derived from the session seed, so a --seed rerun types the same values
+        self.monkey_tester.data_generator = DataGenerator(self.seed, self.smart_config['hostile_input_rate'])
+        
+        # Action trace for full-speed replay of this session
+        self.logger.metadata['seed'] = self.seed
+        if self.smart_config['record_trace']:
+            trace_file = f"{self.logger.log_dir}/action_trace.jsonl"
+            if self._resume_state:
+                truncate_file(trace_file, self._resume_state['trace_offset'])
+            self.trace_recorder = ActionTraceRecorder(trace_file, self.session_id, self.seed,
+                                                      {key: self.smart_config[key] for key in REPLAY_SETTINGS})
+            self.monkey_tester.trace_recorder = self.trace_recorder
+            self.logger.metadata['trace_file'] = trace_file
+        
+        self.circuit_breaker = HostCircuitBreaker(self.smart_config['circuit_breaker_threshold'])
+        if self._resume_state:
+            self.circuit_breaker.hosts.update(self._resume_state['circuit_breaker'])
+        self.checkpoint_manager = CheckpointManager(self.session_id, self.smart_config['checkpoint_interval'])
+        self.health_monitor = BrowserHealthMonitor(self.smart_config['browser_heartbeat_timeout'],
+                                                   self.smart_config['max_browser_restarts'])
+        if self.smart_config['resource_watchdog']:
+            self.watchdog = ResourceWatchdog(
+                lambda: driver_process_pid(self.driver),
+                interval=self.smart_config['watchdog_interval'],
+                max_rss_mb=self.smart_config['recycle_max_rss_mb'],
+                max_actions=self.smart_config['recycle_max_actions'],
+                max_latency_drift=self.smart_config['recycle_latency_drift']
+            ).start()
+        
+        # Adjust action weights for higher success rate
+        self.monkey_tester.action_weights = {
+            'scroll': 0.35,     # Scrolling rarely fails
+            'hover': 0.25,      # Hovering is generally safe
+            'keypress': 0.20,   # Key presses are reliable
+            'click': 0.15,      # Clicks can fail due to popups/interception
+            'input': 0.05       # Input can fail if no suitable fields
+        }
+        
+        # Live throughput/failure/stuck-session view for unattended runs
+        if self.smart_config['metrics_port'] is not None or self.smart_config['progress_stream']:
+            progress_file = f"{self.logger.log_dir}/progress.jsonl" if self.smart_config['progress_stream'] else None
+            self.live_metrics = LiveMetrics(self, self.smart_config['metrics_port'], progress_file,
+                                            self.smart_config['metrics_interval']).start()
+            if self.live_metrics.url:
+                print(f"📡 Live metrics: {self.live_metrics.url}")
+            if progress_file:
+                print(f"📡 Progress stream: {progress_file}")
+        
+        print("✅ Setup completed successfully")
+        return True
+    
+    def run_regression_tests(self):
+        """Run comprehensive regression test suite"""
+        print(f"\n🚀 Starting Regression Test Suite")
+        streamed = not isinstance(self.test_urls, list)
+        if streamed:
+            print(f"📊 Testing streamed URLs as they arrive with smart action selection")
+        else:
+            print(f"📊 Testing {len(self.test_urls)} URLs with smart action selection")
+        
+        start_time = datetime.now()
+        if self.smart_config['preflight']:
+            self._preflight()
+        
+        if self.time_budget:
+            print(f"⏳ Time budget: {self.time_budget:.0f}s shared across URLs by observed value")
+        elif not streamed:
+            total_tests_planned = len(self.test_urls) * self.smart_config['max_actions_per_url']
+            print(f"📈 Planned Tests: {total_tests_planned}")
+        print(f"🎯 Target Success Rate: {self.target_success_rate}%")
+        print("="*60)
+        # The run start is the first visit boundary: an interrupt during the first visit resumes from here
+        self.save_checkpoint()
+        
+        if self.time_budget:
+            if self.smart_config['tabs'] > 1:
+                print(f"ℹ️  Time-budget runs use a single tab; ignoring tabs={self.smart_config['tabs']}")
+            self._run_time_budget()
+        elif self.multiplexed():
+            self._run_multiplexed()
+        else:
+            for url in self.test_urls:
+                if url in self.completed_urls:
+                    continue
+                self.visit_index += 1
+                print(f"\n🌐 Testing URL {self.visit_index}{'' if streamed else f'/{len(self.test_urls)}'}: {url}")
+                self._test_url(url, self.visit_index, max_actions=self.smart_config['max_actions_per_url'])
+                self.completed_urls.add(url)
+                self.save_checkpoint()
+        
+        open_hosts = self.circuit_breaker.open_hosts() if self.circuit_breaker else {}
+        self.logger.metadata['open_circuits'] = open_hosts
+        self.logger.metadata['waits'] = self.waiter.summary()
+        self.logger.metadata['element_sampling'] = dict(self.monkey_tester.sampler.stats)
+        self.logger.metadata['test_data'] = dict(self.monkey_tester.data_generator.stats)
+        self.logger.metadata['page_classification'] = dict(self.monkey_tester.page_registry.stats)
+        self.logger.metadata['navigation_guard'] = dict(self.navigation_guard.stats, mode=self.navigation_guard.mode)
+        self.save_checkpoint(force=True)
+        
+        # Generate final results
+        end_time = datetime.now()
+        duration = end_time - start_time
+        
+        final_stats = self.logger.get_stats()
+        
+        print(f"\n{'='*60}")
+        print(f"🏁 REGRESSION TEST SUITE COMPLETED")
+        print(f"{'='*60}")
+        print(f"⏱️  Duration: {str(duration).split('.')[0]}")
+        print(f"📊 Total Tests: {final_stats['total_actions']}")
+        print(f"✅ Passed: {final_stats['successful_actions']}")
+        print(f"❌ Failed: {final_stats['failed_actions']}")
+        print(f"🎯 Success Rate: {final_stats['success_rate']}%")
+        if final_stats['js_error_actions']:
+            print(f"🪲 Actions raising JS errors: {final_stats['js_error_actions']}")
+        if final_stats['performance_failures']:
+            print(f"🐢 Slow interactions (long task ≥ {self.smart_config['long_task_threshold_ms']}ms): "
+                  f"{final_stats['performance_failures']}")
+        
+        if final_stats['success_rate'] >= self.target_success_rate:
+            print(f"🎉 SUCCESS: Achieved target success rate of {self.target_success_rate}%!")
+        else:
+            print(f"⚠️  Target not met. Achieved {final_stats['success_rate']}% vs target {self.target_success_rate}%")
+        
+        print(f"📸 Screenshots captured: {self.screenshot_manager.get_screenshot_stats()['total_screenshots']}")
+        print(f"🎲 Reproduce with: --seed {self.seed}" +
+              (f"  |  replay: --replay {self.trace_recorder.trace_file}" if self.trace_recorder else ""))
+        if self.popup_handler:
+            print(f"🧹 Overlays cleared: {self.popup_handler.stats['overlays_cleared']} "
+                  f"({self.popup_handler.stats['recipe_hits']} via cached recipes)")
+        for host, reason in open_hosts.items():
+            print(f"⛔ Circuit open for {host}: {reason}")
+        if final_stats['browser_restarts']:
+            print(f"💥 Browser restarts: {final_stats['browser_restarts']}")
+        if final_stats['browser_recycles']:
+            print(f"♻️  Browser recycles: {final_stats['browser_recycles']}")
+        picks = self.monkey_tester.sampler.stats
+        if picks['draws']:
+            print(f"🎯 Element picks in viewport: {picks['in_view'] / picks['draws'] * 100:.0f}% "
+                  f"({picks['occluded']} occluded)")
+        data = self.monkey_tester.data_generator.stats
+        hostile = sum(data[name] for name in HOSTILE_CLASSES)
+        if hostile:
+            print(f"🧬 Hostile inputs typed: {hostile} "
+                  f"({', '.join(f'{data[name]} {name}' for name in HOSTILE_CLASSES if data[name])})")
+        guard = self.navigation_guard.stats
+        if self.navigation_guard.enabled and (guard['blocked'] or guard['escaped']):
+            print(f"🧭 Off-site navigations {'recorded' if self.navigation_guard.mode == 'record' else 'blocked'}: "
+                  f"{guard['blocked']} (escaped: {guard['escaped']}) | restored via bfcache/history/reload: "
+                  f"{guard['restored_bfcache']}/{guard['restored_history']}/{guard['restored_reload']}")
+        waits = self.logger.metadata['waits']
+        print(f"⏲️  Waits ({waits['backend']}): {waits['events']['waits']} event-driven in {waits['events']['seconds']}s, "
+              f"{waits['polling']['waits']} polled in {waits['polling']['seconds']}s "
+              f"({waits['events']['commands'] + waits['polling']['commands']} WebDriver commands)")
+        if self.watchdog and self.watchdog.samples:
+            resources = self.watchdog.summary()
+            print(f"🧠 Browser RSS p50/max: {resources['rss_mb']['p50']}/{resources['rss_mb']['max']} MB")
+        
+        return final_stats
+    
+    def _test_url(self, url, visit_index, max_actions=None, deadline=None):
+        """One visit: load, page-specific actions, then random actions until max_actions or the deadline"""
+        with self.tracer.span('visit', 'visit', url=url, host=HostCircuitBreaker.host_for(url),
+                              visit_index=visit_index) as span:
+            visit = self._run_visit(url, visit_index, max_actions, deadline)
+            span.set(actions=visit['actions'], successful=visit['successful'], failures=visit['failures'],
+                     circuit_open=visit['circuit_open'])
+            return visit
+    
+    def _run_visit(self, url, visit_index, max_actions=None, deadline=None):
+        self._seed_visit(url, visit_index)
+        visit = {'actions': 0, 'successful': 0, 'failures': 0, 'new_states': 0, 'restarts': 0,
+                 'load_seconds': 0.0, 'load_error': None, 'circuit_open': False}
+        
+        if self.circuit_breaker and not self.circuit_breaker.allow(url):
+            print(f"   ⛔ Skipped - circuit open for {self.circuit_breaker.host_for(url)}")
+            visit['circuit_open'] = True
+            return visit
+        
+        load_start = time.time()
+        try:
+            with self.tracer.span('page_load', 'load', url=url):
+                self._load_with_recovery(url, defer_log=True)
+        except Exception as e:
+            visit['load_seconds'] = time.time() - load_start
+            signature = error_signature(str(e))
+            visit['load_error'] = signature
+            if self.circuit_breaker:
+                visit['circuit_open'] = self.circuit_breaker.record_failure(url, f"page load: {signature}")
+            print(f"   ❌ Error loading {url}: {str(e)}")
+            self.logger.logger.error(f"URL load failed: {url} - {str(e)}")
+            if self.screenshot_manager:
+                self.screenshot_manager.capture_error_screenshot("url_load", str(e), url)
+            return visit
+        visit['load_seconds'] = time.time() - load_start
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success(url)
+        
+        try:
+            with self.tracer.span('settle', 'wait'):
+                self.waiter.settle(self.smart_config['page_load_wait'])
+            
+            # Clear consent banners/modals before any action runs
+            if self.popup_handler:
+                with self.tracer.span('clear_overlays', 'overlays'):
+                    self.popup_handler.clear_overlays(url)
+            # Errors raised while settling or dismissing overlays belong to the page load too
+            self._log_page_load()
+            
+            # Initialize page object
+            if self.monkey_tester.initialize_page_object(url):
+                # Perform page-specific actions first (these have higher success rates)
+                with self.tracer.span('page_actions', 'action') as span:
+                    page_actions_done = self.monkey_tester.perform_page_specific_actions(url)
+                    span.set(page_object=type(self.monkey_tester.current_page).__name__)
+                
+                if page_actions_done:
+                    with self.tracer.span('settle', 'wait'):
+                        self.waiter.settle(1)  # Brief pause after page actions
+                # Drained either way so nothing raised here is blamed on the first random action
+                if self.js_error_collector:
+                    page_errors = self.js_error_collector.drain()
+                    if page_errors:
+                        self.logger.logger.warning(
+                            f"Page-specific actions on {url} raised {len(page_errors)} JS error(s)")
+            
+            # Perform controlled random actions
+            label = f"/{max_actions}" if max_actions else ""
+            while max_actions is None or visit['actions'] < max_actions:
+                if deadline and time.time() >= deadline:
+                    break
+                print(f"   Action {visit['actions'] + 1}{label}", end=" ")
+                action_start = time.time()
+                
+                # Perform smart action with bias toward success (a burst logs several safe actions)
+                outcomes = self._perform_smart_action(url, self.monkey_tester,
+                                                      max_actions - visit['actions'] if max_actions else None)
+                visit['actions'] += len(outcomes)
+                visit['successful'] += sum(outcomes)
+                visit['failures'] += len(outcomes) - sum(outcomes)
+                print("".join("✅" if success else "❌" for success in outcomes))
+                
+                if self.watchdog:
+                    for _ in outcomes:
+                        self.watchdog.record_action((time.time() - action_start) / len(outcomes))
+                
+                if self._check_browser(url):
+                    visit['restarts'] += 1
+                    if visit['restarts'] > 2:
+                        print(f"   💥 Browser keeps dying on {url} - abandoning this visit")
+                        break
+                elif self.watchdog:
+                    recycle_reason = self.watchdog.recycle_reason()
+                    if recycle_reason and not self.restart_browser(recycle_reason, url, event_type='browser_recycle'):
+                        # The old browser is already gone; the next load restarts it through the health check
+                        print(f"   💥 Browser recycle failed on {url} - abandoning this visit")
+                        break
+                
+                if deadline and self._is_new_state():
+                    visit['new_states'] += 1
+                
+                if self.circuit_breaker and self._record_driver_health(url):
+                    print(f"   ⛔ {self.circuit_breaker.host_for(url)} keeps failing at the driver level - "
+                          f"no more actions sent to it")
+                    visit['circuit_open'] = True
+                    break
+                
+                # Dynamic delay
+                delay = self.rng.uniform(*self.smart_config['action_delay_range'])
+                time.sleep(delay)
+                
+                # Check if we're meeting target and adjust if needed
+                current_stats = self.logger.get_stats()
+                if current_stats['total_actions'] > 10:  # After some actions
+                    current_rate = current_stats['success_rate']
+                    if current_rate < self.target_success_rate - 5:
+                        # If falling behind, increase safe action probability
+                        self.smart_config['safe_actions_weight'] = min(0.9, self.smart_config['safe_actions_weight'] + 0.1)
+            
+            if visit['actions']:
+                url_success_rate = (visit['successful'] / visit['actions']) * 100
+                print(f"   📊 URL Success Rate: {url_success_rate:.1f}% ({visit['successful']}/{visit['actions']})")
+            
+        except Exception as e:
+            self._log_page_load()
+            print(f"   ❌ Error testing {url}: {str(e)}")
+            self.logger.logger.error(f"URL test failed: {url} - {str(e)}")
+            if self.screenshot_manager:
+                self.screenshot_manager.capture_error_screenshot("url_load", str(e), url)
+        
+        return visit
+    
+    def _run_time_budget(self):
+        """Spend the wall-clock budget across URLs, weighted by the value each one keeps yielding"""
+        scheduler = self.scheduler = TimeBudgetScheduler(self.test_urls, self.time_budget)
+        if self._resume_state and self._resume_state.get('scheduler'):
+            scheduler.restore(self._resume_state['scheduler'])
+        scheduler.start()
+        
+        while True:
+            next_slice = scheduler.next_slice()
+            if not next_slice:
+                break
+            url, seconds = next_slice
+            self.visit_index += 1
+            print(f"\n🌐 Visit {self.visit_index}: {url} ({seconds:.0f}s slice, "
+                  f"{scheduler.remaining():.0f}s of budget left)")
+            
+            start = time.time()
+            visit = self._test_url(url, self.visit_index, deadline=start + seconds)
+            scheduler.record_visit(url, time.time() - start, load_seconds=visit['load_seconds'],
+                                   actions=visit['actions'], new_states=visit['new_states'],
+                                   failures=visit['failures'], load_error=visit['load_error'])
+            if visit['load_error']:
+                print(f"   ✂️  Page load failed ({visit['load_error']}) - {url} cut off, its time goes to the other URLs")
+            elif visit['circuit_open']:
+                scheduler.cut_off(url, 'circuit open')
+            self.save_checkpoint()
+        
+        self.budget_report = scheduler.report()
+        self.logger.metadata['time_budget'] = self.budget_report
+        
+        print(f"\n⏳ Time budget: {self.budget_report['spent_on_sites_seconds']:.0f}s of "
+              f"{self.budget_report['budget_seconds']:.0f}s spent on URLs")
+        for site in self.budget_report['sites']:
+            print(f"   • {site['url']}: {site['seconds']:.0f}s ({site['budget_share_percent']}%), "
+                  f"{site['visits']} visits, {site['new_states']} new states, {site['failures']} failures"
+                  + (f" - cut off: {site['cut_off_reason']}" if site['cut_off_reason'] else ""))
+    
+    def _load_with_recovery(self, url, defer_log=False):
+        """Load a URL; if the failure was a dead browser, restart it and try once more"""
+        try:
+            self._load_url(url, defer_log)
+        except Exception as e:
+            if not self.health_monitor or not self.health_monitor.should_check(error_signature(str(e))):
+                raise
+            reason = self.health_monitor.heartbeat(self.driver)
+            if not reason or not self.restart_browser(reason, url, reload=False):
+                raise
+            self._load_url(url, defer_log)
+    
+    def _check_browser(self, url):
+        """Heartbeat after driver-level failures; restart and restore the page if the browser died"""
+        if not self.health_monitor or not self.logger.test_results:
+            return False
+        if not self.health_monitor.should_check(self.logger.test_results[-1].get('error_signature')):
+            return False
+        reason = self.health_monitor.heartbeat(self.driver)
+        return bool(reason) and self.restart_browser(reason, url)
+    
+    def restart_browser(self, reason, url=None, reload=True, event_type='browser_restart'):
+        """Replace a dead (or worn out) browser with a fresh one and rebind every component to it"""
+        recycle = event_type == 'browser_recycle'
+        if not recycle and not self.health_monitor.can_restart():
+            self.logger.logger.error(f"Browser unhealthy ({reason}) but restart limit reached")
+            return False
+        
+        if recycle:
+            print(f"   ♻️  Recycling browser ({reason})")
+        else:
+            print(f"   💥 Browser unhealthy ({reason}) - restarting")
+        start = time.time()
+        if not recycle:
+            self.health_monitor.stats['restarts'] += 1  # Failed attempts count toward the limit too
+        self.health_monitor.quit_quietly(self.driver)
+        try:
+            driver = create_chrome_driver(
+                headless=self.headless,
+                resource_policy=self.resource_policy,
+                capture_browser_log=self.smart_config['js_error_oracle'],
+                page_load_strategy=self._page_load_strategy()
+            )
+        except Exception as e:
+            print(f"   💥 Could not start a new browser: {e}")
+            self.logger.log_event(f"{event_type}_failed", reason=reason, url=url, error=str(e),
+                                  restart_seconds=round(time.time() - start, 2), visit_index=self.visit_index)
+            return False
+        self._bind_driver(driver)
+        if self.watchdog:
+            self.watchdog.mark_recycled()
+        # Recorded before the reload: the new browser is up even if the page then fails to load
+        self.logger.log_event(event_type, reason=reason, url=url,
+                              restart_seconds=round(time.time() - start, 2), visit_index=self.visit_index)
+        
+        if reload and url:
+            try:
+                self._load_url(url)
+                if self.popup_handler:
+                    self.popup_handler.clear_overlays(url)
+                self.monkey_tester.initialize_page_object(url)
+            except Exception as e:
+                print(f"   ⚠️  Could not reload {url} after the restart: {e}")
+                self.logger.logger.error(f"Reload after browser restart failed: {url} - {e}")
+        return True
+    
+    def _bind_driver(self, driver):
+        """Point the suite and all driver-holding components at a new session"""
+        self.driver = driver
+        self.tracer.instrument(driver)
+        for component in (self.monkey_tester, self.screenshot_manager, self.popup_handler,
+                          self.perf_probe, self.js_error_collector, self.waiter, self.navigation_guard):
+            if component:
+                component.driver = driver
+        # Init scripts are per session, page objects hold the old driver
+        if self.perf_probe:
+            self.perf_probe.install()
+        if self.js_error_collector:
+            self.js_error_collector.install()
+        if self.navigation_guard:
+            self.navigation_guard.install()
+        self.monkey_tester.current_page = None
+    
+    def _record_driver_health(self, url):
+        """Feed the last action's outcome to the circuit breaker; True if the circuit just opened"""
+        signature = self.logger.test_results[-1].get('error_signature') if self.logger.test_results else None
+        if signature in DRIVER_FAILURE_SIGNATURES:
+            return self.circuit_breaker.record_failure(url, f"driver: {signature}")
+        # Ordinary element-level failures still prove the page and driver respond
+        self.circuit_breaker.record_success(url)
+        return False
+    
+    def _preflight(self):
+        """Drop URLs that do not answer HTTP at all before the browser spends a page load timeout on them"""
+        checker = PreflightChecker(timeout=self.smart_config['preflight_timeout'])
+        if not isinstance(self.test_urls, list):
+            # Streamed sources are checked batch by batch as the run pulls them
+            self.logger.metadata['preflight'] = []
+            self.test_urls = checker.check_stream(self.test_urls, results=self.logger.metadata['preflight'])
+            return
+        
+        start = time.time()
+        results = checker.check_all(self.test_urls)
+        self.logger.metadata['preflight'] = results
+        
+        reachable = [r['url'] for r in results if r['reachable']]
+        print(f"🛫 Preflight: {len(reachable)}/{len(results)} URLs reachable ({time.time() - start:.1f}s)")
+        for result in results:
+            if not result['reachable']:
+                print(f"   ⛔ Skipping {result['url']}: {result['error']}")
+        self.test_urls = reachable
+    
+    def multiplexed(self):
+        """True when URLs are interleaved across tabs (time-budget runs always use a single tab)"""
+        return self.smart_config['tabs'] > 1 and not self.time_budget
+    
+    def _page_load_strategy(self):
+        # With 'normal'/'eager' chromedriver holds scripts in one tab until another tab's navigation is done
+        return 'none' if self.multiplexed() else None
+    
+    def _run_multiplexed(self):
+        """Test the URLs across several tabs of one browser"""
+        tabs, isolate = self.smart_config['tabs'], self.smart_config['isolate_tabs']
+        print(f"🗂️  Multiplexing {tabs} {'isolated contexts' if isolate else 'tabs'} in one browser "
+              f"(action traces and checkpoints are not recorded in this mode)")
+        multiplexer = TabMultiplexer(self, tabs=tabs, isolate=isolate).open()
+        try:
+            urls = (url for url in self.test_urls if url not in self.completed_urls)
+            summary = multiplexer.run(urls, self.smart_config['max_actions_per_url'])
+        finally:
+            multiplexer.close()
+        self.logger.metadata['multiplexing'] = summary
+        print(f"🗂️  {summary['actions']} actions over {summary['visits']} visits in {summary['wall_seconds']}s "
+              f"({summary['actions_per_second']} actions/s, {summary['idle_seconds']}s idle)")
+    
+    def _is_new_state(self):
+        """True the first time the page reaches a given URL/title/DOM-size state"""
+        try:
+            state = self.driver.execute_script(STATE_KEY_SCRIPT)
+        except Exception:
+            return False
+        if state in self.seen_states:
+            return False
+        self.seen_states.add(state)
+        return True
+    
+    def _checkpoint_state(self):
+        """Everything needed to continue the run after the visit that just finished"""
+        return json.loads(json.dumps({
+            'session_id': self.session_id,
+            'seed': self.seed,
+            'rng_state': encode_rng_state(self.rng.getstate()),
+            'visit_index': self.visit_index,
+            'completed_urls': sorted(self.completed_urls),
+            'test_urls': self.test_urls if isinstance(self.test_urls, list) else None,
+            'time_budget': self.time_budget,
+            'scheduler': self.scheduler.get_state() if self.scheduler else None,
+            'smart_config': self.smart_config,
+            'stats': self.logger.action_stats,
+            'metadata': self.logger.metadata,
+            'results_offset': self.logger.results_offset(),
+            'trace_offset': self.trace_recorder.offset() if self.trace_recorder else None,
+            'screenshot_count': self.screenshot_manager.screenshot_count,
+            'circuit_breaker': self.circuit_breaker.hosts if self.circuit_breaker else {},
+            'seen_states': sorted(self.seen_states)
+        }, default=str))
+    
+    def save_checkpoint(self, force=False):
+        """Snapshot the visit boundary; write it when the interval has passed (or, forced, write the last one)"""
+        # Interleaved tabs never reach a boundary where no visit is half done
+        if not self.checkpoint_manager or self.multiplexed():
+            return
+        try:
+            if not force:
+                self._boundary_state = self._checkpoint_state()
+            # Never the live state when forced: a half-done visit is not in completed_urls
+            if self._boundary_state is not None and (force or self.checkpoint_manager.due()):
+                self.checkpoint_manager.save(self._boundary_state)
+        except Exception as e:
+            self.logger.logger.warning(f"Could not write checkpoint: {e}")
+    
+    def load_checkpoint(self, session_id):
+        """Continue an earlier session from its last checkpoint; call before setup()"""
+        state = CheckpointManager.load(session_id)
+        self.session_id = session_id
+        self.seed = state['seed']
+        self.rng.setstate(decode_rng_state(state['rng_state']))
+        self.visit_index = state['visit_index']
+        self.completed_urls = set(state['completed_urls'])
+        self.seen_states = set(state['seen_states'])
+        self.time_budget = state['time_budget']
+        if state['test_urls'] is not None:
+            self.test_urls = state['test_urls']
+        self.smart_config.update(state['smart_config'])
+        self.smart_config['action_delay_range'] = tuple(self.smart_config['action_delay_range'])
+        self._resume_state = state
+        
+        print(f"⏯️  Resuming session {session_id} from checkpoint saved {state['saved_at'][:19]} "
+              f"({self.visit_index} visits, {state['stats']['total_actions']} actions done)")
+        return state
+    
+    def _seed_visit(self, url, visit_index):
+        """Give each URL visit its own RNG derived from the session seed"""
+        visit_seed = derive_seed(self.seed, url, visit_index)
+        self.rng = random.Random(visit_seed)
+        self.monkey_tester.rng = self.rng
+        if self.trace_recorder:
+            self.trace_recorder.record_visit(url, visit_seed)
+    
+    def replay_trace(self, trace_file):
+        """Re-execute a recorded action trace with no pacing delays or element discovery"""
+        session, visits = load_trace(trace_file)
+        total_actions = sum(len(v['actions']) for v in visits)
+        print(f"\n⏩ Replaying trace {trace_file}")
+        print(f"📋 Recorded session: {session.get('session_id')} (seed {session.get('seed')})")
+        print(f"📊 {len(visits)} visits, {total_actions} actions")
+        
+        replayer = ActionReplayer(self._load_for_replay, self.monkey_tester)
+        summary = replayer.replay(visits)
+        
+        print(f"\n🏁 Replay completed in {summary['duration_seconds']}s - "
+              f"{summary['actions']} actions, {summary['failed']} failed")
+        for cluster in self.logger.error_clusters.get_clusters(5):
+            print(f"   ❌ {cluster['signature']} on {cluster['host']} ({cluster['action_type']}) x{cluster['count']}")
+        return summary
+    
+    def _load_for_replay(self, url):
+        """Page load used by replays - no settle wait, overlays still cleared"""
+        self._load_url(url)
+        if self.popup_handler:
+            self.popup_handler.clear_overlays(url)
+    
+    def _load_url(self, url, defer_log=False):
+        """Load a URL and record its load time, optionally against a no-policy, full-load baseline"""
+        policy = self.resource_policy
+        measure_baseline = policy and policy.applied and self.smart_config['measure_policy_baseline']
+        baseline_time = None
+        
+        if measure_baseline:
+            policy.clear(self.driver)
+            policy.clear_cache(self.driver)
+            start = time.time()
+            self.driver.get(url)
+            if policy.eager:
+                # The driver runs with the policy's 'eager' strategy; the baseline is a 'normal' load
+                self.waiter.wait_for_load(timeout=PAGE_LOAD_TIMEOUT)
+            baseline_time = time.time() - start
+            policy.apply(self.driver)
+            policy.clear_cache(self.driver)
+        
+        start = time.time()
+        self.driver.get(url)
+        load_time = time.time() - start
+        
+        details = {
+            'policy': policy.name if policy and policy.applied else 'off',
+            'baseline_load_time': round(baseline_time, 3) if baseline_time is not None else None,
+            'perf': self.perf_probe.collect(include_navigation=True) if self.perf_probe else None,
+            # Errors raised while loading belong to the page, not to the first action
+            'js_errors': self.js_error_collector.drain() if self.js_error_collector else None
+        }
+        if defer_log:
+            self._pending_page_load = (url, load_time, details)
+        else:
+            self.logger.log_page_load(url, load_time, **details)
+        
+        if baseline_time is not None:
+            print(f"   ⏱️  Loaded in {load_time:.2f}s (full load without policy: {baseline_time:.2f}s)")
+        return load_time
+    
+    def _log_page_load(self):
+        """Log a deferred page load, adding the JS errors raised since it finished loading"""
+        if not self._pending_page_load:
+            return
+        url, load_time, details = self._pending_page_load
+        self._pending_page_load = None
+        if self.js_error_collector:
+            details['js_errors'] = (details['js_errors'] or []) + self.js_error_collector.drain()
+        self.logger.log_page_load(url, load_time, **details)
+    
+    def _should_perform_safe_action(self):
+        """Determine if should perform a safe action based on current success rate"""
+        current_stats = self.logger.get_stats()
+        
+        if current_stats['total_actions'] == 0:
+            return self.rng.random() < self.smart_config['safe_actions_weight']
+        
+        current_rate = current_stats['success_rate']
+        
+        # If below target, increase safe action probability
+        if current_rate < self.target_success_rate:
+            return self.rng.random() < 0.8
+        else:
+            return self.rng.random() < self.smart_config['safe_actions_weight']
+    
+    def _perform_smart_action(self, url, monkey_tester, remaining=None):
+        """One loop step: a safe action (or burst of them) or a random monkey action; returns the outcomes"""
+        with self.tracer.span('action', 'action') as span:
+            if self._should_perform_safe_action():
+                # Perform safer actions more frequently
+                burst = min(self.smart_config['burst_size'], remaining or self.smart_config['burst_size'])
+                if burst > 1:
+                    span.set(burst=burst)
+                    try:
+                        return monkey_tester.perform_safe_burst(url, burst)
+                    except Exception as e:
+                        # Like a single safe action: log the failure instead of ending the URL's test
+                        monkey_tester.record_action('burst', "unknown", False, str(e), url=url)
+                        return [False]
+                return [self._perform_safe_action(url, monkey_tester)]
+            # Perform regular monkey action
+            return [monkey_tester.perform_random_monkey_action(url)]
+    
+    def _perform_safe_action(self, url, monkey_tester=None):
+        """Perform a statistically safer action"""
+        monkey_tester = monkey_tester or self.monkey_tester
+        # Safe actions are scrolling and hovering - they rarely fail
+        safe_actions = ['scroll', 'hover', 'keypress']
+        action_type = self.rng.choice(safe_actions)
+        
+        try:
+            if action_type == 'scroll':
+                success, element_info = monkey_tester._random_scroll()
+            elif action_type == 'hover':
+                success, element_info = monkey_tester._random_hover()
+            else:  # keypress
+                success, element_info = monkey_tester._random_keypress()
+            
+            # Log the action (JS errors raised by the action can still fail it)
+            return monkey_tester.record_action(action_type, element_info, success, url=url)
+            
+        except Exception as e:
+            monkey_tester.record_action(action_type, "unknown", False, str(e), url=url)
+            return False
+    
+    def generate_reports(self):
+        """Generate comprehensive reports"""
+        print(f"\n📋 Generating comprehensive reports...")
+        self.screenshot_manager.flush()
+        
+        # Save session data
+        session_file = self.logger.save_session_data()
+        print(f"💾 Session data saved: {session_file}")
+        
+        # Generate all report formats
+        reporting = EnhancedReporting(
+            self.session_id,
+            self.logger.test_results,
+            self.logger.get_stats(),
+            self.screenshot_manager,
+            error_clusters=self.logger.error_clusters,
+            page_loads=self.logger.page_loads,
+            budget_report=self.budget_report,
+            events=self.logger.events,
+            resource_usage=self.watchdog.summary() if self.watchdog else None
+        )
+        
+        with self.tracer.span('reports', 'reports'):
+            reports = reporting.generate_all_reports()
+        
+        return reports
+    
+    def cleanup(self):
+        """Clean up resources"""
+        if self.live_metrics:
+            self.live_metrics.stop()
+        if self.screenshot_manager:
+            self.screenshot_manager.flush()
+        if self.watchdog:
+            self.watchdog.stop()
+        if self.trace_recorder:
+            self.trace_recorder.close()
+        if self.logger:
+            self.logger.close()
+        if self.driver:
+            self.driver.quit()
+        if self._session_span:
+            self._session_span.end()
+        self.tracer.close()
         print("🧹 Cleanup completed")
\ No newline at end of file
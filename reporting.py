@@ -1,266 +1,584 @@
-import json
-import csv
-import os
-from datetime import datetime
-from jinja2 import Template
-import logging
-
-logger = logging.getLogger(__name__)
-
-class EnhancedReporting:
-    """Multi-format reporting system"""
-    
-    def __init__(self, session_id, test_results, stats, screenshot_manager=None):
-        self.session_id = session_id
-        self.test_results = test_results
-        self.stats = stats
-        self.screenshot_manager = screenshot_manager
-        self.setup_directories()
-    
-    def setup_directories(self):
-        """Setup report directories"""
-        self.report_dir = f"reports/{self.session_id}"
-        os.makedirs(self.report_dir, exist_ok=True)
-        os.makedirs(f"{self.report_dir}/csv", exist_ok=True)
-        os.makedirs(f"{self.report_dir}/json", exist_ok=True)
-        os.makedirs(f"{self.report_dir}/html", exist_ok=True)
-    
-    def generate_csv_report(self):
-        """Generate CSV report"""
-        csv_file = f"{self.report_dir}/csv/test_results.csv"
-        
-        try:
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Timestamp', 'Action Type', 'Element Info', 'Status', 
-                    'Error Message', 'Screenshot Path'
-                ])
-                
-                for result in self.test_results:
-                    writer.writerow([
-                        result['timestamp'],
-                        result['action_type'],
-                        result['element_info'],
-                        result['status'],
-                        result.get('error_msg', ''),
-                        result.get('screenshot_path', '')
-                    ])
-            
-            logger.info(f"CSV report generated: {csv_file}")
-            return csv_file
-            
-        except Exception as e:
-            logger.error(f"Failed to generate CSV report: {e}")
-            return None
-    
-    def generate_json_report(self):
-        """Generate JSON report"""
-        json_file = f"{self.report_dir}/json/test_results.json"
-        
-        try:
-            report_data = {
-                'session_id': self.session_id,
-                'generated_at': datetime.now().isoformat(),
-                'statistics': self.stats,
-                'test_results': self.test_results,
-                'summary': {
-                    'total_tests': len(self.test_results),
-                    'passed': len([r for r in self.test_results if r['result']]),
-                    'failed': len([r for r in self.test_results if not r['result']]),
-                    'success_rate_percent': self.stats.get('success_rate', 0)
-                }
-            }
-            
-            if self.screenshot_manager:
-                report_data['screenshot_stats'] = self.screenshot_manager.get_screenshot_stats()
-            
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"JSON report generated: {json_file}")
-            return json_file
-            
-        except Exception as e:
-            logger.error(f"Failed to generate JSON report: {e}")
-            return None
-    
-    def generate_html_report(self):
-        """Generate HTML report with embedded screenshots"""
-        html_file = f"{self.report_dir}/html/test_report.html"
-        
-        try:
-            # Calculate additional statistics
-            total_tests = len(self.test_results)
-            passed_tests = len([r for r in self.test_results if r['result']])
-            failed_tests = total_tests - passed_tests
-            success_rate = self.stats.get('success_rate', 0)
-            
-            # Group results by action type for analysis
-            action_analysis = {}
-            for result in self.test_results:
-                action = result['action_type']
-                if action not in action_analysis:
-                    action_analysis[action] = {'total': 0, 'passed': 0, 'failed': 0}
-                
-                action_analysis[action]['total'] += 1
-                if result['result']:
-                    action_analysis[action]['passed'] += 1
-                else:
-                    action_analysis[action]['failed'] += 1
-            
-            # Generate HTML content
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>QA-Monkey Test Report - {self.session_id}</title>
-    <style>
-        body {{ font-family: 'Arial', sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 20px; }}
-        .header h1 {{ margin: 0; font-size: 2.5em; }}
-        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }}
-        .stat-card {{ background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; }}
-        .stat-number {{ font-size: 2.5em; font-weight: bold; margin-bottom: 10px; }}
-        .success {{ color: #27ae60; }}
-        .danger {{ color: #e74c3c; }}
-        .warning {{ color: #f39c12; }}
-        .info {{ color: #3498db; }}
-        .results-table {{ width: 100%; border-collapse: collapse; }}
-        .results-table th, .results-table td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        .results-table th {{ background: #f8f9fa; font-weight: bold; }}
-        .status-badge {{ padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }}
-        .status-success {{ background: #d4edda; color: #155724; }}
-        .status-failed {{ background: #f8d7da; color: #721c24; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🐒 QA-Monkey Test Report</h1>
-            <p><strong>Session:</strong> {self.session_id}</p>
-            <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p><strong>Framework:</strong> Python-Selenium with POM Design</p>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-number info">{total_tests}</div>
-                <div>Total Tests</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number success">{passed_tests}</div>
-                <div>Passed</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number danger">{failed_tests}</div>
-                <div>Failed</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number {'success' if success_rate >= 90 else 'warning' if success_rate >= 70 else 'danger'}">{success_rate}%</div>
-                <div>Success Rate</div>
-            </div>
-        </div>
-        
-        <h2>📊 Action Analysis</h2>
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-bottom: 30px;">
-"""
-            
-            for action, data in action_analysis.items():
-                success_pct = (data['passed'] / data['total'] * 100) if data['total'] > 0 else 0
-                html_content += f"""
-            <div style="border: 1px solid #ddd; border-radius: 6px; padding: 15px; background: white;">
-                <div style="font-weight: bold; margin-bottom: 10px; color: #495057;">{action.upper()} Actions</div>
-                <p>Total: {data['total']} | Passed: {data['passed']} | Failed: {data['failed']}</p>
-                <div style="background: #e9ecef; border-radius: 4px; overflow: hidden; height: 20px;">
-                    <div style="height: 100%; background: linear-gradient(90deg, #28a745, #20c997); width: {success_pct}%;"></div>
-                </div>
-                <small>{success_pct:.1f}% success rate</small>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-        
-        <h2>🔍 Detailed Test Results</h2>
-        <table class="results-table">
-            <thead>
-                <tr>
-                    <th>Timestamp</th>
-                    <th>Action</th>
-                    <th>Element</th>
-                    <th>Status</th>
-                    <th>Error</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-            
-            for result in self.test_results[:50]:  # Limit to first 50 for readability
-                timestamp = result['timestamp'].split('T')[1][:8]
-                status_class = 'status-success' if result['result'] else 'status-failed'
-                error_msg = result.get('error_msg', '')[:60] if result.get('error_msg') else '-'
-                
-                html_content += f"""
-                <tr>
-                    <td>{timestamp}</td>
-                    <td><strong>{result['action_type'].upper()}</strong></td>
-                    <td>{result['element_info'][:50]}</td>
-                    <td><span class="status-badge {status_class}">{result['status']}</span></td>
-                    <td>{error_msg}</td>
-                </tr>
-"""
-            
-            html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
-            
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"HTML report generated: {html_file}")
-            return html_file
-            
-        except Exception as e:
-            logger.error(f"Failed to generate HTML report: {e}")
-            return None
-    
-    def generate_all_reports(self):
-        """Generate all report formats"""
-        reports = {}
-        
-        reports['csv'] = self.generate_csv_report()
-        reports['json'] = self.generate_json_report()
-        reports['html'] = self.generate_html_report()
-        
-        # Generate summary
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r['result']])
-        success_rate = self.stats.get('success_rate', 0)
-        
-        summary = f"""
-📊 REGRESSION TEST SUMMARY
-{'='*50}
-Session ID: {self.session_id}
-Framework: Python-Selenium with POM Design
-Total Tests: {total_tests}
-Passed: {passed_tests}
-Failed: {total_tests - passed_tests}
-Success Rate: {success_rate}%
-{'='*50}
-
-📁 Generated Reports:
-- CSV: {reports['csv']}
-- JSON: {reports['json']}  
-- HTML: {reports['html']}
-"""
-        
-        print(summary)
+import json
+import csv
+import os
+from datetime import datetime
+from html import escape
+from jinja2 import Template
+import logging
+
+from error_signatures import ErrorClusterer
+from perf_metrics import summarize_by_url
+
+logger = logging.getLogger(__name__)
+
+class EnhancedReporting:
+    """Multi-format reporting system"""
+    
+    def __init__(self, session_id, test_results, stats, screenshot_manager=None, error_clusters=None,
+                 page_loads=None, budget_report=None, events=None, resource_usage=None):
+        self.session_id = session_id
+        self.test_results = test_results
+        self.stats = stats
+        self.screenshot_manager = screenshot_manager
+        # Reuse the logger's incremental clusters when available
+        self.error_clusters = error_clusters or ErrorClusterer().add_all(test_results)
+        self.page_loads = page_loads or []
+        self.budget_report = budget_report
+        self.events = events or []
+        self.resource_usage = resource_usage
+        self.setup_directories()
+    
+    def setup_directories(self):
+        """Setup report directories"""
+        self.report_dir = f"reports/{self.session_id}"
+        os.makedirs(self.report_dir, exist_ok=True)
+        os.makedirs(f"{self.report_dir}/csv", exist_ok=True)
+        os.makedirs(f"{self.report_dir}/json", exist_ok=True)
+        os.makedirs(f"{self.report_dir}/html", exist_ok=True)
+    
+    def generate_csv_report(self):
+        """Generate CSV report"""
+        csv_file = f"{self.report_dir}/csv/test_results.csv"
+        
+        try:
+            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow([
+                    'Timestamp', 'Action Type', 'Element Info', 'Status', 
+                    'Error Message', 'Screenshot Path', 'Error Signature'
+                ])
+                
+                for result in self.test_results:
+                    writer.writerow([
+                        result['timestamp'],
+                        result['action_type'],
+                        result['element_info'],
+                        result['status'],
+                        result.get('error_msg', ''),
+                        result.get('screenshot_path', ''),
+                        result.get('error_signature', '')
+                    ])
+            
+            logger.info(f"CSV report generated: {csv_file}")
+            return csv_file
+            
+        except Exception as e:
+            logger.error(f"Failed to generate CSV report: {e}")
+            return None
+    
+    def generate_json_report(self):
+        """Generate JSON report"""
+        json_file = f"{self.report_dir}/json/test_results.json"
+        
+        try:
+            report_data = {
+                'session_id': self.session_id,
+                'generated_at': datetime.now().isoformat(),
+                'statistics': self.stats,
+                'error_clusters': self.error_clusters.get_clusters(),
+                'page_loads': self.page_loads,
+                'page_load_summary': self.get_page_load_summary(),
+                'performance_by_url': summarize_by_url(self.page_loads, self.test_results),
+                'time_budget': self.budget_report,
+                'events': self.events,
+                'resource_usage': self.resource_usage,
+                'test_results': self.test_results,
+                'summary': {
+                    'total_tests': len(self.test_results),
+                    'passed': len([r for r in self.test_results if r['result']]),
+                    'failed': len([r for r in self.test_results if not r['result']]),
+                    'success_rate_percent': self.stats.get('success_rate', 0),
+                    'performance_failures': self.stats.get('performance_failures', 0),
+                    'error_signatures': self.error_clusters.get_signature_counts()
+                }
+            }
+            
+            if self.screenshot_manager:
+                report_data['screenshot_stats'] = self.screenshot_manager.get_screenshot_stats()
+            
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(report_data, f, indent=2, ensure_ascii=False)
+            
+            logger.info(f"JSON report generated: {json_file}")
+            return json_file
+            
+        except Exception as e:
+            logger.error(f"Failed to generate JSON report: {e}")
+            return None
+    
+    def generate_html_report(self):
+        """Generate HTML report with embedded screenshots"""
+        html_file = f"{self.report_dir}/html/test_report.html"
+        
+        try:
+            # Calculate additional statistics
+            total_tests = len(self.test_results)
+            passed_tests = len([r for r in self.test_results if r['result']])
+            failed_tests = total_tests - passed_tests
+            success_rate = self.stats.get('success_rate', 0)
+            
+            # Group results by action type for analysis
+            action_analysis = {}
+            for result in self.test_results:
+                action = result['action_type']
+                if action not in action_analysis:
+                    action_analysis[action] = {'total': 0, 'passed': 0, 'failed': 0}
+                
+                action_analysis[action]['total'] += 1
+                if result['result']:
+                    action_analysis[action]['passed'] += 1
+                else:
+                    action_analysis[action]['failed'] += 1
+            
+            # Generate HTML content
+            html_content = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>QA-Monkey Test Report - {self.session_id}</title>
+    <style>
+        body {{ font-family: 'Arial', sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; }}
+        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 20px; }}
+        .header h1 {{ margin: 0; font-size: 2.5em; }}
+        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }}
+        .stat-card {{ background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; }}
+        .stat-number {{ font-size: 2.5em; font-weight: bold; margin-bottom: 10px; }}
+        .success {{ color: #27ae60; }}
+        .danger {{ color: #e74c3c; }}
+        .warning {{ color: #f39c12; }}
+        .info {{ color: #3498db; }}
+        .results-table {{ width: 100%; border-collapse: collapse; }}
+        .results-table th, .results-table td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
+        .results-table th {{ background: #f8f9fa; font-weight: bold; }}
+        .status-badge {{ padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }}
+        .status-success {{ background: #d4edda; color: #155724; }}
+        .status-failed {{ background: #f8d7da; color: #721c24; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🐒 QA-Monkey Test Report</h1>
+            <p><strong>Session:</strong> {self.session_id}</p>
+            <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p><strong>Framework:</strong> Python-Selenium with POM Design</p>
+        </div>
+        
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-number info">{total_tests}</div>
+                <div>Total Tests</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number success">{passed_tests}</div>
+                <div>Passed</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number danger">{failed_tests}</div>
+                <div>Failed</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number {'success' if success_rate >= 90 else 'warning' if success_rate >= 70 else 'danger'}">{success_rate}%</div>
+                <div>Success Rate</div>
+            </div>
+        </div>
+        
+        <h2>📊 Action Analysis</h2>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-bottom: 30px;">
+"""
+            
+            for action, data in action_analysis.items():
+                success_pct = (data['passed'] / data['total'] * 100) if data['total'] > 0 else 0
+                html_content += f"""
+            <div style="border: 1px solid #ddd; border-radius: 6px; padding: 15px; background: white;">
+                <div style="font-weight: bold; margin-bottom: 10px; color: #495057;">{action.upper()} Actions</div>
+                <p>Total: {data['total']} | Passed: {data['passed']} | Failed: {data['failed']}</p>
+                <div style="background: #e9ecef; border-radius: 4px; overflow: hidden; height: 20px;">
+                    <div style="height: 100%; background: linear-gradient(90deg, #28a745, #20c997); width: {success_pct}%;"></div>
+                </div>
+                <small>{success_pct:.1f}% success rate</small>
+            </div>
+"""
+            
+            html_content += """
+        </div>
+"""
+            html_content += self._build_budget_section()
+            html_content += self._build_events_section()
+            html_content += self._build_resource_section()
+            html_content += self._build_cluster_section()
+            html_content += self._build_page_load_section()
+            html_content += self._build_performance_section()
+            html_content += """
+        <h2>🔍 Detailed Test Results</h2>
+        <table class="results-table">
+            <thead>
+                <tr>
+                    <th>Timestamp</th>
+                    <th>Action</th>
+                    <th>Element</th>
+                    <th>Status</th>
+                    <th>Signature</th>
+                    <th>Error</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+            
+            for result in self.test_results[:50]:  # Limit to first 50 for readability
+                timestamp = result['timestamp'].split('T')[1][:8]
+                status_class = 'status-success' if result['result'] else 'status-failed'
+                error_msg = result.get('error_msg', '')[:60] if result.get('error_msg') else '-'
+                
+                html_content += f"""
+                <tr>
+                    <td>{timestamp}</td>
+                    <td><strong>{result['action_type'].upper()}</strong></td>
+                    <td>{result['element_info'][:50]}</td>
+                    <td><span class="status-badge {status_class}">{result['status']}</span></td>
+                    <td>{result.get('error_signature') or '-'}</td>
+                    <td>{error_msg}</td>
+                </tr>
+"""
+            
+            html_content += """
+            </tbody>
+        </table>
+    </div>
+</body>
+</html>
+"""
+            
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            
+            logger.info(f"HTML report generated: {html_file}")
+            return html_file
+            
+        except Exception as e:
+            logger.error(f"Failed to generate HTML report: {e}")
+            return None
+    
+    def get_page_load_summary(self):
+        """Average load time per URL, with and without the resource policy"""
+        summary = {}
+        for load in self.page_loads:
+            entry = summary.setdefault(load['url'], {'loads': 0, 'load_time': 0.0,
+                                                     'baseline_loads': 0, 'baseline_load_time': 0.0,
+                                                     'policy': load.get('policy', 'off')})
+            entry['loads'] += 1
+            entry['load_time'] += load['load_time']
+            if load.get('baseline_load_time') is not None:
+                entry['baseline_loads'] += 1
+                entry['baseline_load_time'] += load['baseline_load_time']
+        
+        for entry in summary.values():
+            entry['avg_load_time'] = round(entry.pop('load_time') / entry['loads'], 3)
+            baseline_loads = entry.pop('baseline_loads')
+            baseline_total = entry.pop('baseline_load_time')
+            if baseline_loads:
+                entry['avg_baseline_load_time'] = round(baseline_total / baseline_loads, 3)
+                saved = entry['avg_baseline_load_time'] - entry['avg_load_time']
+                entry['savings_percent'] = round(saved / entry['avg_baseline_load_time'] * 100, 1) \
+                    if entry['avg_baseline_load_time'] > 0 else 0
+        
+        return summary
+    
+    @staticmethod
+    def _svg_line_chart(points, title, unit, color, width=900, height=160):
+        """Inline SVG polyline of (t, value) points - no charting library needed"""
+        points = [(t, v) for t, v in points if v is not None]
+        if len(points) < 2:
+            return ""
+        max_t = max(t for t, _ in points) or 1
+        max_v = max(v for _, v in points) or 1
+        coords = " ".join(f"{t / max_t * width:.1f},{height - v / max_v * (height - 10):.1f}" for t, v in points)
+        return f"""
+        <div style="margin-bottom: 20px;">
+            <strong>{escape(title)}</strong> (max {max_v}{unit} over {max_t:.0f}s)
+            <svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"
+                 style="display: block; background: #f8f9fa; border: 1px solid #dee2e6;">
+                <polyline fill="none" stroke="{color}" stroke-width="2" points="{coords}"/>
+            </svg>
+        </div>
+"""
+    
+    def _build_resource_section(self):
+        """Build browser process-tree resource curves for the HTML report"""
+        if not self.resource_usage or not self.resource_usage['samples']:
+            return ""
+        
+        samples = self.resource_usage['samples']
+        restarts = len([e for e in self.events if e['event_type'] == 'browser_restart'])
+        recycles = len([e for e in self.events if e['event_type'] == 'browser_recycle'])
+        section = f"""
+        <h2>🧠 Browser Resources</h2>
+        <p>{len(samples)} samples every {self.resource_usage['interval_seconds']}s &middot;
+        {restarts} browser restart(s) &middot; {recycles} recycle(s) &middot;
+        thresholds: {escape(str(self.resource_usage['thresholds']))}</p>
+"""
+        section += self._svg_line_chart([(s['t'], s['rss_mb']) for s in samples],
+                                        'RSS of chromedriver + Chrome process tree', ' MB', '#667eea')
+        section += self._svg_line_chart([(s['t'], s['cpu_percent']) for s in samples],
+                                        'CPU', '%', '#e67e22')
+        section += self._svg_line_chart([(s['t'], s['latency_p95_ms']) for s in samples],
+                                        'p95 action latency (last 30 actions)', ' ms', '#e74c3c')
+        return section
+    
+    def _build_events_section(self):
+        """Build the run event table (browser restarts etc.) for the HTML report"""
+        if not self.events:
+            return ""
+        
+        section = """
+        <h2>💥 Run Events</h2>
+        <table class="results-table" style="margin-bottom: 30px;">
+            <thead>
+                <tr>
+                    <th>Time</th>
+                    <th>Event</th>
+                    <th>Reason</th>
+                    <th>URL</th>
+                    <th>Details</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        for event in self.events:
+            details = {k: v for k, v in event.items() if k not in ('timestamp', 'event_type', 'reason', 'url')}
+            section += f"""
+                <tr>
+                    <td>{event['timestamp'].replace('T', ' ')[:19]}</td>
+                    <td><strong>{escape(event['event_type'])}</strong></td>
+                    <td>{escape(str(event.get('reason') or '-'))}</td>
+                    <td>{escape(event.get('url') or '-')}</td>
+                    <td>{escape(', '.join(f'{k}={v}' for k, v in details.items()))}</td>
+                </tr>
+"""
+        
+        section += """
+            </tbody>
+        </table>
+"""
+        return section
+    
+    def _build_budget_section(self):
+        """Build the time budget breakdown for the HTML report"""
+        if not self.budget_report:
+            return ""
+        
+        budget = self.budget_report
+        section = f"""
+        <h2>⏳ Time Budget</h2>
+        <p>Budget {budget['budget_seconds']:.0f}s &middot; spent on URLs {budget['spent_on_sites_seconds']}s
+        &middot; scheduler overhead {budget['scheduler_overhead_seconds']}s
+        &middot; unused {budget['unused_seconds']}s &middot; overrun {budget['overrun_seconds']}s</p>
+        <table class="results-table" style="margin-bottom: 30px;">
+            <thead>
+                <tr>
+                    <th>URL</th>
+                    <th>Status</th>
+                    <th>Visits</th>
+                    <th>Seconds</th>
+                    <th>Share</th>
+                    <th>Loading (s)</th>
+                    <th>Acting (s)</th>
+                    <th>Actions</th>
+                    <th>New States</th>
+                    <th>Failures</th>
+                    <th>Value/s</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        for site in budget['sites']:
+            status = site['status'] + (f": {site['cut_off_reason']}" if site['cut_off_reason'] else '')
+            section += f"""
+                <tr>
+                    <td>{escape(site['url'])}</td>
+                    <td>{escape(status)}</td>
+                    <td>{site['visits']}</td>
+                    <td>{site['seconds']}</td>
+                    <td>{site['budget_share_percent']}%</td>
+                    <td>{site['load_seconds']}</td>
+                    <td>{site['action_seconds']}</td>
+                    <td>{site['actions']}</td>
+                    <td>{site['new_states']}</td>
+                    <td>{site['failures']}</td>
+                    <td>{site['value_per_second']}</td>
+                </tr>
+"""
+        
+        section += """
+            </tbody>
+        </table>
+"""
+        return section
+    
+    def _build_page_load_section(self):
+        """Build the per-URL page load table for the HTML report"""
+        summary = self.get_page_load_summary()
+        if not summary:
+            return ""
+        
+        section = """
+        <h2>⏱️ Page Load Times</h2>
+        <table class="results-table" style="margin-bottom: 30px;">
+            <thead>
+                <tr>
+                    <th>URL</th>
+                    <th>Policy</th>
+                    <th>Loads</th>
+                    <th>Avg Load (s)</th>
+                    <th>Full Load, No Policy (s)</th>
+                    <th>Savings</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        for url, entry in summary.items():
+            baseline = entry.get('avg_baseline_load_time')
+            savings = f"{entry['savings_percent']}%" if baseline is not None else '-'
+            section += f"""
+                <tr>
+                    <td>{escape(url)}</td>
+                    <td>{escape(entry['policy'])}</td>
+                    <td>{entry['loads']}</td>
+                    <td>{entry['avg_load_time']}</td>
+                    <td>{baseline if baseline is not None else '-'}</td>
+                    <td>{savings}</td>
+                </tr>
+"""
+        
+        section += """
+            </tbody>
+        </table>
+"""
+        return section
+    
+    def _build_performance_section(self):
+        """Build per-URL performance distributions for the HTML report"""
+        summary = summarize_by_url(self.page_loads, self.test_results)
+        if not summary:
+            return ""
+        
+        section = """
+        <h2>🚦 Performance by URL</h2>
+        <table class="results-table" style="margin-bottom: 30px;">
+            <thead>
+                <tr>
+                    <th>URL</th>
+                    <th>Metric</th>
+                    <th>Samples</th>
+                    <th>p50</th>
+                    <th>p95</th>
+                    <th>Max</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        for url, entry in summary.items():
+            slow = entry['performance_failures']
+            url_cell = escape(url) + (f' <span class="status-badge status-failed">{slow} slow</span>' if slow else '')
+            for metric, dist in entry['metrics'].items():
+                section += f"""
+                <tr>
+                    <td>{url_cell}</td>
+                    <td>{metric}</td>
+                    <td>{dist['count']}</td>
+                    <td>{dist['p50']}</td>
+                    <td>{dist['p95']}</td>
+                    <td>{dist['max']}</td>
+                </tr>
+"""
+        
+        section += """
+            </tbody>
+        </table>
+"""
+        return section
+    
+    def _build_cluster_section(self, limit=25):
+        """Build the failure cluster table for the HTML report"""
+        clusters = self.error_clusters.get_clusters(limit)
+        if not clusters:
+            return ""
+        
+        html_dir = os.path.abspath(f"{self.report_dir}/html")
+        section = """
+        <h2>🧬 Failure Clusters</h2>
+        <table class="results-table" style="margin-bottom: 30px;">
+            <thead>
+                <tr>
+                    <th>Signature</th>
+                    <th>Host</th>
+                    <th>Action</th>
+                    <th>Count</th>
+                    <th>First Seen</th>
+                    <th>Last Seen</th>
+                    <th>Example</th>
+                    <th>Screenshot</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        for cluster in clusters:
+            screenshot = '-'
+            if cluster['screenshot_path']:
+                rel_path = os.path.relpath(os.path.abspath(cluster['screenshot_path']), html_dir)
+                screenshot = f'<a href="{escape(rel_path)}">view</a>'
+            
+            section += f"""
+                <tr>
+                    <td><strong>{escape(cluster['signature'])}</strong></td>
+                    <td>{escape(cluster['host'])}</td>
+                    <td>{escape(cluster['action_type'].upper())}</td>
+                    <td>{cluster['count']}</td>
+                    <td>{(cluster['first_seen'] or '-').replace('T', ' ')[:19]}</td>
+                    <td>{(cluster['last_seen'] or '-').replace('T', ' ')[:19]}</td>
+                    <td>{escape(cluster['example_error'][:120])}</td>
+                    <td>{screenshot}</td>
+                </tr>
+"""
+        
+        section += """
+            </tbody>
+        </table>
+"""
+        return section
+    
+    def generate_all_reports(self):
+        """Generate all report formats"""
+        reports = {}
+        
+        reports['csv'] = self.generate_csv_report()
+        reports['json'] = self.generate_json_report()
+        reports['html'] = self.generate_html_report()
+        
+        # Generate summary
+        total_tests = len(self.test_results)
+        passed_tests = len([r for r in self.test_results if r['result']])
+        success_rate = self.stats.get('success_rate', 0)
+        
+        summary = f"""
+📊 REGRESSION TEST SUMMARY
+{'='*50}
+Session ID: {self.session_id}
+Framework: Python-Selenium with POM Design
+Total Tests: {total_tests}
+Passed: {passed_tests}
+Failed: {total_tests - passed_tests}
+Success Rate: {success_rate}%
+{'='*50}
+
+📁 Generated Reports:
+- CSV: {reports['csv']}
+- JSON: {reports['json']}  
+- HTML: {reports['html']}
+"""
+        
+        print(summary)
         return reports
\ No newline at end of file
@@ -0,0 +1,136 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Network.setBlockedURLs matches URL wildcards, so resource types map to extensions
+RESOURCE_TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'm4a', 'm3u8', 'mpd', 'mov'],
+    'stylesheet': ['css']
+}
+
+# Ad, analytics, tag-manager and embed hosts that never matter to monkey actions
+THIRD_PARTY_HOSTS = [
+    'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+    'adservice.google.com', 'connect.facebook.net', 'facebook.com/tr',
+    'amazon-adsystem.com', 'adnxs.com', 'criteo.com', 'criteo.net',
+    'taboola.com', 'outbrain.com', 'scorecardresearch.com', 'quantserve.com',
+    'hotjar.com', 'clarity.ms', 'fullstory.com', 'mixpanel.com', 'segment.io',
+    'cdn.segment.com', 'newrelic.com', 'nr-data.net', 'optimizely.com',
+    'intercom.io', 'intercomcdn.com', 'hubspot.com', 'hs-analytics.net',
+    'bat.bing.com', 'ads.linkedin.com', 'snap.licdn.com', 'static.ads-twitter.com',
+    'youtube.com/embed', 'player.vimeo.com', 'disqus.com'
+]
+
+PRESETS = {
+    'off': {
+        'block_types': [],
+        'block_hosts': [],
+        'eager': False
+    },
+    'interaction_only': {
+        'block_types': ['image', 'font', 'media'],
+        'block_hosts': THIRD_PARTY_HOSTS,
+        'eager': True
+    },
+    'no_third_party': {
+        'block_types': [],
+        'block_hosts': THIRD_PARTY_HOSTS,
+        'eager': True
+    },
+    'no_media': {
+        'block_types': ['media'],
+        'block_hosts': [],
+        'eager': False
+    }
+}
+
+
+class ResourcePolicy:
+    """Blocks irrelevant network resources through CDP to speed up page loads"""
+
+    def __init__(self, name='custom', block_types=None, block_hosts=None, eager=False):
+        self.name = name
+        self.block_types = list(block_types or [])
+        self.block_hosts = list(block_hosts or [])
+        self.eager = eager
+        self.applied = False
+
+        unknown = set(self.block_types) - set(RESOURCE_TYPE_EXTENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {sorted(unknown)}")
+
+    @classmethod
+    def from_preset(cls, name, extra_hosts=None):
+        """Build a policy from a named preset"""
+        if name not in PRESETS:
+            raise ValueError(f"Unknown resource policy '{name}'. Choose from: {', '.join(PRESETS)}")
+        preset = PRESETS[name]
+        return cls(name, preset['block_types'], preset['block_hosts'] + list(extra_hosts or []), preset['eager'])
+
+    @property
+    def active(self):
+        return bool(self.block_types or self.block_hosts)
+
+    def blocked_patterns(self):
+        """URL wildcard patterns for Network.setBlockedURLs"""
+        patterns = []
+        for resource_type in self.block_types:
+            for ext in RESOURCE_TYPE_EXTENSIONS[resource_type]:
+                patterns.append(f"*.{ext}")
+                patterns.append(f"*.{ext}?*")
+        for host in self.block_hosts:
+            patterns.append(f"*{host}*")
+        return patterns
+
+    def configure_options(self, options):
+        """Adjust browser options before the driver starts"""
+        # Eager returns at DOMContentLoaded; only safe when blocked resources
+        # would otherwise hold up the load event anyway
+        if self.eager and self.active:
+            options.page_load_strategy = 'eager'
+        return options
+
+    def apply(self, driver):
+        """Install the block list on a running Chromium session"""
+        if not self.active:
+            return False
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            logger.warning("Resource policy needs a Chromium driver with CDP - skipping")
+            return False
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_patterns()})
+            self.applied = True
+            logger.info(f"Resource policy '{self.name}' applied ({len(self.blocked_patterns())} patterns)")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not apply resource policy '{self.name}': {e}")
+            return False
+
+    def clear(self, driver):
+        """Remove the block list (used for baseline measurements)"""
+        if not self.applied:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+        except Exception as e:
+            logger.warning(f"Could not clear resource policy: {e}")
+
+    @staticmethod
+    def clear_cache(driver):
+        """Drop the HTTP cache so consecutive timed loads are comparable"""
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        except Exception:
+            pass
+
+    def describe(self):
+        return {
+            'name': self.name,
+            'block_types': self.block_types,
+            'block_hosts': len(self.block_hosts),
+            'page_load_strategy': 'eager' if self.eager and self.active else 'normal'
+        }
\ No newline at end of file
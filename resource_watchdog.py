@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+import logging
+
+from perf_metrics import summarize_distribution
+
+logger = logging.getLogger(__name__)
+
+PROC_DIR = '/proc'
+MAX_SAMPLES = 2000
+LATENCY_WINDOW = 30  # Actions per p95 window when comparing against the post-start baseline
+
+
+def _read_stat(pid):
+    """(ppid, cpu_ticks) from /proc/<pid>/stat; the command name may contain spaces and parens"""
+    with open(f"{PROC_DIR}/{pid}/stat", 'r') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return int(fields[1]), int(fields[11]) + int(fields[12])
+
+
+def _read_rss_bytes(pid):
+    with open(f"{PROC_DIR}/{pid}/statm", 'r') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def process_tree(root_pid):
+    """root_pid plus all of its descendants (chromedriver -> chrome -> renderers, GPU, utility)"""
+    children = {}
+    for entry in os.listdir(PROC_DIR):
+        if not entry.isdigit():
+            continue
+        try:
+            ppid, _ = _read_stat(entry)
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    tree, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        tree.append(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+def driver_process_pid(driver):
+    """PID of the local chromedriver service, None for remote drivers"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+class ResourceWatchdog:
+    """Background sampler of the browser process tree that decides when to recycle the browser"""
+
+    def __init__(self, pid_provider, interval=2.0, max_rss_mb=2048, max_actions=400, max_latency_drift=2.5):
+        self.pid_provider = pid_provider
+        self.interval = interval
+        self.max_rss_mb = max_rss_mb
+        self.max_actions = max_actions
+        self.max_latency_drift = max_latency_drift
+        self.enabled = os.path.isdir(PROC_DIR)
+        self.clock_ticks = os.sysconf('SC_CLK_TCK') if self.enabled else 100
+
+        self.samples = []
+        self.started_at = time.time()  # Origin of the sample curves for the whole run; see browser_started_at
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_cpu = None
+        self._reset_generation()
+
+    def _reset_generation(self):
+        """Counters that restart with every fresh browser"""
+        self.browser_started_at = time.time()
+        self.actions_since_start = 0
+        self.latencies = []
+        self.baseline_p95 = None
+        self.latest_rss_mb = 0.0
+
+    def start(self):
+        if not self.enabled:
+            logger.info("Resource watchdog disabled: no /proc filesystem")
+            return self
+        self._thread = threading.Thread(target=self._run, name='resource-watchdog', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval + 1)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Resource sample failed: {e}")
+
+    def sample(self):
+        """One reading of RSS and CPU across the whole browser process tree"""
+        root_pid = self.pid_provider()
+        if not root_pid:
+            return None
+
+        rss_bytes, cpu_ticks, processes = 0, 0, 0
+        for pid in process_tree(root_pid):
+            try:
+                rss_bytes += _read_rss_bytes(pid)
+                cpu_ticks += _read_stat(pid)[1]
+                processes += 1
+            except (OSError, IndexError, ValueError):
+                continue  # Process exited between listing and reading
+
+        now = time.time()
+        cpu_percent = None
+        if self._last_cpu and self._last_cpu[0] == root_pid and now > self._last_cpu[1]:
+            cpu_percent = max(0.0, (cpu_ticks - self._last_cpu[2]) / self.clock_ticks / (now - self._last_cpu[1]) * 100)
+        self._last_cpu = (root_pid, now, cpu_ticks)
+
+        with self._lock:
+            self.latest_rss_mb = rss_bytes / 1048576
+            sample = {
+                't': round(now - self.started_at, 1),
+                'rss_mb': round(self.latest_rss_mb, 1),
+                'cpu_percent': round(cpu_percent, 1) if cpu_percent is not None else None,
+                'processes': processes,
+                'actions': self.actions_since_start,
+                'browser_age': round(now - self.browser_started_at, 1),
+                'latency_p95_ms': self._window_p95()
+            }
+            self.samples.append(sample)
+            if len(self.samples) > MAX_SAMPLES:
+                # Halve the resolution instead of dropping the start of the curve
+                self.samples = self.samples[::2]
+        return sample
+
+    def _window_p95(self):
+        distribution = summarize_distribution(self.latencies[-LATENCY_WINDOW:])
+        return distribution['p95'] if distribution else None
+
+    def record_action(self, latency_seconds):
+        """Feed one action's latency; the first full window after a (re)start is the baseline"""
+        with self._lock:
+            self.actions_since_start += 1
+            self.latencies.append(round(latency_seconds * 1000))
+            if self.baseline_p95 is None and len(self.latencies) >= LATENCY_WINDOW:
+                self.baseline_p95 = self._window_p95()
+            del self.latencies[:-LATENCY_WINDOW * 2]
+
+    def recycle_reason(self):
+        """Why the browser should be recycled now, or None"""
+        with self._lock:
+            if self.max_rss_mb and self.latest_rss_mb >= self.max_rss_mb:
+                return f"rss {self.latest_rss_mb:.0f}MB >= {self.max_rss_mb}MB"
+            if self.max_actions and self.actions_since_start >= self.max_actions:
+                return f"{self.actions_since_start} actions since browser start"
+            if self.max_latency_drift and self.baseline_p95 and len(self.latencies) >= LATENCY_WINDOW * 2:
+                current = self._window_p95()
+                if current and current >= self.baseline_p95 * self.max_latency_drift:
+                    return f"p95 action latency {current}ms vs {self.baseline_p95}ms baseline"
+        return None
+
+    def mark_recycled(self):
+        with self._lock:
+            self._reset_generation()
+            self._last_cpu = None
+
+    def summary(self):
+        """Peaks and distributions for the reports"""
+        with self._lock:
+            samples = list(self.samples)
+        return {
+            'enabled': self.enabled,
+            'interval_seconds': self.interval,
+            'thresholds': {'max_rss_mb': self.max_rss_mb, 'max_actions': self.max_actions,
+                           'max_latency_drift': self.max_latency_drift},
+            'rss_mb': summarize_distribution([s['rss_mb'] for s in samples]),
+            'cpu_percent': summarize_distribution([s['cpu_percent'] for s in samples]),
+            'samples': samples
+        }
\ No newline at end of file
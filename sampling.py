@@ -0,0 +1,63 @@
+import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+OFFSCREEN_WEIGHT = 0.15  # Off-screen elements need a scroll before the action
+OCCLUDED_WEIGHT = 0.05  # Another element covers the centre: clicks would land on it instead
+MIN_SIZE_WEIGHT = 0.2
+FULL_SIZE_PX = 48  # Elements at least this many pixels square get the full size weight
+
+
+def _signature(info):
+    """Elements that look identical to a user (repeated 'Read more' links, icon buttons)"""
+    return info.get('tag'), info.get('text'), info.get('cls')
+
+
+class ElementSampler:
+    """Weighted choice of discovered elements: reachable, visible, sizeable, interactive and not yet tried"""
+
+    def __init__(self):
+        self.acted = {}  # Element address -> times acted on during the current page visit
+        self.stats = {'draws': 0, 'in_view': 0, 'occluded': 0}
+
+    def reset(self):
+        """Forget novelty when a new page is loaded"""
+        self.acted = {}
+
+    @staticmethod
+    def _key(target):
+        return tuple(map(tuple, target.frames)), tuple(target.path)
+
+    def weight(self, target, duplicates=1):
+        info = target.info
+        if not info:
+            return 1.0  # Legacy lookup: nothing known, stay uniform
+        weight = info.get('interactive', 0.5)
+        if not info.get('in_view'):
+            weight *= OFFSCREEN_WEIGHT
+        if info.get('hit') is False:
+            weight *= OCCLUDED_WEIGHT
+        side = math.sqrt(info.get('area') or 0)
+        weight *= min(1.0, max(MIN_SIZE_WEIGHT, side / FULL_SIZE_PX))
+        weight /= 1 + self.acted.get(self._key(target), 0)
+        return weight / duplicates
+
+    def choose(self, targets, rng):
+        """One target, drawn by weight; it then counts as already explored"""
+        counts = {}
+        for target in targets:
+            signature = _signature(target.info)
+            counts[signature] = counts.get(signature, 0) + 1
+        # Novelty changes the weights after every draw, so there is nothing to precompute between draws
+        weights = [self.weight(t, counts[_signature(t.info)]) for t in targets]
+        if sum(weights) <= 0:
+            weights = None
+        target = rng.choices(targets, weights)[0]
+
+        key = self._key(target)
+        self.acted[key] = self.acted.get(key, 0) + 1
+        self.stats['draws'] += 1
+        self.stats['in_view'] += 1 if target.info.get('in_view') else 0
+        self.stats['occluded'] += 1 if target.info.get('hit') is False else 0
+        return target
\ No newline at end of file
@@ -0,0 +1,186 @@
+import re
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+# Cheap fingerprint of "where the monkey is": URL, title and a log-scaled DOM size bucket,
+# so opening a modal or expanding a section counts as a new state but a ticking clock does not
+STATE_KEY_SCRIPT = """
+var size = document.getElementsByTagName('*').length;
+return location.href.split('#')[0] + '|' + document.title + '|' + Math.round(Math.log(1 + size) / Math.LN2 * 2);
+"""
+
+
+def parse_duration(value):
+    """Seconds from '90', '90s', '5m', '1h30m'"""
+    value = str(value).strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', value):
+        return float(value)
+    parts = re.findall(r'(\d+(?:\.\d+)?)([smh])', value)
+    if not parts or ''.join(n + u for n, u in parts) != value:
+        raise ValueError(f"Invalid duration '{value}' (use e.g. 90s, 5m, 1h30m)")
+    return sum(float(n) * DURATION_UNITS[u] for n, u in parts)
+
+
+class TimeBudgetScheduler:
+    """Spreads a wall-clock budget across URLs, favouring those that keep yielding new states or failures"""
+
+    def __init__(self, urls, budget_seconds, explore_fraction=0.3, min_slice_seconds=10,
+                 max_slice_seconds=60, max_load_failures=1):
+        self.budget_seconds = budget_seconds
+        self.explore_fraction = explore_fraction
+        self.min_slice_seconds = min_slice_seconds
+        self.max_slice_seconds = max_slice_seconds
+        self.max_load_failures = max_load_failures
+        self.started_at = None
+        self.resumed_elapsed = 0.0
+
+        self.sites = {}
+        # A list is known up front; any other iterable (file stream, crawler) is pulled lazily
+        self.expected_sites = len(urls) if isinstance(urls, list) else None
+        self.url_source = iter(urls)
+        if self.expected_sites is not None:
+            for url in self.url_source:
+                self._add_site(url)
+            self.url_source = None
+
+    def _add_site(self, url):
+        self.sites.setdefault(url, {
+            'url': url,
+            'status': 'pending',
+            'visits': 0,
+            'seconds': 0.0,
+            'load_seconds': 0.0,
+            'actions': 0,
+            'new_states': 0,
+            'failures': 0,
+            'load_failures': 0,
+            'cut_off_reason': None
+        })
+
+    def _pull_site(self):
+        """Next URL from a streamed source, None once it is exhausted"""
+        while self.url_source is not None:
+            url = next(self.url_source, None)
+            if url is None:
+                self.url_source = None
+            elif url not in self.sites:
+                # Sites restored from a checkpoint are skipped when the stream replays them
+                self._add_site(url)
+                return self.sites[url]
+        return None
+
+    def start(self):
+        # A resumed run continues the clock where the checkpoint left it
+        self.started_at = time.time() - self.resumed_elapsed
+
+    def get_state(self):
+        """Scheduler position for checkpoints"""
+        return {'elapsed': self.elapsed(), 'sites': self.sites}
+
+    def restore(self, state):
+        self.resumed_elapsed = state['elapsed']
+        for url, site in state['sites'].items():
+            self._add_site(url)  # Defaults for counters older checkpoints lack
+            self.sites[url].update(site)
+
+    def elapsed(self):
+        return time.time() - self.started_at if self.started_at else 0.0
+
+    def remaining(self):
+        return max(0.0, self.budget_seconds - self.elapsed())
+
+    def _active_sites(self):
+        return [s for s in self.sites.values() if s['status'] in ('pending', 'active')]
+
+    @staticmethod
+    def value_rate(site):
+        """New states plus failures per second, smoothed so one quiet visit is not fatal"""
+        return (site['new_states'] + site['failures'] + 1) / (site['seconds'] + 10)
+
+    def next_slice(self):
+        """(url, seconds) for the next visit, or None when the budget or sites are exhausted"""
+        remaining = self.remaining()
+        if remaining < 1:
+            return None
+
+        # Every site gets one exploration visit before value weighting kicks in; streamed
+        # URLs are explored as they arrive and the leftover time goes to the best of them
+        pending = [s for s in self._active_sites() if s['status'] == 'pending']
+        if not pending:
+            pulled = self._pull_site()
+            pending = [pulled] if pulled else []
+        active = self._active_sites()
+        if not active:
+            return None
+
+        if pending:
+            site = pending[0]
+            if self.expected_sites:
+                explore_share = self.budget_seconds * self.explore_fraction / self.expected_sites
+            else:
+                explore_share = self.min_slice_seconds
+            seconds = max(self.min_slice_seconds, explore_share)
+        else:
+            total_rate = sum(self.value_rate(s) for s in active)
+            site = max(active, key=self.value_rate)
+            # Time left is re-divided every round, so cut-off sites' share flows to the rest
+            seconds = remaining * self.value_rate(site) / total_rate
+            seconds = min(self.max_slice_seconds, max(self.min_slice_seconds, seconds))
+
+        return site['url'], min(seconds, remaining)
+
+    def record_visit(self, url, seconds, load_seconds=0.0, actions=0, new_states=0, failures=0,
+                     load_error=None):
+        """Account for one visit and cut the site off if its page fails to load (timeout, DNS, refused...)"""
+        site = self.sites[url]
+        site['status'] = 'active'
+        site['visits'] += 1
+        site['seconds'] += seconds
+        site['load_seconds'] += load_seconds
+        site['actions'] += actions
+        site['new_states'] += new_states
+        site['failures'] += failures
+
+        # A dead host spends almost no time per visit, so value_rate alone would keep favouring it
+        if load_error:
+            site['load_failures'] += 1
+            if site['load_failures'] >= self.max_load_failures:
+                self.cut_off(url, f"page load failed: {load_error}")
+
+    def cut_off(self, url, reason):
+        site = self.sites[url]
+        site['status'] = 'cut_off'
+        site['cut_off_reason'] = reason
+        logger.info(f"Time budget: cut off {url} ({reason})")
+
+    def report(self):
+        """Exactly where the budget went, per site and in total"""
+        elapsed = self.elapsed()
+        spent_on_sites = sum(s['seconds'] for s in self.sites.values())
+        sites = []
+        for site in self.sites.values():
+            sites.append({
+                **site,
+                'status': 'not_reached' if site['status'] == 'pending' else site['status'],
+                'seconds': round(site['seconds'], 2),
+                'load_seconds': round(site['load_seconds'], 2),
+                'action_seconds': round(site['seconds'] - site['load_seconds'], 2),
+                'budget_share_percent': round(site['seconds'] / self.budget_seconds * 100, 1)
+                if self.budget_seconds else 0,
+                'value_per_second': round((site['new_states'] + site['failures']) / site['seconds'], 3)
+                if site['seconds'] else 0
+            })
+
+        return {
+            'budget_seconds': self.budget_seconds,
+            'elapsed_seconds': round(elapsed, 2),
+            'spent_on_sites_seconds': round(spent_on_sites, 2),
+            'scheduler_overhead_seconds': round(max(0.0, elapsed - spent_on_sites), 2),
+            'unused_seconds': round(max(0.0, self.budget_seconds - elapsed), 2),
+            'overrun_seconds': round(max(0.0, elapsed - self.budget_seconds), 2),
+            'sites': sites
+        }
\ No newline at end of file
@@ -1,100 +1,145 @@
-import os
-from datetime import datetime
-from urllib.parse import urlparse
-import logging
-
-logger = logging.getLogger(__name__)
-
-class EnhancedScreenshotManager:
-    """Enhanced screenshot management with error capture"""
-    
-    def __init__(self, driver, session_id):
-        self.driver = driver
-        self.session_id = session_id
-        self.setup_directories()
-        self.screenshot_count = 0
-    
-    def setup_directories(self):
-        """Setup screenshot directories"""
-        self.base_dir = f"screenshots/{self.session_id}"
-        self.error_dir = f"{self.base_dir}/errors"
-        self.action_dir = f"{self.base_dir}/actions"
-        
-        os.makedirs(self.base_dir, exist_ok=True)
-        os.makedirs(self.error_dir, exist_ok=True)
-        os.makedirs(self.action_dir, exist_ok=True)
-    
-    def capture_error_screenshot(self, action_type, error_msg, url=""):
-        """Capture screenshot when error occurs"""
-        try:
-            timestamp = datetime.now().strftime("%H%M%S_%f")[:-3]  # Include milliseconds
-            url_name = self._get_url_name(url)
-            error_clean = self._clean_filename(error_msg)
-            
-            filename = f"{timestamp}_ERROR_{action_type}_{error_clean}_{url_name}.png"
-            filepath = os.path.join(self.error_dir, filename)
-            
-            if self.driver.save_screenshot(filepath):
-                self.screenshot_count += 1
-                logger.info(f"Error screenshot saved: {filepath}")
-                return filepath
-            else:
-                logger.error("Failed to save error screenshot")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error capturing screenshot: {e}")
-            return None
-    
-    def capture_action_screenshot(self, action_type, url=""):
-        """Capture screenshot for successful action"""
-        try:
-            timestamp = datetime.now().strftime("%H%M%S_%f")[:-3]
-            url_name = self._get_url_name(url)
-            
-            filename = f"{timestamp}_{action_type}_{url_name}.png"
-            filepath = os.path.join(self.action_dir, filename)
-            
-            if self.driver.save_screenshot(filepath):
-                self.screenshot_count += 1
-                logger.debug(f"Action screenshot saved: {filepath}")
-                return filepath
-            else:
-                logger.warning("Failed to save action screenshot")
-                return None
-                
-        except Exception as e:
-            logger.warning(f"Error capturing action screenshot: {e}")
-            return None
-    
-    def _get_url_name(self, url):
-        """Extract clean domain name from URL"""
-        try:
-            if url:
-                domain = urlparse(url).netloc.replace('www.', '')
-                return self._clean_filename(domain)
-            return "unknown"
-        except:
-            return "unknown"
-    
-    def _clean_filename(self, text):
-        """Clean text for use in filename"""
-        if not text:
-            return "unknown"
-        
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            text = text.replace(char, '_')
-        
-        # Limit length and remove extra spaces
-        return text.strip()[:30]
-    
-    def get_screenshot_stats(self):
-        """Get screenshot statistics"""
-        return {
-            'total_screenshots': self.screenshot_count,
-            'base_directory': self.base_dir,
-            'error_directory': self.error_dir,
-            'action_directory': self.action_dir
+import os
+import queue
+import threading
+from datetime import datetime
+from urllib.parse import urlparse
+import logging
+
+from span_trace import NULL_TRACER
+
+logger = logging.getLogger(__name__)
+
+class EnhancedScreenshotManager:
+    """Enhanced screenshot management with error capture"""
+    
+    def __init__(self, driver, session_id):
+        self.driver = driver
+        self.session_id = session_id
+        self.setup_directories()
+        self.screenshot_count = 0
+        self.context_tag = None  # Set to the active tab/context when tabs are multiplexed
+        # PNGs are written to disk by a background thread so the action loop only pays for the capture
+        self._write_queue = queue.Queue()
+        self._writer = None
+        self.tracer = NULL_TRACER
+    
+    def _save(self, filepath):
+        """Capture now, write later; True once the screenshot is queued"""
+        with self.tracer.span('screenshot', 'screenshot', file=os.path.basename(filepath)):
+            png = self.driver.get_screenshot_as_png()
+        if not png:
+            return False
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name='screenshot-writer', daemon=True)
+            self._writer.start()
+        self._write_queue.put((filepath, png))
+        return True
+    
+    def _write_loop(self):
+        while True:
+            filepath, png = self._write_queue.get()
+            try:
+                with self.tracer.span('screenshot_write', 'screenshot', bytes=len(png)):
+                    with open(filepath, 'wb') as f:
+                        f.write(png)
+            except Exception as e:
+                logger.error(f"Could not write screenshot {filepath}: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def queue_depth(self):
+        """Screenshots captured but not yet on disk"""
+        return self._write_queue.unfinished_tasks
+    
+    def flush(self):
+        """Block until every queued screenshot is written"""
+        self._write_queue.join()
+    
+    def setup_directories(self):
+        """Setup screenshot directories"""
+        self.base_dir = f"screenshots/{self.session_id}"
+        self.error_dir = f"{self.base_dir}/errors"
+        self.action_dir = f"{self.base_dir}/actions"
+        
+        os.makedirs(self.base_dir, exist_ok=True)
+        os.makedirs(self.error_dir, exist_ok=True)
+        os.makedirs(self.action_dir, exist_ok=True)
+    
+    def capture_error_screenshot(self, action_type, error_msg, url=""):
+        """Capture screenshot when error occurs"""
+        try:
+            timestamp = datetime.now().strftime("%H%M%S_%f")[:-3]  # Include milliseconds
+            url_name = self._get_url_name(url)
+            error_clean = self._clean_filename(error_msg)
+            
+            filename = f"{timestamp}_{self._tag_prefix()}ERROR_{action_type}_{error_clean}_{url_name}.png"
+            filepath = os.path.join(self.error_dir, filename)
+            
+            if self._save(filepath):
+                self.screenshot_count += 1
+                logger.info(f"Error screenshot saved: {filepath}")
+                return filepath
+            else:
+                logger.error("Failed to save error screenshot")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {e}")
+            return None
+    
+    def capture_action_screenshot(self, action_type, url=""):
+        """Capture screenshot for successful action"""
+        try:
+            timestamp = datetime.now().strftime("%H%M%S_%f")[:-3]
+            url_name = self._get_url_name(url)
+            
+            filename = f"{timestamp}_{self._tag_prefix()}{action_type}_{url_name}.png"
+            filepath = os.path.join(self.action_dir, filename)
+            
+            if self._save(filepath):
+                self.screenshot_count += 1
+                logger.debug(f"Action screenshot saved: {filepath}")
+                return filepath
+            else:
+                logger.warning("Failed to save action screenshot")
+                return None
+                
+        except Exception as e:
+            logger.warning(f"Error capturing action screenshot: {e}")
+            return None
+    
+    def _tag_prefix(self):
+        """Filename prefix naming the tab the screenshot was taken in"""
+        return f"{self._clean_filename(self.context_tag)}_" if self.context_tag else ""
+    
+    def _get_url_name(self, url):
+        """Extract clean domain name from URL"""
+        try:
+            if url:
+                domain = urlparse(url).netloc.replace('www.', '')
+                return self._clean_filename(domain)
+            return "unknown"
+        except:
+            return "unknown"
+    
+    def _clean_filename(self, text):
+        """Clean text for use in filename"""
+        if not text:
+            return "unknown"
+        
+        # Replace invalid characters
+        invalid_chars = '<>:"/\\|?*'
+        for char in invalid_chars:
+            text = text.replace(char, '_')
+        
+        # Limit length and remove extra spaces
+        return text.strip()[:30]
+    
+    def get_screenshot_stats(self):
+        """Get screenshot statistics"""
+        return {
+            'total_screenshots': self.screenshot_count,
+            'base_directory': self.base_dir,
+            'error_directory': self.error_dir,
+            'action_directory': self.action_dir
         }
\ No newline at end of file
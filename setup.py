@@ -1,28 +1,28 @@
-from setuptools import setup, find_packages
-
-setup(
-    name="enhanced-qa-monkey",
-    version="1.0.0",
-    description="Production-ready monkey testing framework with POM design",
-    author="Your Name",
-    author_email="your.email@example.com",
-    packages=find_packages(),
-    install_requires=[
-        "selenium>=4.15.0",
-        "webdriver-manager>=4.0.1",
-        "jinja2>=3.1.0",
-        "pytest>=7.0.0"
-    ],
-    python_requires=">=3.7",
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
+from setuptools import setup, find_packages
+
+setup(
+    name="enhanced-qa-monkey",
+    version="1.0.0",
+    description="Production-ready monkey testing framework with POM design",
+    author="Your Name",
+    author_email="your.email@example.com",
+    packages=find_packages(),
+    install_requires=[
+        "selenium>=4.15.0",
+        "webdriver-manager>=4.0.1",
+        "jinja2>=3.1.0",
+        "pytest>=7.0.0"
+    ],
+    python_requires=">=3.7",
+    classifiers=[
+        "Development Status :: 4 - Beta",
+        "Intended Audience :: Developers",
+        "License :: OSI Approved :: MIT License",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+    ],
 )
\ No newline at end of file
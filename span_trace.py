@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    """Shared do-nothing span: a disabled tracer costs one method call per span"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+    def set(self, **attributes):
+        pass
+
+    def end(self):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Stand-in used when span tracing is off"""
+
+    enabled = False
+
+    def span(self, name, category='qa', **attributes):
+        return NULL_SPAN
+
+    def annotate(self, **attributes):
+        pass
+
+    def instrument(self, driver):
+        return driver
+
+    def close(self):
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+class Span:
+    """One timed section; nested spans on the same thread show up as children in the viewer"""
+
+    def __init__(self, tracer, name, category, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.start = None
+        self._ended = False
+
+    def __enter__(self):
+        return self.begin()
+
+    def begin(self):
+        """Start timing; for spans that outlive a with block, pair with end()"""
+        self.start = time.perf_counter()
+        self.tracer._stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.attributes['error'] = f"{exc_type.__name__}: {str(exc)[:200]}"
+        self.end()
+        return False
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def end(self):
+        if self._ended:
+            return
+        self._ended = True
+        stack = self.tracer._stack()
+        if self in stack:
+            stack.remove(self)
+        self.tracer._emit(self, time.perf_counter())
+
+
+class SpanTracer:
+    """Writes spans as Chrome trace events (JSON array format) that open in Perfetto and chrome://tracing
+
+    Events are appended as spans finish, so a killed run still leaves a loadable file.
+    """
+
+    enabled = True
+
+    def __init__(self, path, process_name='qa-monkey'):
+        self.path = path
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.events = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads = {}
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write("[\n")
+        self._write({'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                     'args': {'name': process_name}})
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _tid(self):
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._threads[ident] = len(self._threads) + 1
+            self._write({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                         'args': {'name': threading.current_thread().name}})
+        return tid
+
+    def _write(self, event):
+        line = json.dumps(event, default=str)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(("" if self.events == 0 else ",\n") + line)
+            self.events += 1
+
+    def _emit(self, span, end):
+        self._write({
+            'name': span.name, 'cat': span.category, 'ph': 'X', 'pid': self.pid, 'tid': self._tid(),
+            'ts': round((span.start - self.origin) * 1e6, 1), 'dur': round((end - span.start) * 1e6, 1),
+            'args': span.attributes
+        })
+
+    def span(self, name, category='qa', **attributes):
+        """Context manager timing a section; attributes can be added later with .set()"""
+        return Span(self, name, category, attributes)
+
+    def annotate(self, **attributes):
+        """Add attributes to the innermost open span on this thread"""
+        stack = self._stack()
+        if stack:
+            stack[-1].attributes.update(attributes)
+
+    def instrument(self, driver):
+        """Record every WebDriver command sent through this driver as a span"""
+        original = getattr(driver, 'execute', None)
+        if original is None or getattr(driver, '_span_tracer', None) is self:
+            return driver
+
+        def execute(driver_command, params=None):
+            with self.span(driver_command, 'webdriver'):
+                return original(driver_command, params)
+
+        driver.execute = execute
+        driver._span_tracer = self
+        return driver
+
+    def close(self):
+        """Finish the JSON array; spans still open are dropped"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write("\n]\n")
+            self._file.close()
+            self._file = None
+        logger.info(f"Span trace written to {self.path} ({self.events} events)")
\ No newline at end of file
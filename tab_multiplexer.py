@@ -0,0 +1,333 @@
+import random
+import time
+from collections import deque
+import logging
+
+from action_trace import derive_seed
+from driver_factory import PAGE_LOAD_TIMEOUT
+from error_signatures import error_signature
+from monkey_tester import EnhancedMonkeyTester
+
+logger = logging.getLogger(__name__)
+
+# Marks the old document so a poll can't mistake it for the page being navigated to
+NAVIGATE_SCRIPT = "window.__qaMonkeyNavPending = true; window.location.assign(arguments[0]);"
+POLL_SCRIPT = "return window.__qaMonkeyNavPending ? 'pending' : document.readyState;"
+
+IDLE_SLEEP = 0.02  # Seconds to wait when every tab is loading or pacing
+
+
+class TabSlot:
+    """One tab (or isolated browser context) with its own URL, page object and pacing"""
+
+    def __init__(self, index, handle, monkey_tester, context_id=None):
+        self.index = index
+        self.tag = f"tab{index}"
+        self.handle = handle
+        self.monkey_tester = monkey_tester
+        self.context_id = context_id
+        self.prepared = False
+        self.reset()
+
+    def reset(self):
+        self.state = 'idle'  # idle -> loading -> acting -> idle
+        self.url = None
+        self.visit_index = None
+        self.rng = None
+        self.pending_load = None  # (load_time, details) logged once the background settle is over
+        self.actions_done = 0
+        self.successful = 0
+        self.load_started = 0.0
+        self.ready_at = 0.0
+
+
+class TabMultiplexer:
+    """Drives several tabs of one browser, acting in one tab while the others load or settle"""
+
+    def __init__(self, suite, tabs=4, isolate=False, load_timeout=PAGE_LOAD_TIMEOUT):
+        self.suite = suite
+        self.tab_count = max(1, tabs)
+        self.isolate = isolate
+        self.load_timeout = load_timeout
+        self.slots = []
+        self.requeued = deque()
+        self._original_handle = None
+        self.stats = {'tabs': self.tab_count, 'isolated': isolate, 'visits': 0, 'actions': 0,
+                      'load_timeouts': 0, 'busy_seconds': 0.0, 'idle_seconds': 0.0, 'switches': 0}
+
+    @property
+    def driver(self):
+        # Always the suite's current driver, so a browser restart is picked up
+        return self.suite.driver
+
+    def open(self):
+        """Create the tabs (or one isolated browser context per tab)"""
+        self._original_handle = self.driver.current_window_handle
+        self.slots = []
+        for index in range(1, self.tab_count + 1):
+            context_id = None
+            if index == 1 and not self.isolate:
+                handle = self._original_handle
+            elif self.isolate:
+                handle, context_id = self._new_context_tab()
+            else:
+                self.driver.switch_to.new_window('tab')
+                handle = self.driver.current_window_handle
+            self.slots.append(TabSlot(index, handle, self._new_monkey_tester(f"tab{index}"), context_id))
+        logger.info(f"Opened {len(self.slots)} {'isolated contexts' if self.isolate else 'tabs'}")
+        return self
+
+    def _new_context_tab(self):
+        """A tab in a fresh browser context: separate cookies, storage and cache"""
+        before = set(self.driver.window_handles)
+        context_id = self.driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+        self.driver.execute_cdp_cmd('Target.createTarget', {'url': 'about:blank', 'browserContextId': context_id})
+        handle = (set(self.driver.window_handles) - before).pop()
+        return handle, context_id
+
+    def _new_monkey_tester(self, tag):
+        template = self.suite.monkey_tester
+        monkey = EnhancedMonkeyTester(self.driver, self.suite.logger, self.suite.screenshot_manager,
+                                      self.suite.popup_handler, self.suite.perf_probe,
+                                      self.suite.js_error_collector)
+        monkey.action_weights = template.action_weights
+        monkey.success_screenshot_rate = template.success_screenshot_rate
+        monkey.waiter = template.waiter
+        monkey.navigation_guard = template.navigation_guard
+        monkey.data_generator = template.data_generator
+        monkey.tracer = template.tracer
+        # Interleaved actions from several tabs would make a sequential replay trace meaningless
+        monkey.trace_recorder = None
+        monkey.context_tag = tag
+        return monkey
+
+    def close(self):
+        """Close every extra tab/context and return to the original window"""
+        for slot in self.slots:
+            if slot.handle == self._original_handle:
+                continue
+            try:
+                self.driver.switch_to.window(slot.handle)
+                self.driver.close()
+                if slot.context_id:
+                    self.driver.execute_cdp_cmd('Target.disposeBrowserContext',
+                                                {'browserContextId': slot.context_id})
+            except Exception as e:
+                logger.debug(f"Could not close {slot.tag}: {e}")
+        try:
+            if self._original_handle in self.driver.window_handles:
+                self.driver.switch_to.window(self._original_handle)
+            else:
+                self.driver.switch_to.window(self.driver.window_handles[0])
+        except Exception:
+            pass
+        self.suite.screenshot_manager.context_tag = None
+
+    def _activate(self, slot):
+        """Switch the session to the slot's tab and tag screenshots with it"""
+        if self.driver.current_window_handle != slot.handle:
+            self.driver.switch_to.window(slot.handle)
+            self.stats['switches'] += 1
+        self.suite.screenshot_manager.context_tag = slot.tag
+        if not slot.prepared:
+            # Init scripts and blocking rules are per tab; the first tab got them at setup
+            if slot.handle != self._original_handle or self.isolate:
+                if self.suite.perf_probe:
+                    self.suite.perf_probe.install()
+                if self.suite.js_error_collector:
+                    self.suite.js_error_collector.install()
+                if self.suite.navigation_guard:
+                    self.suite.navigation_guard.install()
+                if self.suite.resource_policy and self.suite.resource_policy.applied:
+                    self.suite.resource_policy.apply(self.driver)
+            slot.prepared = True
+
+    def run(self, urls, max_actions):
+        """Test every URL with max_actions actions, overlapping loads and pacing across tabs"""
+        url_iter = iter(urls)
+        exhausted = False
+        start = time.time()
+
+        while True:
+            did_work = False
+            slots = self.slots
+            for slot in slots:
+                if self.slots is not slots:
+                    break  # A browser restart replaced the tabs; the old slots are dead
+                if slot.state == 'idle' and (self.requeued or not exhausted):
+                    resume = self.requeued.popleft() if self.requeued else None
+                    url = resume['url'] if resume else next(url_iter, None)
+                    if url is None:
+                        exhausted = True
+                        continue
+                    did_work = self._guarded(slot, self._start_visit, slot, url, resume) or did_work
+                elif slot.state == 'loading':
+                    did_work = self._guarded(slot, self._poll_load, slot, max_actions) or did_work
+                elif slot.state == 'acting' and time.time() >= slot.ready_at:
+                    did_work = self._guarded(slot, self._act, slot, max_actions) or did_work
+
+            if exhausted and not self.requeued and all(slot.state == 'idle' for slot in self.slots):
+                break
+            if not did_work:
+                time.sleep(IDLE_SLEEP)
+                self.stats['idle_seconds'] += IDLE_SLEEP
+
+        wall = time.time() - start
+        self.stats['wall_seconds'] = round(wall, 2)
+        self.stats['busy_seconds'] = round(wall - self.stats['idle_seconds'], 2)
+        self.stats['idle_seconds'] = round(self.stats['idle_seconds'], 2)
+        self.stats['actions_per_second'] = round(self.stats['actions'] / wall, 2) if wall else 0
+        return self.stats
+
+    def _guarded(self, slot, step, *args):
+        """Run one slot step; a failure ends that slot's visit, a dead browser reopens all tabs"""
+        try:
+            step(*args)
+            return True
+        except Exception as e:
+            url = slot.url
+            logger.error(f"{slot.tag} failed on {url}: {e}")
+            self.suite.logger.logger.error(f"URL test failed: {url} - {str(e)} [{slot.tag}]")
+            if self.suite.health_monitor and self.suite.health_monitor.should_check(error_signature(str(e))):
+                reason = self.suite.health_monitor.heartbeat(self.driver)
+                if reason and self.suite.restart_browser(reason, url, reload=False):
+                    self._reopen_after_restart()
+                    return True
+            if self.suite.screenshot_manager:
+                self.suite.screenshot_manager.capture_error_screenshot("url_load", str(e), url)
+            self._finish_visit(slot)
+            return True
+
+    def _reopen_after_restart(self):
+        """Tabs died with the browser: open fresh tabs and continue their visits where they stopped"""
+        for slot in self.slots:
+            if slot.url:
+                # Same visit index and action count, so nothing already logged is counted twice
+                self.requeued.append({'url': slot.url, 'visit_index': slot.visit_index, 'rng': slot.rng,
+                                      'actions_done': slot.actions_done, 'successful': slot.successful})
+        self.open()
+
+    def _start_visit(self, slot, url, resume=None):
+        if self.suite.circuit_breaker and not self.suite.circuit_breaker.allow(url):
+            print(f"   ⛔ [{slot.tag}] Skipped {url} - circuit open")
+            return
+        slot.reset()
+        slot.url = url
+        if resume:
+            slot.visit_index, slot.rng = resume['visit_index'], resume['rng']
+            slot.actions_done, slot.successful = resume['actions_done'], resume['successful']
+        else:
+            self.suite.visit_index += 1
+            slot.visit_index = self.suite.visit_index
+            slot.rng = random.Random(derive_seed(self.suite.seed, url, slot.visit_index))
+        slot.monkey_tester.rng = slot.rng
+
+        self._activate(slot)
+        # Non-blocking navigation: the other tabs keep working while this one loads
+        slot.load_started = time.time()
+        self.driver.execute_script(NAVIGATE_SCRIPT, url)
+        slot.state = 'loading'
+        print(f"\n🌐 [{slot.tag}] Visit {slot.visit_index}: {url}" + (" (continued)" if resume else ""))
+
+    def _poll_load(self, slot, max_actions):
+        self._activate(slot)
+        ready_state = self.driver.execute_script(POLL_SCRIPT)
+        load_time = time.time() - slot.load_started
+
+        if ready_state != 'complete':
+            if load_time < self.load_timeout:
+                return
+            self.driver.execute_script("window.stop();")
+            self.stats['load_timeouts'] += 1
+            print(f"   ❌ [{slot.tag}] Page load timed out after {load_time:.1f}s: {slot.url}")
+            if self.suite.circuit_breaker:
+                self.suite.circuit_breaker.record_failure(slot.url, "page load: page-load-timeout")
+            self._finish_visit(slot)
+            return
+
+        suite = self.suite
+        slot.pending_load = (load_time, {
+            'tab': slot.tag,
+            'policy': suite.resource_policy.name if suite.resource_policy and suite.resource_policy.applied else 'off',
+            'perf': suite.perf_probe.collect(include_navigation=True) if suite.perf_probe else None,
+            'js_errors': suite.js_error_collector.drain() if suite.js_error_collector else None
+        })
+        if suite.circuit_breaker:
+            suite.circuit_breaker.record_success(slot.url)
+        if suite.popup_handler:
+            suite.popup_handler.clear_overlays(slot.url)
+            self._add_load_errors(slot)
+        if slot.monkey_tester.initialize_page_object(slot.url):
+            slot.monkey_tester.perform_page_specific_actions(slot.url)
+            page_errors = suite.js_error_collector.drain() if suite.js_error_collector else []
+            if page_errors:
+                suite.logger.logger.warning(
+                    f"Page-specific actions on {slot.url} raised {len(page_errors)} JS error(s) [{slot.tag}]")
+
+        # Settling happens in the background while other tabs act
+        slot.ready_at = time.time() + suite.smart_config['page_load_wait']
+        if slot.actions_done < max_actions:
+            slot.state = 'acting'
+        else:
+            self._finish_visit(slot)
+
+    def _add_load_errors(self, slot):
+        """JS errors raised while the slot's page settles or drops overlays belong to its page load"""
+        if slot.pending_load and self.suite.js_error_collector:
+            details = slot.pending_load[1]
+            details['js_errors'] = (details['js_errors'] or []) + self.suite.js_error_collector.drain()
+
+    def _log_page_load(self, slot):
+        if slot.pending_load:
+            load_time, details = slot.pending_load
+            slot.pending_load = None
+            self.suite.logger.log_page_load(slot.url, load_time, **details)
+
+    def _act(self, slot, max_actions):
+        suite = self.suite
+        self._activate(slot)
+        if slot.pending_load:
+            self._add_load_errors(slot)
+            self._log_page_load(slot)
+        suite.rng = slot.rng
+        action_start = time.time()
+
+        outcomes = suite._perform_smart_action(slot.url, slot.monkey_tester, max_actions - slot.actions_done)
+        slot.actions_done += len(outcomes)
+        slot.successful += sum(outcomes)
+        self.stats['actions'] += len(outcomes)
+        print(f"   [{slot.tag}] Action {slot.actions_done}/{max_actions} "
+              f"{''.join('✅' if success else '❌' for success in outcomes)}")
+
+        if suite.watchdog:
+            for _ in outcomes:
+                suite.watchdog.record_action((time.time() - action_start) / len(outcomes))
+        if suite._check_browser(slot.url):
+            self._reopen_after_restart()
+            return
+        if suite.circuit_breaker and suite._record_driver_health(slot.url):
+            print(f"   ⛔ [{slot.tag}] {suite.circuit_breaker.host_for(slot.url)} keeps failing - visit ended")
+            self._finish_visit(slot)
+            return
+
+        url = slot.url
+        if slot.actions_done >= max_actions:
+            self._finish_visit(slot)
+        else:
+            slot.ready_at = time.time() + slot.rng.uniform(*suite.smart_config['action_delay_range'])
+
+        # Same RSS / action-count / latency-drift recycling as single-tab visits
+        recycle_reason = suite.watchdog.recycle_reason() if suite.watchdog else None
+        if recycle_reason and suite.restart_browser(recycle_reason, url, reload=False, event_type='browser_recycle'):
+            self._reopen_after_restart()
+        # A failed recycle leaves no browser: the next step's heartbeat restarts it
+
+    def _finish_visit(self, slot):
+        self._log_page_load(slot)
+        if slot.url:
+            self.stats['visits'] += 1
+            if slot.actions_done:
+                rate = slot.successful / slot.actions_done * 100
+                print(f"   📊 [{slot.tag}] {slot.url}: {rate:.1f}% ({slot.successful}/{slot.actions_done})")
+            self.suite.completed_urls.add(slot.url)
+        slot.reset()
\ No newline at end of file
@@ -0,0 +1,131 @@
+from action_trace import ActionReplayer, ActionTraceRecorder, derive_seed, load_trace, replay_settings
+from monkey_tester import EnhancedMonkeyTester
+
+
+class ReplayTester:
+    """Stands in for MonkeyTester: replays succeed unless the action type is 'fail'"""
+
+    def __init__(self):
+        self.replayed = []
+
+    def initialize_page_object(self, url):
+        pass
+
+    def replay_action(self, action_type, params, url):
+        self.replayed.append((url, action_type, params))
+        return action_type != 'fail'
+
+
+def test_derive_seed_is_stable_and_distinct_per_url_and_visit():
+    assert derive_seed(42, 'https://a.example/') == derive_seed(42, 'https://a.example/')
+    assert derive_seed(42, 'https://a.example/') != derive_seed(42, 'https://b.example/')
+    assert derive_seed(42, 'https://a.example/', 1) != derive_seed(42, 'https://a.example/', 0)
+
+
+def test_recorded_trace_loads_back_as_visits(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    recorder = ActionTraceRecorder(str(path), session_id='s1', seed=7)
+    recorder.record_visit('https://a.example/', visit_seed=11)
+    recorder.record_action('https://a.example/', 'click', {'selector': '#go'}, True)
+    recorder.record_action('https://a.example/', 'scroll', {'y': 300}, False, error_signature='timeout')
+    recorder.record_action('https://b.example/', 'key', {'key': 'TAB'}, True)
+    recorder.close()
+
+    session, visits = load_trace(str(path))
+    assert session['seed'] == 7
+    assert [(v['url'], v['seed']) for v in visits] == [('https://a.example/', 11), ('https://b.example/', None)]
+    assert [a['index'] for a in visits[0]['actions']] == [1, 2]
+    assert visits[0]['actions'][1]['error_signature'] == 'timeout'
+
+
+def test_replay_settings_come_from_the_session_header(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    ActionTraceRecorder(str(path), settings={'navigation_guard': 'record'}).close()
+    session, _ = load_trace(str(path))
+    assert replay_settings(session) == {'navigation_guard': 'record'}
+    assert replay_settings({'seed': 1}) == {}
+
+
+def test_offset_tracks_the_bytes_written(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    recorder = ActionTraceRecorder(str(path))
+    start = recorder.offset()
+    recorder.record_action('https://a.example/', 'click', {}, True)
+    assert recorder.offset() > start
+    assert recorder.offset() == path.stat().st_size
+    recorder.close()
+
+
+def test_replay_counts_failures_and_survives_a_broken_visit():
+    def load_page(url):
+        if 'broken' in url:
+            raise RuntimeError('net::ERR_CONNECTION_REFUSED')
+
+    tester = ReplayTester()
+    visits = [
+        {'url': 'https://a.example/', 'actions': [{'action_type': 'click', 'params': {}},
+                                                   {'action_type': 'fail', 'params': {}}]},
+        {'url': 'https://broken.example/', 'actions': [{'action_type': 'click', 'params': {}}]},
+    ]
+    summary = ActionReplayer(load_page, tester).replay(visits)
+    assert summary['visits'] == 2
+    assert summary['actions'] == 2
+    assert summary['failed'] == 1
+    assert len(tester.replayed) == 2
+
+class CheckoutPage:
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, *args):
+        self.calls.append(args)
+        return True
+
+
+class ProfilePage:
+    pass
+
+
+class PageActionLog:
+    def __init__(self):
+        self.page_actions = []
+
+    def log_page_action(self, page_name, action_method, result, error_msg=None):
+        self.page_actions.append((page_name, action_method, result, error_msg))
+
+
+class ListRecorder:
+    def __init__(self):
+        self.actions = []
+
+    def record_action(self, url, action_type, params, success):
+        self.actions.append((action_type, params))
+
+
+def page_tester(page):
+    tester = EnhancedMonkeyTester(None, PageActionLog(), None)
+    tester.current_page = page
+    return tester
+
+
+def test_page_actions_record_their_page_object_class_and_replay_on_it():
+    page = CheckoutPage()
+    tester = page_tester(page)
+    tester.trace_recorder = ListRecorder()
+    tester._trace_page_action('https://a.example/', 'submit', ['x'], True)
+
+    action_type, params = tester.trace_recorder.actions[0]
+    assert params == {'page': 'CheckoutPage', 'method': 'submit', 'args': ['x']}
+    assert tester.replay_action(action_type, params) is True
+    assert page.calls == [('x',)]
+
+
+def test_page_action_replay_on_another_page_or_none_returns_false():
+    params = {'page': 'CheckoutPage', 'method': 'submit', 'args': []}
+    tester = page_tester(ProfilePage())
+    assert tester.replay_action('page_action', params) is False
+    assert tester.logger.page_actions[0][2:] == (False, "Cannot replay CheckoutPage.submit on ProfilePage")
+
+    assert page_tester(None).replay_action('page_action', params) is False
+    # Traces recorded before the class was stored still fail cleanly when the method is missing
+    assert page_tester(ProfilePage()).replay_action('page_action', {'method': 'submit', 'args': []}) is False
\ No newline at end of file
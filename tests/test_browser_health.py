@@ -0,0 +1,57 @@
+import threading
+
+from browser_health import BrowserHealthMonitor
+
+
+class HeartbeatDriver:
+    """Answers the heartbeat script, raises a WebDriver error, or blocks until released"""
+
+    def __init__(self, error=None, hang=False):
+        self.error = error
+        self.release = threading.Event() if hang else None
+        self.quit_calls = 0
+
+    def execute_script(self, script):
+        if self.release:
+            self.release.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return 'complete'
+
+    def quit(self):
+        self.quit_calls += 1
+        raise RuntimeError('invalid session id')
+
+
+def test_only_failures_that_may_mean_a_dead_browser_are_checked():
+    monitor = BrowserHealthMonitor()
+    assert monitor.should_check('session-lost')
+    assert monitor.should_check('unclassified-1a2b3c4d')
+    assert not monitor.should_check('stale-element')
+    assert not monitor.should_check(None)
+
+
+def test_heartbeat_tells_healthy_dead_and_crashed_browsers_apart():
+    monitor = BrowserHealthMonitor(heartbeat_timeout=2)
+    assert monitor.heartbeat(HeartbeatDriver()) is None
+    assert monitor.heartbeat(HeartbeatDriver('Message: invalid session id')) == 'session-lost'
+    assert monitor.heartbeat(HeartbeatDriver('Message: tab crashed')) == 'tab-crashed'
+    assert monitor.heartbeat(HeartbeatDriver('Message: stale element reference')) is None
+    assert monitor.stats['heartbeats'] == 4
+    assert monitor.stats['unhealthy'] == 2
+
+
+def test_heartbeat_that_never_returns_is_a_hung_renderer():
+    driver = HeartbeatDriver(hang=True)
+    assert BrowserHealthMonitor(heartbeat_timeout=0.1).heartbeat(driver) == 'hung-renderer'
+    driver.release.set()
+
+
+def test_restart_budget_and_quiet_quit():
+    monitor = BrowserHealthMonitor(max_restarts=1)
+    assert monitor.can_restart()
+    monitor.stats['restarts'] += 1
+    assert not monitor.can_restart()
+    driver = HeartbeatDriver()
+    monitor.quit_quietly(driver)
+    assert driver.quit_calls == 1
\ No newline at end of file
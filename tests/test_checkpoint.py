@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from checkpoint import CheckpointManager, decode_rng_state, encode_rng_state, truncate_file
+
+
+def test_checkpoint_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs' / 'run1').mkdir(parents=True)
+    manager = CheckpointManager('run1', interval_seconds=60)
+    assert manager.due()
+    manager.save({'url_index': 3, 'trace_offset': 120})
+    assert not manager.due()
+
+    state = CheckpointManager.load('run1')
+    assert state['url_index'] == 3
+    assert state['trace_offset'] == 120
+    assert state['version'] == 1
+    assert not (tmp_path / 'logs' / 'run1' / 'checkpoint.json.tmp').exists()
+
+
+def test_missing_checkpoint_raises(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        CheckpointManager.load('never-ran')
+
+
+def test_rng_state_survives_json_encoding():
+    rng = random.Random(5)
+    rng.random()
+    encoded = encode_rng_state(rng.getstate())
+    expected = [rng.random() for _ in range(3)]
+    restored = random.Random()
+    restored.setstate(decode_rng_state(encoded))
+    assert [restored.random() for _ in range(3)] == expected
+
+
+def test_truncate_file_drops_only_what_came_after_the_offset(tmp_path):
+    path = tmp_path / 'actions.jsonl'
+    path.write_bytes(b'first\nsecond\n')
+    truncate_file(str(path), 6)
+    assert path.read_bytes() == b'first\n'
+    truncate_file(str(path), 100)
+    truncate_file(str(path), None)
+    assert path.read_bytes() == b'first\n'
\ No newline at end of file
@@ -0,0 +1,33 @@
+from circuit_breaker import HostCircuitBreaker
+
+
+def test_circuit_opens_after_consecutive_failures_on_one_host():
+    breaker = HostCircuitBreaker(threshold=3)
+    assert not breaker.record_failure('https://a.example/one', 'page load: timeout')
+    assert not breaker.record_failure('https://a.example/two', 'page load: timeout')
+    assert breaker.record_failure('https://a.example/three', 'page load: timeout')
+    assert not breaker.allow('https://a.example/four')
+    assert breaker.allow('https://b.example/')
+    assert breaker.open_hosts() == {'a.example': 'page load: timeout'}
+
+
+def test_success_resets_the_failure_streak():
+    breaker = HostCircuitBreaker(threshold=2)
+    breaker.record_failure('https://a.example/', 'network-error')
+    breaker.record_success('https://a.example/')
+    assert not breaker.record_failure('https://a.example/', 'network-error')
+    assert breaker.allow('https://a.example/')
+    assert breaker.hosts['a.example']['total_failures'] == 2
+
+
+def test_cooldown_half_opens_and_the_next_failure_reopens():
+    breaker = HostCircuitBreaker(threshold=3, cooldown_seconds=0)
+    breaker.trip('https://a.example/', 'session-lost')
+    assert breaker.allow('https://a.example/')
+    assert breaker.record_failure('https://a.example/', 'session-lost')
+
+
+def test_without_cooldown_the_circuit_stays_open():
+    breaker = HostCircuitBreaker(threshold=1)
+    breaker.record_failure('https://a.example/', 'tab-crashed')
+    assert not breaker.allow('https://a.example/')
\ No newline at end of file
@@ -0,0 +1,39 @@
+import random
+
+from data_generator import HOSTILE_CLASSES, DataGenerator, classify_field, hint_tokens
+
+
+def test_input_type_decides_first():
+    assert classify_field({'type': 'email', 'name': 'search'}) == 'email'
+    assert classify_field({'type': 'range'}) == 'number'
+
+
+def test_hints_match_whole_words_of_name_and_id():
+    assert classify_field({'type': 'text', 'name': 'user_email'}) == 'email'
+    assert classify_field({'type': 'text', 'id': 'userPassword'}) == 'password'
+    assert classify_field({'type': 'text', 'name': 'q'}) == 'search'
+
+
+def test_words_that_merely_contain_a_hint_stay_text():
+    for name in ('passenger', 'compass', 'findings', 'hotmailer'):
+        assert classify_field({'type': 'text', 'name': name}) == 'text', name
+
+
+def test_hint_tokens_split_camel_case_and_separators():
+    assert hint_tokens({'name': 'billingEmail-address', 'placeholder': 'Your e-mail'}) == \
+        {'billing', 'email', 'address', 'your', 'e', 'mail'}
+
+
+def test_hostile_values_are_opt_in():
+    info = {'type': 'text', 'name': 'comment'}
+    default, hostile = DataGenerator(seed=1), DataGenerator(seed=1, hostile_rate=1.0)
+    rng = random.Random(3)
+    for _ in range(50):
+        default.for_field(info, rng)
+        hostile.for_field(info, rng)
+    assert sum(default.stats[name] for name in HOSTILE_CLASSES) == 0
+    assert sum(hostile.stats[name] for name in HOSTILE_CLASSES) == 50
+
+
+def test_same_seed_same_corpora():
+    assert DataGenerator(seed=7).corpora == DataGenerator(seed=7).corpora
\ No newline at end of file
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from discovery import DiscoveredElement, DomDiscovery
+
+
+class FrameDriver:
+    """Resolves address paths from a dict and records frame switches"""
+
+    def __init__(self, nodes=None, discovery_result=None):
+        self.nodes = nodes or {}
+        self.discovery_result = discovery_result
+        self.switches = []
+        self.switch_to = SimpleNamespace(default_content=lambda: self.switches.append('top'),
+                                         frame=lambda frame: self.switches.append(frame))
+
+    def execute_script(self, script, *args):
+        if self.discovery_result is not None:
+            return self.discovery_result
+        return self.nodes.get(tuple(args[0]))
+
+
+def test_discover_splits_handles_addresses_and_info():
+    driver = FrameDriver(discovery_result={
+        'visited': 12, 'truncated': False,
+        'clickable': [{'element': 'button-handle', 'frames': [], 'path': [0, 3], 'tag': 'button', 'text': 'Go'}],
+        'inputs': [{'element': None, 'frames': [[1]], 'path': [2], 'tag': 'input', 'context': 'iframe'}]})
+    found = DomDiscovery(driver).discover()
+    button, field = found['clickable'][0], found['inputs'][0]
+    assert button.element == 'button-handle'
+    assert button.info == {'tag': 'button', 'text': 'Go'}
+    assert button.address() == {}
+    assert field.address() == {'target': {'frames': [[1]], 'path': [2]}}
+    assert field.describe() == "<input> (in iframe)"
+
+
+def test_activate_switches_into_the_frame_chain_and_release_leaves_it():
+    driver = FrameDriver({(1,): 'frame-handle', (2,): 'input-handle'})
+    target = DiscoveredElement.from_address(driver, {'frames': [[1]], 'path': [2]})
+    assert target.activate() == 'input-handle'
+    assert driver.switches == ['top', 'frame-handle']
+    target.release()
+    target.release()
+    assert driver.switches == ['top', 'frame-handle', 'top']
+
+
+def test_activate_reports_elements_that_are_gone():
+    target = DiscoveredElement.from_address(FrameDriver(), {'frames': [], 'path': [0, 1]})
+    with pytest.raises(LookupError):
+        target.activate()
+
+
+def test_describe_uses_discovery_info_only():
+    target = DiscoveredElement(None, 'handle', info={'tag': 'a', 'id': 'next', 'cls': 'pager-link', 'text': 'Next',
+                                                     'context': 'shadow'})
+    assert target.describe() == "<a id='next' class='pager-link'> 'Next' (in shadow DOM)"
+    assert target.attribute('id') == 'next'
+    assert DiscoveredElement(None, 'handle').describe() is None
\ No newline at end of file
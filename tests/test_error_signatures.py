@@ -0,0 +1,31 @@
+from error_signatures import error_signature, normalize_error
+
+
+def test_known_selenium_errors_map_to_named_signatures():
+    assert error_signature("Message: element click intercepted: Element <a> is not clickable at point (10, 20). "
+                           "Other element would receive the click") == 'intercepted-click-by-overlay'
+    assert error_signature("Message: stale element reference: element is not attached") == 'stale-element'
+    assert error_signature("Message: invalid session id") == 'session-lost'
+    assert error_signature("Message: unknown error: net::ERR_NAME_NOT_RESOLVED") == 'network-error'
+
+
+def test_specific_timeouts_win_over_generic_ones():
+    assert error_signature("timeout: Timed out receiving message from renderer: 15.000") == 'page-load-timeout'
+    assert error_signature("TimeoutException: waiting for element") == 'timeout'
+
+
+def test_unclassified_errors_ignore_volatile_details():
+    first = error_signature("Something odd at https://a.example/x with id 42 (Session info: chrome=120.0)")
+    second = error_signature("Something odd at https://b.example/y with id 7 (Session info: chrome=121.0)")
+    assert first == second
+    assert first != error_signature("Something else entirely")
+
+
+def test_normalize_error_keeps_only_the_message_template():
+    text = "Message: failed for 'btn-42' at (3, 4)\nStacktrace:\n#0 0x55d"
+    assert normalize_error(text) == "failed for <str> at (<x>, <y>)"
+    assert normalize_error(None) == ""
+
+
+def test_empty_errors_are_unknown():
+    assert error_signature('') == 'unknown'
\ No newline at end of file
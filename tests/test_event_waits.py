@@ -0,0 +1,76 @@
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from event_waits import EventWaiter, locator_query
+
+
+class WaitDriver:
+    """Async scripts answer from a queue (exceptions are raised); polling sees a fixed element list"""
+
+    def __init__(self, *async_results, elements=(), ready_state='complete'):
+        self.async_results = list(async_results)
+        self.elements = list(elements)
+        self.ready_state = ready_state
+        self.async_calls = 0
+
+    def execute_async_script(self, script, *args):
+        self.async_calls += 1
+        result = self.async_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def execute_script(self, script):
+        return self.ready_state
+
+    def find_elements(self, by, value):
+        return self.elements
+
+
+def test_locators_translate_to_queries_an_observer_can_run():
+    assert locator_query((By.CSS_SELECTOR, 'a.next')) == ('css', 'a.next')
+    assert locator_query((By.ID, 'say "hi"')) == ('css', '[id="say \\"hi\\""]')
+    assert locator_query((By.CLASS_NAME, 'btn')) == ('css', '[class~="btn"]')
+    assert locator_query((By.XPATH, '//button')) == ('xpath', '//button')
+    assert locator_query((By.LINK_TEXT, 'Next')) is None
+
+
+def test_element_found_by_the_event_script_in_one_command():
+    waiter = EventWaiter(WaitDriver('element'))
+    assert waiter.find_element((By.ID, 'go'), timeout=1) == 'element'
+    assert waiter.summary()['events']['commands'] == 1
+    assert waiter.summary()['polling']['waits'] == 0
+
+
+def test_event_timeout_raises_and_find_elements_returns_empty():
+    waiter = EventWaiter(WaitDriver(None, None))
+    with pytest.raises(TimeoutException):
+        waiter.find_element((By.ID, 'missing'), timeout=1)
+    assert waiter.find_elements((By.ID, 'missing'), timeout=1) == []
+    assert waiter.stats['events']['timeouts'] == 2
+
+
+def test_unsupported_browser_switches_to_polling_for_good():
+    driver = WaitDriver(WebDriverException('unknown command: executeAsyncScript'), elements=['polled'])
+    waiter = EventWaiter(driver, poll_frequency=0.01)
+    assert waiter.find_element((By.ID, 'go'), timeout=1) == 'polled'
+    assert waiter.backend == 'polling'
+    assert waiter.find_element((By.ID, 'go'), timeout=1) == 'polled'
+    assert driver.async_calls == 1
+    assert waiter.stats['fallbacks'] == 1
+
+
+def test_navigation_mid_wait_waits_for_the_new_page_and_retries():
+    driver = WaitDriver(WebDriverException('javascript error: document unloaded while waiting for result'),
+                        'complete', 'element')
+    waiter = EventWaiter(driver)
+    assert waiter.find_element((By.CSS_SELECTOR, '#results'), timeout=2) == 'element'
+    assert waiter.stats['navigations'] == 1
+    assert driver.async_calls == 3
+
+
+def test_settle_without_time_returns_at_once():
+    driver = WaitDriver()
+    assert EventWaiter(driver).settle(0)
+    assert driver.async_calls == 0
\ No newline at end of file
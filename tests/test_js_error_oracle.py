@@ -0,0 +1,64 @@
+from error_signatures import error_signature
+from js_error_oracle import JSErrorCollector, format_js_error
+
+
+class LogDriver:
+    """Injected-collector buffer plus a browser log, both drained on read"""
+
+    def __init__(self, script_errors=(), log_entries=(), log_error=None):
+        self.script_errors = list(script_errors)
+        self.log_entries = list(log_entries)
+        self.log_error = log_error
+        self.log_reads = 0
+
+    def execute_script(self, script):
+        errors, self.script_errors = self.script_errors, []
+        return errors
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get_log(self, kind):
+        self.log_reads += 1
+        if self.log_error:
+            raise self.log_error
+        entries, self.log_entries = self.log_entries, []
+        return entries
+
+
+def test_format_js_error_is_recognized_as_a_js_signature():
+    message = format_js_error({'kind': 'uncaught', 'message': 'TypeError: x is undefined', 'source': 'app.js:10'})
+    assert message == 'JS uncaught: TypeError: x is undefined @ app.js:10'
+    assert error_signature(message) != error_signature('Message: element not interactable')
+
+
+def test_drain_merges_collector_errors_with_uncollected_log_entries():
+    driver = LogDriver(
+        script_errors=[{'kind': 'console-error', 'message': 'boom', 'source': ''}],
+        log_entries=[{'source': 'javascript', 'message': 'boom'},
+                     {'source': 'other', 'message': 'GET /favicon.ico 404'},
+                     {'source': 'network', 'message': 'GET /missing.png 404'},
+                     {'source': 'security', 'message': 'Refused to load frame'}])
+    collector = JSErrorCollector(driver)
+    assert collector.install()
+    errors = collector.drain()
+    assert [e['kind'] for e in errors] == ['console-error', 'browser-log']
+    assert errors[1]['message'] == 'Refused to load frame'
+    assert collector.drain() == []
+    assert collector.total_errors == 2
+
+
+def test_missing_log_endpoint_is_only_asked_once():
+    driver = LogDriver(log_error=RuntimeError('unknown command'))
+    collector = JSErrorCollector(driver)
+    collector.drain()
+    collector.drain()
+    assert driver.log_reads == 1
+    assert not collector.include_browser_log
+
+
+
+def test_without_the_preinstalled_collector_js_log_entries_are_kept():
+    driver = LogDriver(log_entries=[{'source': 'javascript', 'message': 'early error'}])
+    errors = JSErrorCollector(driver).drain()
+    assert [e['message'] for e in errors] == ['early error']
\ No newline at end of file
@@ -0,0 +1,71 @@
+import json
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from circuit_breaker import HostCircuitBreaker
+from live_metrics import LiveMetrics, prometheus_text
+
+
+def make_suite():
+    logger = SimpleNamespace(test_results=[], action_stats={'total_actions': 0, 'successful_actions': 0,
+                                                             'failed_actions': 0})
+    return SimpleNamespace(logger=logger, circuit_breaker=HostCircuitBreaker(threshold=1), waiter=None,
+                           screenshot_manager=None, watchdog=None, session_id='s1')
+
+
+def log(suite, url, success):
+    suite.logger.test_results.append({'url': url, 'result': success})
+    stats = suite.logger.action_stats
+    stats['total_actions'] += 1
+    stats['successful_actions' if success else 'failed_actions'] += 1
+
+
+def test_snapshot_counts_actions_per_host_and_open_circuits():
+    suite = make_suite()
+    metrics = LiveMetrics(suite)
+    log(suite, 'https://a.example/x', True)
+    log(suite, 'https://a.example/y', False)
+    suite.circuit_breaker.record_failure('https://b.example/', 'network-error')
+    snapshot = metrics.update()
+    assert snapshot['actions'] == 2
+    assert snapshot['success_rate'] == 0.5
+    assert snapshot['hosts']['a.example'] == {'actions': 2, 'failures': 1, 'circuit_open': False,
+                                              'consecutive_failures': 0}
+    assert snapshot['hosts']['b.example']['circuit_open']
+
+
+def test_rewound_results_are_counted_again():
+    suite = make_suite()
+    metrics = LiveMetrics(suite)
+    log(suite, 'https://a.example/', True)
+    log(suite, 'https://a.example/', True)
+    metrics.update()
+    del suite.logger.test_results[1:]
+    assert metrics.update()['hosts']['a.example']['actions'] == 3
+
+
+def test_prometheus_text_escapes_labels_and_skips_missing_values():
+    suite = make_suite()
+    suite.session_id = 'run "1"'
+    text = prometheus_text(LiveMetrics(suite).latest)
+    assert 'qa_monkey_info{session_id="run \\"1\\""} 1' in text
+    assert 'qa_monkey_actions_total 0' in text
+    assert '\nqa_monkey_browser_rss_megabytes ' not in text
+
+
+def test_endpoint_serves_metrics_and_progress(tmp_path):
+    progress = tmp_path / 'progress.jsonl'
+    metrics = LiveMetrics(make_suite(), port=0, progress_file=str(progress), interval=60).start()
+    try:
+        with urllib.request.urlopen(metrics.url, timeout=5) as response:
+            assert b'qa_monkey_actions_total' in response.read()
+        with urllib.request.urlopen(metrics.url.replace('/metrics', '/progress'), timeout=5) as response:
+            assert json.loads(response.read())['session_id'] == 's1'
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(metrics.url.replace('/metrics', '/other'), timeout=5)
+    finally:
+        metrics.stop()
+    assert json.loads(progress.read_text(encoding='utf-8').splitlines()[-1])['type'] == 'progress'
\ No newline at end of file
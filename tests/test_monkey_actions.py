@@ -0,0 +1,9 @@
+import pytest
+
+
+def test_monkey_session(monkey_target, monkey_runner):
+    """Monkey visits for one URL or shard fail on error signatures not seen before"""
+    outcome = monkey_runner(monkey_target)
+    if outcome['new_signatures']:
+        pytest.fail(f"New error signatures: {', '.join(outcome['new_signatures'])} "
+                    f"({outcome['stats']['failed_actions']} of {outcome['stats']['total_actions']} actions failed)")
\ No newline at end of file
@@ -0,0 +1,87 @@
+import pytest
+
+from navigation_guard import DRAIN_SCRIPT, NavigationGuard, document_url, same_origin
+
+
+class HistoryDriver:
+    """Drain results for the guard script, where back() lands, and every get()"""
+
+    def __init__(self, blocked=(), href='https://site.example/', back_to=None, persisted=False, get_error=None):
+        self.drain = {'blocked': list(blocked), 'href': href}
+        self.back_to = back_to
+        self.persisted = persisted
+        self.get_error = get_error
+        self.gets = []
+
+    def execute_script(self, script):
+        if script == DRAIN_SCRIPT:
+            return self.drain
+        return {'href': self.back_to, 'persisted': self.persisted}
+
+    def back(self):
+        pass
+
+    def get(self, url):
+        self.gets.append(url)
+        if self.get_error:
+            raise self.get_error
+
+
+START = 'https://site.example/'
+
+
+def test_url_helpers():
+    assert document_url('https://site.example/a#top') == 'https://site.example/a'
+    assert same_origin('https://site.example/a', 'https://site.example/b?x=1')
+    assert not same_origin('https://site.example/', 'http://site.example/')
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        NavigationGuard(None, mode='strict')
+
+
+def test_blocked_navigations_are_reported_by_mode():
+    blocked = [{'kind': 'link', 'url': 'https://other.example/'}]
+    assert NavigationGuard(HistoryDriver(blocked)).after_action(START) == \
+        {'blocked_navigation': ['https://other.example/']}
+    guard = NavigationGuard(HistoryDriver(blocked), mode='record')
+    details = guard.after_action(START)
+    assert details == {'would_navigate': ['https://other.example/']}
+    assert guard.would_navigate_info('a.ext', details) == 'a.ext → would navigate to https://other.example/'
+
+
+def test_hash_changes_stay_on_the_page():
+    driver = HistoryDriver(href=START + '#section')
+    assert NavigationGuard(driver).after_action(START) == {}
+    assert driver.gets == []
+
+
+def test_same_origin_navigation_is_undone_from_the_bfcache():
+    guard = NavigationGuard(HistoryDriver(href=START + 'next', back_to=START, persisted=True))
+    assert guard.after_action(START) == {'navigated_to': START + 'next', 'restored': 'bfcache'}
+    assert guard.stats['restored_bfcache'] == 1
+
+
+def test_same_origin_navigation_is_kept_without_restore():
+    guard = NavigationGuard(HistoryDriver(href=START + 'next'), restore=False)
+    assert guard.after_action(START) == {}
+
+
+def test_escape_to_another_origin_is_always_undone_by_reload_if_history_fails():
+    driver = HistoryDriver(href='https://other.example/', back_to='https://other.example/')
+    guard = NavigationGuard(driver, restore=False)
+    assert guard.after_action(START) == {'escaped_to': 'https://other.example/', 'restored': 'reload'}
+    assert driver.gets == [START]
+    assert guard.stats['escaped'] == 1
+
+
+def test_failed_reload_is_reported_instead_of_raised():
+    driver = HistoryDriver(href='https://other.example/', get_error=RuntimeError('timeout: page load'))
+    assert NavigationGuard(driver).after_action(START)['restored'] == 'failed'
+
+
+def test_off_mode_does_nothing():
+    guard = NavigationGuard(HistoryDriver(href='https://other.example/'), mode='off')
+    assert not guard.enabled
+    assert guard.after_action(START) == {}
\ No newline at end of file
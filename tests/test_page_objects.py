@@ -0,0 +1,57 @@
+import pytest
+
+from base_page import BasePage
+from page_registry import PageRegistry, url_pattern
+from pages.login_page import LoginPage
+from pages.search_page import SearchPage
+
+
+class ProbeDriver:
+    """Answers the registry probe with one visible match for each selector containing a listed fragment"""
+
+    def __init__(self, *fragments):
+        self.fragments = fragments
+        self.probes = 0
+
+    def execute_script(self, script, selectors):
+        self.probes += 1
+        return {selector: int(any(fragment in selector for fragment in self.fragments)) for selector in selectors}
+
+
+def test_url_pattern_wildcards_id_segments():
+    assert url_pattern('https://example.com/users/42/edit') == 'example.com/users/*/edit'
+    assert url_pattern('https://example.com/users/7/edit?tab=1') == 'example.com/users/*/edit'
+    assert url_pattern('https://example.com/post/5f2b9c1d7e/comments') == 'example.com/post/*/comments'
+    assert url_pattern('https://example.com/blog/hello-world') == 'example.com/blog/hello-world'
+    assert url_pattern(None) == '/'
+
+
+def test_password_field_makes_a_login_page():
+    registry = PageRegistry([LoginPage, SearchPage])
+    assert registry.classify(ProbeDriver("input[type='password']"), 'https://example.com/account') is LoginPage
+
+
+def test_header_search_box_alone_stays_a_base_page():
+    registry = PageRegistry([LoginPage, SearchPage])
+    assert registry.classify(ProbeDriver("input[type='search']"), 'https://example.com/news/1') is BasePage
+
+
+def test_search_box_with_results_or_search_url_is_a_search_page():
+    registry = PageRegistry([LoginPage, SearchPage])
+    assert registry.classify(ProbeDriver("input[type='search']", '.search-results'),
+                             'https://example.com/find') is SearchPage
+    assert registry.classify(ProbeDriver("input[type='search']"), 'https://example.com/search?q=x') is SearchPage
+
+
+def test_classification_is_cached_per_url_pattern():
+    registry = PageRegistry([LoginPage, SearchPage])
+    driver = ProbeDriver("input[type='password']")
+    registry.classify(driver, 'https://example.com/users/1/login')
+    assert registry.classify(driver, 'https://example.com/users/2/login') is LoginPage
+    assert driver.probes == 1
+    assert registry.stats['cache_hits'] == 1
+
+
+def test_register_rejects_non_page_classes():
+    with pytest.raises(TypeError):
+        PageRegistry().register(object)
\ No newline at end of file
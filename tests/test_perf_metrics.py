@@ -0,0 +1,40 @@
+from perf_metrics import PerformanceProbe, summarize_by_url, summarize_distribution
+
+
+def test_distribution_ignores_missing_values():
+    assert summarize_distribution([None, None]) is None
+    assert summarize_distribution([30, None, 10, 20]) == {'count': 3, 'min': 10, 'p50': 20, 'p95': 30, 'max': 30}
+
+
+def test_summary_groups_page_and_action_metrics_by_url():
+    page_loads = [
+        {'url': 'https://a.example/', 'perf': {'ttfb_ms': 120, 'lcp_ms': 900}},
+        {'url': 'https://a.example/', 'perf': {'ttfb_ms': 80, 'lcp_ms': None}},
+        {'url': 'https://b.example/', 'perf': None},
+    ]
+    test_results = [
+        {'url': 'https://a.example/', 'perf': {'long_task_max_ms': 250}, 'perf_failure': True},
+        {'url': 'https://a.example/', 'perf': {'long_task_max_ms': 40}},
+        {'url': None, 'perf': {'long_task_max_ms': 999}},
+    ]
+    summary = summarize_by_url(page_loads, test_results)
+    assert list(summary) == ['https://a.example/']
+    metrics = summary['https://a.example/']['metrics']
+    assert metrics['page.ttfb_ms']['count'] == 2
+    assert metrics['page.lcp_ms']['count'] == 1
+    assert metrics['action.long_task_max_ms']['max'] == 250
+    assert 'page.cls' not in metrics
+    assert summary['https://a.example/']['performance_failures'] == 1
+
+
+def test_slow_actions_cross_the_long_task_threshold():
+    probe = PerformanceProbe(None, long_task_threshold_ms=200)
+    assert probe.is_slow({'long_task_max_ms': 200})
+    assert not probe.is_slow({'long_task_max_ms': None})
+    assert not probe.is_slow(None)
+
+
+def test_collect_and_install_survive_drivers_without_support():
+    probe = PerformanceProbe(object())
+    assert probe.collect() is None
+    assert not probe.install()
\ No newline at end of file
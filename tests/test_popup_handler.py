@@ -0,0 +1,69 @@
+import json
+
+from popup_handler import PopupHandler
+
+
+class ScriptedDriver:
+    """Returns one canned overlay-script result per call and keeps the recipes it was given"""
+
+    def __init__(self, *results, current_url='https://www.example.com/'):
+        self.results = list(results)
+        self.current_url = current_url
+        self.recipes = []
+
+    def execute_script(self, script, recipe, config):
+        self.recipes.append(list(recipe))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_new_dismissal_steps_become_the_host_recipe(tmp_path):
+    cache = tmp_path / 'popups.json'
+    step = {'action': 'click', 'selector': '#onetrust-accept-btn-handler'}
+    driver = ScriptedDriver({'applied': 0, 'steps': [step], 'overlays': 1},
+                            {'applied': 1, 'steps': [], 'overlays': 0})
+    handler = PopupHandler(driver, cache_file=str(cache))
+
+    assert handler.clear_overlays('https://www.example.com/a') == 1
+    assert handler.clear_overlays('https://example.com/b') == 1
+    assert driver.recipes == [[], [step]]
+    assert handler.stats['recipe_hits'] == 1
+    assert handler.stats['overlays_cleared'] == 2
+    assert json.loads(cache.read_text(encoding='utf-8')) == {'example.com': [step]}
+    assert PopupHandler(None, cache_file=str(cache)).recipes == {'example.com': [step]}
+
+
+def test_known_steps_are_not_appended_twice():
+    step = {'action': 'remove', 'selector': '#cmpbox'}
+    driver = ScriptedDriver({'steps': [step], 'overlays': 1}, {'steps': [step], 'overlays': 1})
+    handler = PopupHandler(driver)
+    handler.clear_overlays('https://example.com/')
+    handler.clear_overlays('https://example.com/')
+    assert handler.recipes == {'example.com': [step]}
+
+
+def test_script_failure_clears_nothing():
+    handler = PopupHandler(ScriptedDriver(RuntimeError('no such window')))
+    assert handler.clear_overlays('https://example.com/') == 0
+    assert handler.stats['calls'] == 1
+
+
+def test_forget_drops_the_host_recipe(tmp_path):
+    handler = PopupHandler(None, cache_file=str(tmp_path / 'popups.json'))
+    handler.recipes = {'example.com': [{'action': 'remove', 'selector': '#cmpbox'}]}
+    handler.forget('https://www.example.com/page')
+    assert handler.recipes == {}
+
+
+def test_host_key_falls_back_to_the_current_url():
+    handler = PopupHandler(ScriptedDriver(current_url='https://www.shop.example/cart'))
+    assert handler._get_host(None) == 'shop.example'
+    assert handler._get_host('not a url') == 'unknown'
+
+def test_application_dialogs_are_not_treated_as_consent_overlays():
+    selectors = PopupHandler(None).config['consent_selectors']
+    assert "[role='dialog']" not in selectors
+    assert "[aria-modal='true']" not in selectors
+    assert "#onetrust-banner-sdk" in selectors
\ No newline at end of file
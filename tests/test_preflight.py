@@ -0,0 +1,60 @@
+import socket
+
+import fixture_server
+from circuit_breaker import HostCircuitBreaker
+from fixture_server import FixtureServer
+from preflight import PreflightChecker
+
+
+def test_fixture_pages_pass_and_the_broken_endpoints_are_told_apart(monkeypatch):
+    monkeypatch.setattr(fixture_server, 'SLOW_RESPONSE_SECONDS', 2)
+    with FixtureServer() as server:
+        results = PreflightChecker(timeout=0.5).check_all(server.urls())
+
+    by_path = {r['url'][len(server.base_url):]: r for r in results}
+    assert all(by_path[path]['reachable'] and by_path[path]['status'] == 200 for path in fixture_server.PAGES)
+    # A 500 still proves the host answers; only the stalled page is dropped
+    assert by_path['/error']['reachable'] and by_path['/error']['status'] == 500
+    assert not by_path['/slow']['reachable'] and 'timed out' in by_path['/slow']['error']
+
+
+def test_breaker_opens_for_a_host_that_keeps_stalling(monkeypatch):
+    monkeypatch.setattr(fixture_server, 'SLOW_RESPONSE_SECONDS', 2)
+    breaker = HostCircuitBreaker(threshold=2)
+    checker = PreflightChecker(timeout=0.3)
+    with FixtureServer() as server:
+        slow = server.base_url + '/slow'
+        opened = [breaker.record_failure(slow, r['error']) for r in checker.check_all([slow, slow])]
+        error = checker.check_url(server.base_url + '/error')
+
+    assert opened == [False, True]
+    assert not breaker.allow(server.base_url + '/')
+    assert error['status'] == 500
+
+
+def test_each_host_is_resolved_once_and_connections_use_the_cache(monkeypatch):
+    lookups = []
+    real_getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(host, *args, **kwargs):
+        if host == 'localhost':
+            lookups.append(host)
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', counting_getaddrinfo)
+    with FixtureServer() as server:
+        base = server.base_url.replace('127.0.0.1', 'localhost')
+        results = PreflightChecker(timeout=2).check_all([base + path for path in fixture_server.PAGES])
+
+    assert all(r['reachable'] for r in results)
+    assert lookups == ['localhost']
+
+
+def test_dns_failure_is_cached_and_reported():
+    checker = PreflightChecker(timeout=1)
+    checker.dns_cache._addresses['unresolvable.invalid'] = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+
+    results = checker.check_all(['http://unresolvable.invalid/a', 'http://unresolvable.invalid/b'])
+
+    assert [r['reachable'] for r in results] == [False, False]
+    assert all(r['error'].startswith('DNS lookup failed') for r in results)
\ No newline at end of file
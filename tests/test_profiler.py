@@ -0,0 +1,43 @@
+import time
+
+from profiler import SamplingProfiler, classify_stack
+
+
+def fake_code(filename, name):
+    return compile('pass', filename, 'exec').replace(co_name=name)
+
+
+def test_stacks_in_webdriver_io_win_over_everything_else():
+    codes = [fake_code('/app/monkey_tester.py', 'perform_action'),
+             fake_code('/venv/selenium/webdriver/remote/webdriver.py', 'execute')]
+    assert classify_stack(codes, 'response = self.command_executor.execute(cmd, params)') == 'webdriver_io'
+
+
+def test_sleeps_and_innermost_framework_category():
+    assert classify_stack([fake_code('/app/monkey_tester.py', 'run')], 'time.sleep(delay)') == 'sleep'
+    codes = [fake_code('/app/monkey_tester.py', 'record_action'), fake_code('/app/logger.py', 'log_action'),
+             fake_code('/app/monkey_tester.py', '_get_element_info')]
+    assert classify_stack(codes, 'tag = element.tag_name') == 'element_info'
+    assert classify_stack(codes[:2], 'self.test_results.append(result)') == 'logging'
+    assert classify_stack(codes[:1], 'x = 1') == 'other_python'
+
+
+def busy(seconds):
+    end = time.time() + seconds
+    while time.time() < end:
+        pass
+
+
+def test_profiler_samples_the_main_thread_and_writes_reports(tmp_path):
+    profiler = SamplingProfiler(interval=0.002).start()
+    busy(0.2)
+    profiler.stop()
+    assert profiler.samples > 0
+
+    summary = profiler.write_report(str(tmp_path))
+    assert summary['samples'] == profiler.samples
+    assert any('busy (test_profiler.py' in entry['function'] for entry in summary['top_inclusive'])
+    assert (tmp_path / 'profile_summary.json').exists()
+    assert 'Time by category:' in (tmp_path / 'profile_summary.txt').read_text(encoding='utf-8')
+    collapsed = (tmp_path / 'stacks.collapsed').read_text(encoding='utf-8').splitlines()
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in collapsed) == profiler.samples
\ No newline at end of file
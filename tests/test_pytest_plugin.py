@@ -0,0 +1,44 @@
+import json
+
+from pytest_qa_monkey import load_baseline, merge_item_results
+
+
+def write_item(directory, name, stats, results, signatures=(), new_signatures=()):
+    item = {'stats': stats, 'test_results': results, 'page_loads': [], 'events': [],
+            'signatures': list(signatures), 'new_signatures': list(new_signatures)}
+    (directory / name).write_text(json.dumps(item), encoding='utf-8')
+
+
+def test_merge_item_results_sums_stats_and_orders_results(tmp_path):
+    write_item(tmp_path, 'b.json', {'total_actions': 2, 'successful_actions': 1, 'failed_actions': 1},
+               [{'timestamp': '2026-01-01T10:00:02'}, {'timestamp': '2026-01-01T10:00:04'}],
+               signatures=['stale-element'], new_signatures=['stale-element'])
+    write_item(tmp_path, 'a.json', {'total_actions': 2, 'successful_actions': 2, 'browser_restarts': 1},
+               [{'timestamp': '2026-01-01T10:00:03'}, {'timestamp': '2026-01-01T10:00:01'}],
+               signatures=['timeout'])
+    (tmp_path / 'broken.json').write_text('{not json', encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('ignored', encoding='utf-8')
+
+    merged = merge_item_results(str(tmp_path))
+    assert merged['items'] == 2
+    assert merged['stats']['total_actions'] == 4
+    assert merged['stats']['failed_actions'] == 1
+    assert merged['stats']['browser_restarts'] == 1
+    assert merged['stats']['success_rate'] == 75.0
+    assert [r['timestamp'][-2:] for r in merged['test_results']] == ['01', '02', '03', '04']
+    assert merged['signatures'] == {'stale-element', 'timeout'}
+    assert merged['new_signatures'] == {'stale-element'}
+
+
+def test_merge_of_an_empty_run_has_zero_success_rate(tmp_path):
+    assert merge_item_results(str(tmp_path))['stats']['success_rate'] == 0
+
+
+def test_load_baseline_accepts_list_or_dict(tmp_path):
+    as_list, as_dict = tmp_path / 'list.json', tmp_path / 'dict.json'
+    as_list.write_text(json.dumps(['timeout']), encoding='utf-8')
+    as_dict.write_text(json.dumps({'signatures': ['stale-element']}), encoding='utf-8')
+    assert load_baseline(str(as_list)) == {'timeout'}
+    assert load_baseline(str(as_dict)) == {'stale-element'}
+    assert load_baseline(str(tmp_path / 'missing.json')) == set()
+    assert load_baseline(None) == set()
\ No newline at end of file
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+import pytest
+
+from resource_policy import ResourcePolicy
+
+
+class CdpDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+
+def test_blocked_patterns_cover_extensions_with_and_without_query():
+    policy = ResourcePolicy('fonts', block_types=['font'], block_hosts=['ads.example'])
+    patterns = policy.blocked_patterns()
+    assert '*.woff2' in patterns
+    assert '*.woff2?*' in patterns
+    assert patterns[-1] == '*ads.example*'
+
+
+def test_unknown_types_and_presets_are_rejected():
+    with pytest.raises(ValueError):
+        ResourcePolicy(block_types=['video'])
+    with pytest.raises(ValueError):
+        ResourcePolicy.from_preset('everything')
+
+
+def test_eager_loading_only_when_something_is_blocked():
+    options = SimpleNamespace(page_load_strategy='normal')
+    ResourcePolicy.from_preset('off').configure_options(options)
+    assert options.page_load_strategy == 'normal'
+    ResourcePolicy.from_preset('interaction_only').configure_options(options)
+    assert options.page_load_strategy == 'eager'
+    assert ResourcePolicy.from_preset('no_media').describe()['page_load_strategy'] == 'normal'
+
+
+def test_apply_installs_the_block_list_and_clear_removes_it():
+    driver = CdpDriver()
+    policy = ResourcePolicy.from_preset('no_media', extra_hosts=['cdn.example'])
+    assert policy.apply(driver)
+    assert driver.commands[0] == ('Network.enable', {})
+    assert driver.commands[1] == ('Network.setBlockedURLs', {'urls': policy.blocked_patterns()})
+    policy.clear(driver)
+    assert driver.commands[-1] == ('Network.setBlockedURLs', {'urls': []})
+
+
+def test_inactive_policy_or_driver_without_cdp_applies_nothing():
+    assert not ResourcePolicy.from_preset('off').apply(CdpDriver())
+    assert not ResourcePolicy.from_preset('no_media').apply(object())
\ No newline at end of file
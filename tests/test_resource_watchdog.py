@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from resource_watchdog import ResourceWatchdog, process_tree
+
+
+def feed(watchdog, latency_seconds, count):
+    for _ in range(count):
+        watchdog.record_action(latency_seconds)
+
+
+def test_action_count_threshold():
+    watchdog = ResourceWatchdog(lambda: None, max_actions=10, max_latency_drift=0)
+    feed(watchdog, 0.1, 9)
+    assert watchdog.recycle_reason() is None
+    feed(watchdog, 0.1, 1)
+    assert watchdog.recycle_reason() == "10 actions since browser start"
+
+
+def test_rss_threshold():
+    watchdog = ResourceWatchdog(lambda: None, max_rss_mb=1024)
+    watchdog.latest_rss_mb = 1500
+    assert watchdog.recycle_reason().startswith("rss 1500MB")
+
+
+def test_latency_drift_against_the_first_window():
+    watchdog = ResourceWatchdog(lambda: None, max_actions=0, max_latency_drift=2.5)
+    feed(watchdog, 0.1, 30)
+    assert watchdog.baseline_p95 == 100
+    feed(watchdog, 0.2, 30)
+    assert watchdog.recycle_reason() is None
+    feed(watchdog, 0.3, 30)
+    assert watchdog.recycle_reason() == "p95 action latency 300ms vs 100ms baseline"
+
+
+def test_recycling_starts_a_new_generation():
+    watchdog = ResourceWatchdog(lambda: None, max_actions=5)
+    feed(watchdog, 0.1, 5)
+    watchdog.latest_rss_mb = 900
+    watchdog.mark_recycled()
+    assert watchdog.recycle_reason() is None
+    assert watchdog.actions_since_start == 0
+    assert watchdog.baseline_p95 is None
+
+
+def test_browser_age_restarts_with_each_generation():
+    watchdog = ResourceWatchdog(lambda: None)
+    watchdog.started_at -= 100
+    watchdog.browser_started_at -= 100
+    watchdog.mark_recycled()
+    assert watchdog.browser_started_at - watchdog.started_at >= 100
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason="needs /proc")
+def test_sample_reads_the_process_tree_of_a_live_pid():
+    assert os.getpid() in process_tree(os.getpid())
+    sample = ResourceWatchdog(os.getpid).sample()
+    assert sample['rss_mb'] > 0
+    assert sample['processes'] >= 1
+    assert sample['browser_age'] >= 0
\ No newline at end of file
@@ -0,0 +1,174 @@
+import random
+
+from monkey_tester import SCROLL_ACTIONS, EnhancedMonkeyTester
+from regression_test_suite import RegressionTestSuite
+
+
+class FirstChoice(random.Random):
+    """Always the first option: scroll bursts of 'Scroll down'"""
+
+    def choice(self, seq):
+        return seq[0]
+
+
+class BurstDriver:
+    def __init__(self, results):
+        self.results = results
+        self.scripts = []
+
+    def execute_async_script(self, script, *args):
+        self.scripts.append(script)
+        if isinstance(self.results, Exception):
+            raise self.results
+        return self.results
+
+
+class ActionLog:
+    def __init__(self):
+        self.test_results = []
+
+    def log_action(self, action_type, element_info, success, error_msg=None, screenshot_path=None, url=None,
+                   **details):
+        self.test_results.append({'action_type': action_type, 'element': element_info, 'success': success,
+                                  'error': error_msg, **details})
+
+
+class NoErrors:
+    def drain(self):
+        return []
+
+
+class CountingProbe:
+    def __init__(self):
+        self.collects = 0
+
+    def collect(self):
+        self.collects += 1
+        return {'long_task_max_ms': 0}
+
+    def is_slow(self, metrics):
+        return False
+
+
+class NoScreenshots:
+    def capture_error_screenshot(self, *args):
+        return None
+
+
+def make_tester(results):
+    tester = EnhancedMonkeyTester(BurstDriver(results), ActionLog(), NoScreenshots(), perf_probe=CountingProbe(),
+                                  js_error_collector=NoErrors())
+    tester.rng = FirstChoice()
+    return tester
+
+
+def test_burst_steps_are_logged_as_separate_actions_from_one_browser_call():
+    js_error = {'kind': 'uncaught', 'message': 'TypeError: boom', 'source': 'app.js'}
+    tester = make_tester([{'ok': True, 'errors': []},
+                          {'ok': False, 'error': 'SecurityError', 'errors': []},
+                          {'ok': True, 'errors': [js_error]}])
+    assert tester.perform_safe_burst('https://a.example/', 3) == [True, False, False]
+    assert len(tester.driver.scripts) == 1
+    assert tester.driver.scripts[0].endswith('next(0);')
+
+    results = tester.logger.test_results
+    assert [r['burst_step'] for r in results] == ['1/3', '2/3', '3/3']
+    assert results[1]['element'] == f"{SCROLL_ACTIONS[0][1]} - Error: SecurityError"
+    assert results[2]['js_errors'] == [js_error]
+    assert results[2]['error'].startswith('JS uncaught: TypeError: boom')
+    assert tester.perf_probe.collects == 1  # Only the last step is measured
+
+
+def test_failed_burst_call_fails_every_step():
+    tester = make_tester(RuntimeError('javascript error'))
+    assert tester.perform_safe_burst('https://a.example/', 4) == [False] * 4
+
+class Target:
+    def __init__(self, name, stale=False):
+        self.name, self.stale = name, stale
+        self.frames = []
+        self.info = {'in_view': True}
+
+    def activate(self):
+        if self.stale:
+            raise LookupError(f"Element {self.name} is gone")
+        return self.name
+
+    def describe(self):
+        return f"<button id='{self.name}'>"
+
+    def address(self):
+        return {}
+
+
+class InOrder:
+    """Sampler stand-in: hands out the candidates one after another"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def choose(self, targets, rng):
+        self.calls += 1
+        return targets[(self.calls - 1) % len(targets)]
+
+
+class Page:
+    def __init__(self, targets):
+        self.targets = targets
+
+    def get_clickable_elements(self):
+        if isinstance(self.targets, Exception):
+            raise self.targets
+        return self.targets
+
+
+class RecordingChains:
+    moved = []
+
+    def __init__(self, driver, duration=250):
+        pass
+
+    def move_to_element(self, element):
+        RecordingChains.moved.append(element)
+        return self
+
+    def perform(self):
+        pass
+
+
+def hover_tester(monkeypatch, targets):
+    monkeypatch.setattr('monkey_tester.ActionChains', RecordingChains)
+    RecordingChains.moved = []
+    tester = make_tester([])
+    tester.sampler = InOrder()
+    tester.current_page = Page(targets)
+    return tester
+
+
+def test_stale_hover_target_fails_its_own_step_and_the_chain_runs(monkeypatch):
+    tester = hover_tester(monkeypatch, [Target('a'), Target('b', stale=True), Target('c')])
+    steps = tester._burst_hover(3)
+
+    assert [step[0] for step in steps] == [True, False, True]
+    assert steps[1][1] == "Hover - Error: Element b is gone"
+    assert RecordingChains.moved == ['a', 'c']
+
+
+def test_hover_burst_without_candidates_fails_every_requested_step(monkeypatch):
+    tester = hover_tester(monkeypatch, [])
+    assert [step[:2] for step in tester._burst_hover(4)] == [(False, "No hoverable elements found")] * 4
+
+    tester.current_page = Page(RuntimeError('no such window'))
+    assert [step[0] for step in tester._burst_hover(2)] == [False, False]
+
+
+def test_burst_that_raises_is_logged_like_a_failed_safe_action(monkeypatch):
+    suite = RegressionTestSuite(seed=1)
+    suite.smart_config['burst_size'] = 3
+    monkeypatch.setattr(suite, '_should_perform_safe_action', lambda: True)
+    tester = make_tester([])
+    monkeypatch.setattr(tester, 'perform_safe_burst', lambda url, size: 1 / 0)
+
+    assert suite._perform_smart_action('https://a.example/', tester) == [False]
+    assert tester.logger.test_results[0]['action_type'] == 'burst'
+    assert not tester.logger.test_results[0]['success']
\ No newline at end of file
@@ -0,0 +1,40 @@
+import random
+
+from discovery import DiscoveredElement
+from sampling import ElementSampler
+
+
+def target(index, **info):
+    return DiscoveredElement(None, path=[index], info=info)
+
+
+def test_visible_sizeable_elements_outweigh_offscreen_and_covered_ones():
+    sampler = ElementSampler()
+    visible = target(0, interactive=1, in_view=True, area=48 * 48)
+    offscreen = target(1, interactive=1, in_view=False, area=48 * 48)
+    covered = target(2, interactive=1, in_view=True, hit=False, area=48 * 48)
+    assert sampler.weight(visible) > sampler.weight(offscreen) > sampler.weight(covered)
+
+
+def test_tried_elements_lose_weight_until_reset():
+    sampler = ElementSampler()
+    element = target(0, interactive=1, in_view=True, area=2500)
+    before = sampler.weight(element)
+    sampler.choose([element], random.Random(1))
+    assert sampler.weight(element) == before / 2
+    sampler.reset()
+    assert sampler.weight(element) == before
+
+
+def test_choose_is_deterministic_per_seed_and_favours_visible_elements():
+    targets = [target(0, interactive=1, in_view=True, area=2500)] + \
+              [target(i, interactive=1, in_view=False, area=2500) for i in range(1, 4)]
+    picks = [ElementSampler().choose(targets, random.Random(seed)).path[0] for seed in range(200)]
+    assert picks == [ElementSampler().choose(targets, random.Random(seed)).path[0] for seed in range(200)]
+    assert picks.count(0) > 100
+
+
+def test_choose_survives_all_zero_weights():
+    sampler = ElementSampler()
+    assert sampler.choose([target(0, interactive=0), target(1, interactive=0)], random.Random(1)).path[0] in (0, 1)
+    assert sampler.stats['draws'] == 1
\ No newline at end of file
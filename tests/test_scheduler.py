@@ -0,0 +1,57 @@
+import pytest
+
+from scheduler import TimeBudgetScheduler, parse_duration
+
+
+def test_parse_duration():
+    assert parse_duration('90') == 90
+    assert parse_duration('90s') == 90
+    assert parse_duration('1h30m') == 5400
+    with pytest.raises(ValueError):
+        parse_duration('5 minutes')
+
+
+def test_every_site_is_explored_before_value_weighting():
+    scheduler = TimeBudgetScheduler(['https://a.example/', 'https://b.example/'], 100, min_slice_seconds=5)
+    scheduler.start()
+    url, seconds = scheduler.next_slice()
+    assert url == 'https://a.example/'
+    assert seconds == 15  # 30% of the budget split over two sites
+    scheduler.record_visit(url, seconds)
+    assert scheduler.next_slice()[0] == 'https://b.example/'
+
+
+def test_productive_sites_get_more_time():
+    scheduler = TimeBudgetScheduler(['https://a.example/', 'https://b.example/'], 1000)
+    scheduler.start()
+    scheduler.record_visit('https://a.example/', 20, new_states=10)
+    scheduler.record_visit('https://b.example/', 20)
+    assert scheduler.next_slice()[0] == 'https://a.example/'
+
+
+def test_any_load_failure_cuts_the_site_off():
+    scheduler = TimeBudgetScheduler(['https://dead.example/', 'https://live.example/'], 1000)
+    scheduler.start()
+    scheduler.record_visit('https://dead.example/', 0.1, load_error='network-error')
+    scheduler.record_visit('https://live.example/', 20, new_states=1)
+    assert scheduler.sites['https://dead.example/']['status'] == 'cut_off'
+    assert scheduler.sites['https://dead.example/']['cut_off_reason'] == 'page load failed: network-error'
+    assert scheduler.next_slice()[0] == 'https://live.example/'
+
+
+def test_streamed_urls_are_pulled_as_they_are_needed():
+    scheduler = TimeBudgetScheduler(iter(['https://a.example/', 'https://a.example/', 'https://b.example/']), 100)
+    scheduler.start()
+    url, _ = scheduler.next_slice()
+    scheduler.record_visit(url, 10)
+    assert scheduler.next_slice()[0] == 'https://b.example/'
+    assert len(scheduler.sites) == 2
+
+
+def test_restore_continues_the_clock_and_fills_missing_counters():
+    scheduler = TimeBudgetScheduler(['https://a.example/'], 100)
+    scheduler.restore({'elapsed': 40, 'sites': {'https://a.example/': {'url': 'https://a.example/', 'visits': 2}}})
+    scheduler.start()
+    assert scheduler.remaining() == pytest.approx(60, abs=1)
+    assert scheduler.sites['https://a.example/']['visits'] == 2
+    assert scheduler.sites['https://a.example/']['load_failures'] == 0
\ No newline at end of file
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from span_trace import NULL_TRACER, SpanTracer
+
+
+class CommandDriver:
+    def execute(self, driver_command, params=None):
+        return {'value': driver_command}
+
+
+def read_spans(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [event for event in json.load(f) if event['ph'] == 'X']
+
+
+def test_nested_spans_are_written_as_complete_events(tmp_path):
+    path = tmp_path / 'spans.json'
+    tracer = SpanTracer(str(path))
+    with tracer.span('visit', 'run', url='https://a.example/') as visit:
+        with tracer.span('action', 'action'):
+            tracer.annotate(action_type='click')
+        visit.set(actions=1)
+    tracer.close()
+
+    action, visit = read_spans(path)
+    assert (action['name'], visit['name']) == ('action', 'visit')
+    assert action['args'] == {'action_type': 'click'}
+    assert visit['args'] == {'url': 'https://a.example/', 'actions': 1}
+    assert visit['ts'] <= action['ts'] and action['dur'] <= visit['dur']
+
+
+def test_a_raising_span_records_the_error_and_reraises(tmp_path):
+    path = tmp_path / 'spans.json'
+    tracer = SpanTracer(str(path))
+    with pytest.raises(ValueError):
+        with tracer.span('load'):
+            raise ValueError('bad page')
+    tracer.close()
+    assert read_spans(path)[0]['args']['error'] == 'ValueError: bad page'
+
+
+def test_begin_end_spans_and_instrumented_commands(tmp_path):
+    path = tmp_path / 'spans.json'
+    tracer = SpanTracer(str(path))
+    driver = tracer.instrument(CommandDriver())
+    assert tracer.instrument(driver) is driver
+    span = tracer.span('slice', 'scheduler').begin()
+    assert driver.execute('getTitle') == {'value': 'getTitle'}
+    span.end()
+    span.end()
+    tracer.close()
+    tracer.close()
+    assert [(s['name'], s['cat']) for s in read_spans(path)] == [('getTitle', 'webdriver'), ('slice', 'scheduler')]
+
+
+def test_null_tracer_leaves_drivers_alone():
+    driver = CommandDriver()
+    assert NULL_TRACER.instrument(driver) is driver
+    with NULL_TRACER.span('anything') as span:
+        span.set(ignored=True)
+    assert not NULL_TRACER.enabled
\ No newline at end of file
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from tab_multiplexer import TabMultiplexer
+
+
+class TabDriver:
+    """Window handles and switching of one browser, nothing else"""
+
+    def __init__(self):
+        self.window_handles = ['main']
+        self.current_window_handle = 'main'
+        self.closed = []
+        self.switch_to = SimpleNamespace(new_window=self._new_window, window=self._window)
+
+    def _new_window(self, kind):
+        handle = f"{kind}{len(self.window_handles)}"
+        self.window_handles.append(handle)
+        self.current_window_handle = handle
+
+    def _window(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+        self.closed.append(self.current_window_handle)
+
+
+class CountingProbe:
+    def __init__(self):
+        self.installs = 0
+
+    def install(self):
+        self.installs += 1
+
+
+def make_suite():
+    template = SimpleNamespace(action_weights={'click': 1.0}, success_screenshot_rate=0.0, waiter=None,
+                               navigation_guard=None, data_generator=None, tracer=None)
+    return SimpleNamespace(driver=TabDriver(), monkey_tester=template, logger=None,
+                           screenshot_manager=SimpleNamespace(context_tag=None), popup_handler=None,
+                           perf_probe=CountingProbe(), js_error_collector=None, navigation_guard=None,
+                           resource_policy=None)
+
+
+def test_open_reuses_the_current_window_and_adds_tabs():
+    suite = make_suite()
+    multiplexer = TabMultiplexer(suite, tabs=3).open()
+    assert [slot.handle for slot in multiplexer.slots] == ['main', 'tab1', 'tab2']
+    assert [slot.monkey_tester.context_tag for slot in multiplexer.slots] == ['tab1', 'tab2', 'tab3']
+    assert all(slot.monkey_tester.trace_recorder is None for slot in multiplexer.slots)
+    assert multiplexer.slots[0].monkey_tester.action_weights == {'click': 1.0}
+
+
+def test_activate_switches_once_and_prepares_each_new_tab_once():
+    suite = make_suite()
+    multiplexer = TabMultiplexer(suite, tabs=2).open()
+    first, second = multiplexer.slots
+    multiplexer._activate(first)
+    multiplexer._activate(second)
+    multiplexer._activate(second)
+    assert multiplexer.stats['switches'] == 2
+    assert suite.screenshot_manager.context_tag == 'tab2'
+    assert suite.perf_probe.installs == 1
+
+
+def test_close_leaves_only_the_original_window():
+    suite = make_suite()
+    multiplexer = TabMultiplexer(suite, tabs=3).open()
+    multiplexer._activate(multiplexer.slots[2])
+    multiplexer.close()
+    assert suite.driver.window_handles == ['main']
+    assert suite.driver.current_window_handle == 'main'
+    assert suite.screenshot_manager.context_tag is None
\ No newline at end of file
@@ -0,0 +1,52 @@
+from trace_minimizer import TraceMinimizer, find_failure
+
+
+class FakeMinimizer(TraceMinimizer):
+    """ddmin over a predicate instead of browser replays"""
+
+    def __init__(self, length, culprits, **kwargs):
+        super().__init__(None, 'https://example.com/', [{'index': i} for i in range(length)], 'stale-element',
+                         **kwargs)
+        self.culprits = set(culprits)
+
+    def _replay_candidate(self, indices):
+        with self._lock:
+            self.replay_count += 1
+        return self.culprits.issubset(indices)
+
+
+def test_ddmin_finds_the_failure_inducing_actions():
+    result = FakeMinimizer(16, {3, 11}).minimize()
+    assert result['reproduced']
+    assert result['minimal_indices'] == [3, 11]
+    assert [action['index'] for action in result['minimal_actions']] == [3, 11]
+    assert result['original_length'] == 16
+
+
+def test_ddmin_reduces_to_a_single_action():
+    result = FakeMinimizer(10, {7}, workers=1).minimize()
+    assert result['minimal_indices'] == [7]
+
+
+def test_ddmin_reports_a_trace_that_does_not_reproduce():
+    result = FakeMinimizer(5, {9}).minimize()
+    assert not result['reproduced']
+    assert result['minimal_indices'] is None
+    assert result['minimal_actions'] == []
+
+
+def test_repeated_candidates_come_from_the_cache():
+    minimizer = FakeMinimizer(8, {1, 6})
+    minimizer.minimize()
+    assert minimizer.replay_count == len(minimizer.cache)
+
+
+def test_find_failure_returns_the_last_matching_action():
+    visits = [
+        {'actions': [{'success': False, 'error_signature': 'timeout'}]},
+        {'actions': [{'success': True}, {'success': False, 'error_signature': 'stale-element'},
+                     {'success': False, 'error_signature': 'timeout'}]},
+    ]
+    assert find_failure(visits) == (1, 2, 'timeout')
+    assert find_failure(visits, 'stale-element') == (1, 1, 'stale-element')
+    assert find_failure(visits, 'tab-crashed') == (None, None, 'tab-crashed')
\ No newline at end of file
@@ -0,0 +1,73 @@
+from argparse import Namespace
+
+from fixture_server import FixtureServer
+from main_runner import build_url_source
+from url_sources import SiteCrawler, UrlFilter, iter_urls_file, normalize_url
+
+
+def test_normalize_url_canonical_form():
+    assert normalize_url('Example.COM/path?q=1#frag') == 'https://example.com/path?q=1'
+    assert normalize_url('http://example.com:80') == 'http://example.com/'
+    assert normalize_url('https://example.com:8443/a') == 'https://example.com:8443/a'
+
+
+def test_normalize_url_keeps_ipv6_hosts_bracketed():
+    assert normalize_url('http://[::1]:8080/x') == 'http://[::1]:8080/x'
+    assert normalize_url('https://[2001:DB8::1]:443') == 'https://[2001:db8::1]/'
+
+
+def test_normalize_url_rejects_unusable_urls():
+    assert normalize_url('   ') is None
+    assert normalize_url('ftp://example.com/file') is None
+
+
+def test_normalize_url_survives_malformed_ports_and_hosts():
+    """Bad ports and unclosed IPv6 hosts raise ValueError inside urlsplit"""
+    assert normalize_url('http://example.com:abc/') is None
+    assert normalize_url('https://[::1') is None
+
+
+def test_url_filter_globs_and_regexes():
+    url_filter = UrlFilter(include=['https://example.com/*'], exclude=['*/logout*', 're:\\.php$'])
+    assert url_filter('https://example.com/account')
+    assert not url_filter('https://example.com/logout')
+    assert not url_filter('https://example.com/index.php')
+    assert not url_filter('https://other.example/account')
+
+
+def test_iter_urls_file_skips_comments_duplicates_and_bad_lines(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_text("# nightly\nexample.com\nhttps://example.com/\nhttp://example.com:abc/\n\n"
+                    "https://example.org/a#top\n", encoding='utf-8')
+    assert list(iter_urls_file(str(path))) == ['https://example.com/', 'https://example.org/a']
+
+
+def test_crawler_finds_same_origin_pages():
+    with FixtureServer() as server:
+        urls = list(SiteCrawler([server.base_url + '/'], max_depth=1, use_sitemaps=False).start())
+    assert set(urls) == {server.base_url + path for path in ('/', '/form', '/buttons')}
+
+
+def test_stopped_crawler_fetches_nothing_more():
+    with FixtureServer() as server:
+        crawler = SiteCrawler([server.base_url + '/'], use_sitemaps=False)
+        crawler.stop()
+        assert list(crawler.start()) == []
+    assert crawler.stats['fetched'] == 0
+
+
+def test_build_url_source_hands_back_the_crawler_for_the_run_to_stop(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_text("https://example.com/\n", encoding='utf-8')
+    args = Namespace(include=None, exclude=None, urls_file=str(path), crawl=None)
+    urls, crawler = build_url_source(args)
+    assert list(urls) == ['https://example.com/']
+    assert crawler is None
+
+    with FixtureServer() as server:
+        args = Namespace(include=None, exclude=None, urls_file=None, crawl=[server.base_url + '/'],
+                         crawl_depth=1, crawl_max_pages=50)
+        urls, crawler = build_url_source(args)
+        assert isinstance(crawler, SiteCrawler)
+        crawler.stop()
+        list(urls)
\ No newline at end of file
@@ -0,0 +1,282 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+
+from action_trace import load_trace, replay_settings
+from error_signatures import error_signature, extract_error_text
+from event_waits import EventWaiter
+from js_error_oracle import JSErrorCollector
+from monkey_tester import EnhancedMonkeyTester
+from navigation_guard import NavigationGuard
+from popup_handler import PopupHandler
+from resource_policy import ResourcePolicy
+
+logger = logging.getLogger(__name__)
+
+# Signatures that mean the browser session itself is gone and must be replaced
+SESSION_FATAL_SIGNATURES = {'session-lost', 'tab-crashed'}
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class _ReplayOutcomeSink:
+    """Minimal stand-in for EnhancedLogger that only keeps failure signatures"""
+
+    def __init__(self):
+        self.test_results = []
+        self.signatures = []
+
+    def log_action(self, action_type, element_info, result, error_msg=None, screenshot_path=None, url=None,
+                   **details):
+        result_data = {'action_type': action_type, 'element_info': element_info, 'result': result,
+                       'error_msg': error_msg, 'url': url}
+        if not result:
+            result_data['error_signature'] = error_signature(extract_error_text(result_data))
+            self.signatures.append(result_data['error_signature'])
+        self.test_results.append(result_data)
+
+    def log_page_action(self, page_name, action_method, result, error_msg=None):
+        pass
+
+
+def find_failure(visits, signature=None):
+    """Locate the visit and action index of the last failure (matching signature if given)"""
+    for visit_index in range(len(visits) - 1, -1, -1):
+        actions = visits[visit_index]['actions']
+        for action_index in range(len(actions) - 1, -1, -1):
+            action = actions[action_index]
+            if action.get('success') is False and action.get('error_signature'):
+                if signature is None or action['error_signature'] == signature:
+                    return visit_index, action_index, action['error_signature']
+    return None, None, signature
+
+
+class TraceMinimizer:
+    """ddmin reduction of a recorded action trace to the shortest reproducing sequence"""
+
+    def __init__(self, driver_factory, url, actions, target_signature, workers=2, max_replays=500,
+                 check_js_errors=True, guard_mode='block', restore_navigations=True, resource_policy='off',
+                 dismiss_popups=True, settle_seconds=0):
+        self.driver_factory = driver_factory
+        self.url = url
+        self.actions = actions
+        self.target_signature = target_signature
+        self.workers = max(1, workers)
+        self.max_replays = max_replays
+        self.check_js_errors = check_js_errors
+        self.guard_mode = guard_mode
+        self.restore_navigations = restore_navigations
+        self.resource_policy = resource_policy
+        self.dismiss_popups = dismiss_popups
+        self.settle_seconds = settle_seconds
+
+        self.cache = {}
+        self.replay_count = 0
+        self.cache_hits = 0
+        self.replay_seconds = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._drivers = []
+
+    # -- browser sessions -------------------------------------------------
+
+    def _get_driver(self):
+        """One browser per worker thread, reused across candidate replays"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            # Same blocking rules (and page load strategy) as the recorded run
+            driver = self.driver_factory(ResourcePolicy.from_preset(self.resource_policy))
+            NavigationGuard(driver, self.guard_mode).install()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _discard_driver(self):
+        driver = getattr(self._local, 'driver', None)
+        self._local.driver = None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            with self._lock:
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+
+    def close(self):
+        """Quit every worker browser"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    # -- candidate testing ------------------------------------------------
+
+    def _replay_candidate(self, indices):
+        """Replay a subsequence from a fresh page state; True if the failure reproduces"""
+        driver = self._get_driver()
+        sink = _ReplayOutcomeSink()
+        collector = JSErrorCollector(driver, include_browser_log=False) if self.check_js_errors else None
+        monkey = EnhancedMonkeyTester(driver, sink, None, js_error_collector=collector)
+        guard = NavigationGuard(driver, self.guard_mode, self.restore_navigations)
+        if guard.enabled:
+            # Replays must stay on the page the same way the recorded run did
+            monkey.navigation_guard = guard
+
+        start = time.time()
+        try:
+            # Fresh state: no cookies or storage carried over from the previous candidate
+            driver.delete_all_cookies()
+            driver.get(self.url)
+            driver.execute_script(RESET_STORAGE_SCRIPT)
+            driver.get(self.url)
+            # Settle and clear overlays like the recorded visit, or banners intercept the replayed clicks
+            if self.settle_seconds:
+                EventWaiter(driver).settle(self.settle_seconds)
+            if self.dismiss_popups:
+                PopupHandler(driver).clear_overlays(self.url)
+            if collector:
+                collector.drain()
+            monkey.initialize_page_object(self.url)
+
+            for index in indices:
+                action = self.actions[index]
+                monkey.replay_action(action['action_type'], action['params'], self.url)
+                if self.target_signature in sink.signatures:
+                    return True
+                if SESSION_FATAL_SIGNATURES & set(sink.signatures):
+                    self._discard_driver()
+                    return False
+            return False
+        except Exception as e:
+            reproduced = error_signature(str(e)) == self.target_signature
+            if error_signature(str(e)) in SESSION_FATAL_SIGNATURES:
+                self._discard_driver()
+            return reproduced
+        finally:
+            with self._lock:
+                self.replay_count += 1
+                self.replay_seconds += time.time() - start
+
+    def _test(self, indices):
+        key = tuple(indices)
+        with self._lock:
+            if key in self.cache:
+                self.cache_hits += 1
+                return self.cache[key]
+        outcome = self._replay_candidate(indices)
+        with self._lock:
+            self.cache[key] = outcome
+        return outcome
+
+    def _first_reproducing(self, executor, candidates):
+        """Test candidates in parallel; return the first (in order) that reproduces"""
+        results = list(executor.map(self._test, candidates))
+        for candidate, reproduced in zip(candidates, results):
+            if reproduced:
+                return candidate
+        return None
+
+    # -- ddmin --------------------------------------------------------------
+
+    def minimize(self):
+        """Run ddmin and return the minimal action list with replay statistics"""
+        start = time.time()
+        current = list(range(len(self.actions)))
+        n = 2
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # On a worker thread, so its browser is reused instead of starting workers + 1
+            if not executor.submit(self._test, current).result():
+                self.close()
+                return self._result(None, start, reproduced=False)
+
+            while len(current) >= 2 and self.replay_count < self.max_replays:
+                chunk_size = len(current) / n
+                chunks = [current[int(i * chunk_size):int((i + 1) * chunk_size)] for i in range(n)]
+                chunks = [c for c in chunks if c]
+
+                subset = self._first_reproducing(executor, chunks)
+                if subset is not None:
+                    current, n = subset, 2
+                    logger.info(f"ddmin: reduced to subset of {len(current)} actions")
+                    continue
+
+                complements = [[i for i in current if i not in set(chunk)] for chunk in chunks]
+                complement = self._first_reproducing(executor, complements) if n > 2 else None
+                if complement is not None:
+                    current, n = complement, max(n - 1, 2)
+                    logger.info(f"ddmin: reduced to complement of {len(current)} actions")
+                    continue
+
+                if n >= len(current):
+                    break
+                n = min(n * 2, len(current))
+
+        self.close()
+        return self._result(current, start, reproduced=True)
+
+    def _result(self, indices, start, reproduced):
+        return {
+            'reproduced': reproduced,
+            'target_signature': self.target_signature,
+            'url': self.url,
+            'original_length': len(self.actions),
+            'minimal_length': len(indices) if indices is not None else None,
+            'minimal_indices': indices,
+            'minimal_actions': [self.actions[i] for i in indices] if indices is not None else [],
+            'replay_count': self.replay_count,
+            'cache_hits': self.cache_hits,
+            'replay_seconds': round(self.replay_seconds, 2),
+            'wall_seconds': round(time.time() - start, 2),
+            'workers': self.workers
+        }
+
+
+def minimize_trace(trace_file, driver_factory, signature=None, workers=2, max_replays=500, output_file=None):
+    """Minimize the visit in trace_file that ends in `signature` and write the reduced trace"""
+    session, visits = load_trace(trace_file)
+    visit_index, action_index, signature = find_failure(visits, signature)
+    if visit_index is None:
+        raise ValueError(f"No failing action{' with signature ' + signature if signature else ''} in {trace_file}")
+
+    visit = visits[visit_index]
+    # Only actions up to and including the failure can matter
+    actions = visit['actions'][:action_index + 1]
+    print(f"🔬 Minimizing {len(actions)} actions on {visit['url']} ending in '{signature}' "
+          f"with {workers} parallel browser(s)")
+
+    # Navigation guard, resource policy and overlay handling of the recorded run (old traces: the defaults)
+    settings = replay_settings(session)
+    minimizer = TraceMinimizer(driver_factory, visit['url'], actions, signature, workers, max_replays,
+                               guard_mode=settings.get('navigation_guard', 'block'),
+                               restore_navigations=settings.get('restore_navigations', True),
+                               resource_policy=settings.get('resource_policy', 'off'),
+                               dismiss_popups=settings.get('dismiss_popups', True),
+                               settle_seconds=settings.get('page_load_wait', 0))
+    result = minimizer.minimize()
+
+    if result['reproduced']:
+        output_file = output_file or trace_file.replace('.jsonl', '') + '_minimized.jsonl'
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'type': 'session', 'version': session.get('version', 1),
+                                'session_id': session.get('session_id'), 'seed': session.get('seed'),
+                                'minimized_from': trace_file,
+                                'timestamp': datetime.now().isoformat(), **settings}) + "\n")
+            f.write(json.dumps({'type': 'visit', 'url': visit['url'], 'seed': visit.get('seed')}) + "\n")
+            for action in result['minimal_actions']:
+                f.write(json.dumps(action, ensure_ascii=False) + "\n")
+        result['output_file'] = os.path.abspath(output_file)
+
+    return result
\ No newline at end of file
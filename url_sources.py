@@ -0,0 +1,287 @@
+import fnmatch
+import queue
+import re
+import threading
+from collections import deque
+import urllib.request
+import urllib.robotparser
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urlunsplit
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'qa-monkey-crawler/1.0'
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Links that never lead to a testable HTML page
+SKIPPED_EXTENSIONS = ('.pdf', '.zip', '.gz', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico',
+                      '.css', '.js', '.mp4', '.mp3', '.woff', '.woff2', '.xml', '.json')
+
+
+def normalize_url(url):
+    """Canonical form for de-duplication: scheme, lower-case host, no default port or fragment"""
+    url = url.strip()
+    if not url:
+        return None
+    if '://' not in url:
+        url = 'https://' + url
+    try:
+        # Malformed hosts and ports ('[::1', ':abc') raise ValueError
+        parts = urlsplit(url)
+        if parts.scheme not in DEFAULT_PORTS or not parts.hostname:
+            return None
+        port = parts.port
+    except ValueError:
+        return None
+
+    host = parts.hostname.lower()
+    # hostname drops the brackets around IPv6 literals; the netloc needs them back
+    netloc = f"[{host}]" if ':' in host else host
+    if port and port != DEFAULT_PORTS[parts.scheme]:
+        netloc += f":{port}"
+    return urlunsplit((parts.scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+class UrlFilter:
+    """Include/exclude patterns; plain patterns are globs, 're:' prefixed ones are regexes"""
+
+    def __init__(self, include=None, exclude=None):
+        self.include = [self._compile(p) for p in include or []]
+        self.exclude = [self._compile(p) for p in exclude or []]
+
+    @staticmethod
+    def _compile(pattern):
+        if pattern.startswith('re:'):
+            return re.compile(pattern[3:])
+        return re.compile(fnmatch.translate(pattern))
+
+    def __call__(self, url):
+        if self.include and not any(p.search(url) for p in self.include):
+            return False
+        return not any(p.search(url) for p in self.exclude)
+
+
+def iter_urls_file(path, url_filter=None):
+    """Stream normalized, de-duplicated URLs from a file (one per line, # comments allowed)"""
+    seen = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.lstrip().startswith('#'):
+                continue
+            url = normalize_url(line)
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            if url_filter and not url_filter(url):
+                continue
+            yield url
+
+
+def chain_unique(*sources):
+    """Lazily concatenate URL sources, dropping URLs an earlier source already produced"""
+    seen = set()
+    for source in sources:
+        for url in source:
+            if url not in seen:
+                seen.add(url)
+                yield url
+
+
+class _LinkParser(HTMLParser):
+    """Collects href targets of <a> tags"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+
+class SiteCrawler:
+    """Background same-origin crawler whose discovered pages can be iterated while it runs"""
+
+    def __init__(self, start_urls, max_depth=2, max_pages=500, workers=8, timeout=5, url_filter=None,
+                 use_sitemaps=True):
+        self.start_urls = [u for u in (normalize_url(u) for u in start_urls) if u]
+        self.origins = {self._origin(u) for u in self.start_urls}
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.workers = workers
+        self.timeout = timeout
+        self.url_filter = url_filter
+        self.use_sitemaps = use_sitemaps
+        self.seen = set()
+        self.stats = {'fetched': 0, 'yielded': 0, 'robots_blocked': 0, 'errors': 0, 'sitemap_urls': 0}
+
+        self._robots = {}
+        self._robots_lock = threading.Lock()
+        self._results = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _fetch(self, url, accept_html_only=True):
+        request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            content_type = response.headers.get('Content-Type', '')
+            if accept_html_only and 'html' not in content_type:
+                return response.geturl(), None
+            charset = response.headers.get_content_charset() or 'utf-8'
+            return response.geturl(), response.read(2 * 1024 * 1024).decode(charset, errors='replace')
+
+    def _robots_for(self, url):
+        """robots.txt parser per origin, fetched once"""
+        origin = self._origin(url)
+        with self._robots_lock:
+            if origin in self._robots:
+                return self._robots[origin]
+        parser = urllib.robotparser.RobotFileParser(origin + '/robots.txt')
+        try:
+            _, text = self._fetch(origin + '/robots.txt', accept_html_only=False)
+            parser.parse((text or '').splitlines())
+        except Exception:
+            # No readable robots.txt means nothing is disallowed
+            parser.parse([])
+        with self._robots_lock:
+            self._robots[origin] = parser
+        return parser
+
+    def allowed(self, url):
+        return self._robots_for(url).can_fetch(USER_AGENT, url)
+
+    def _sitemap_urls(self, origin):
+        """Page URLs from the sitemaps robots.txt lists (or /sitemap.xml), one index level deep"""
+        sitemaps = self._robots_for(origin + '/').site_maps() or [origin + '/sitemap.xml']
+        urls = []
+        for _ in range(2):
+            nested = []
+            for sitemap in sitemaps:
+                try:
+                    _, text = self._fetch(sitemap, accept_html_only=False)
+                    root = ET.fromstring(text or '')
+                except Exception:
+                    continue
+                locs = [el.text.strip() for el in root.iter() if el.tag.endswith('loc') and el.text]
+                if root.tag.endswith('sitemapindex'):
+                    nested.extend(locs)
+                else:
+                    urls.extend(locs)
+            sitemaps = nested
+            if not sitemaps:
+                break
+        return urls
+
+    def _admit(self, url):
+        """Same-origin, unseen and allowed by robots.txt - returns the normalized URL or None"""
+        url = normalize_url(url)
+        if not url or url in self.seen or self._origin(url) not in self.origins:
+            return None
+        if urlsplit(url).path.lower().endswith(SKIPPED_EXTENSIONS):
+            return None
+        self.seen.add(url)
+        if not self.allowed(url):
+            self.stats['robots_blocked'] += 1
+            return None
+        return url
+
+    def _crawl_page(self, url):
+        """Fetch one page; returns (is_html, links)"""
+        _, html = self._fetch(url)
+        if html is None:
+            return False, []
+        parser = _LinkParser()
+        parser.feed(html)
+        links = []
+        for href in parser.links:
+            if href.startswith(('mailto:', 'tel:', 'javascript:')):
+                continue
+            try:
+                links.append(urljoin(url, href.split('#')[0]))
+            except ValueError:
+                continue  # One malformed href must not drop the page's other links
+        return True, links
+
+    def _run(self):
+        # The None sentinel must always arrive, or iterating consumers block forever
+        try:
+            self._crawl()
+        except Exception as e:
+            logger.warning(f"Crawler stopped early: {e}")
+        finally:
+            self._results.put(None)
+        logger.info(f"Crawl finished: {self.stats}")
+
+    def _crawl(self):
+        # Include filters only decide what is tested; filtered pages are still crawled for links
+        frontier = deque()
+        for url in self.start_urls:
+            admitted = self._admit(url)
+            if admitted:
+                frontier.append((admitted, 0))
+        if self.use_sitemaps:
+            for origin in sorted(self.origins):
+                for url in self._sitemap_urls(origin):
+                    admitted = self._admit(url)
+                    if admitted:
+                        self.stats['sitemap_urls'] += 1
+                        frontier.append((admitted, 1))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            in_flight = {}
+            while (frontier or in_flight) and not self._stop.is_set():
+                while frontier and len(in_flight) < self.workers and \
+                        self.stats['fetched'] + len(in_flight) < self.max_pages:
+                    url, depth = frontier.popleft()
+                    in_flight[executor.submit(self._crawl_page, url)] = (url, depth)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = in_flight.pop(future)
+                    self.stats['fetched'] += 1
+                    try:
+                        is_html, links = future.result()
+                    except Exception as e:
+                        self.stats['errors'] += 1
+                        logger.debug(f"Crawl fetch failed for {url}: {e}")
+                        continue
+                    if not is_html:
+                        continue
+                    if not self.url_filter or self.url_filter(url):
+                        self.stats['yielded'] += 1
+                        self._results.put(url)
+                    if depth < self.max_depth:
+                        for link in links:
+                            admitted = self._admit(link)
+                            if admitted:
+                                frontier.append((admitted, depth + 1))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='site-crawler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def __iter__(self):
+        """Pages in discovery order, available as soon as each one is fetched"""
+        if self._thread is None:
+            self.start()
+        while True:
+            url = self._results.get()
+            if url is None:
+                return
+            yield url
\ No newline at end of file